@@ -21,13 +21,18 @@ from app.models.offer import Offer
 from app.models.conversation import Conversation, Message
 from app.models.payment import PaymentMethod, Transaction, EscrowHolding
 from app.models.location import Country, City
+from app.models.notification import Notification, NotificationCounter
+from app.models.outbox import OutboxEvent
+from app.models.review import Review
+from app.models.idempotency import IdempotencyKey
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
 # Override the sqlalchemy.url with our database URL from settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+# (ConfigParser interpolates "%", which URL-encoded values contain)
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL.replace("%", "%%"))
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
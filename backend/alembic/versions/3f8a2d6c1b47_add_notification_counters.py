@@ -0,0 +1,41 @@
+"""Add notification_counters table
+
+Revision ID: 3f8a2d6c1b47
+Revises: 7c1e4b9a2f30
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a2d6c1b47'
+down_revision: Union[str, None] = '7c1e4b9a2f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notification_counters',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('unread_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+
+    # Backfill from the existing notifications
+    op.execute("""
+        INSERT INTO notification_counters (user_id, unread_count, updated_at)
+        SELECT user_id, count(*), now()
+        FROM notifications
+        WHERE is_read = false
+        GROUP BY user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('notification_counters')
@@ -0,0 +1,36 @@
+"""Sync order and offer schema with the models
+
+Revision ID: 7c1e4b9a2f30
+Revises: d49b72df1b74
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b9a2f30'
+down_revision: Union[str, None] = 'd49b72df1b74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Order.amazon_data and Order.destination_coordinates are mapped but were
+    # never created by a migration, so every ORM query on orders failed on a
+    # database built from migrations alone.
+    op.execute("ALTER TABLE orders ADD COLUMN IF NOT EXISTS amazon_data JSONB")
+    op.execute("ALTER TABLE orders ADD COLUMN IF NOT EXISTS destination_coordinates POINT")
+
+    # OfferStatus.REJECTED is used by OfferService.reject_offer
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE offerstatus ADD VALUE IF NOT EXISTS 'rejected'")
+
+
+def downgrade() -> None:
+    # Enum values can't be dropped; 'rejected' stays on downgrade.
+    op.drop_column('orders', 'destination_coordinates')
+    op.drop_column('orders', 'amazon_data')
@@ -0,0 +1,27 @@
+"""Add idempotency_keys.headers
+
+Revision ID: a6e2d9b4c183
+Revises: d3a7c5f8e214
+Create Date: 2026-10-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e2d9b4c183'
+down_revision: Union[str, None] = 'd3a7c5f8e214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('idempotency_keys', sa.Column('headers', postgresql.JSONB(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('idempotency_keys', 'headers')
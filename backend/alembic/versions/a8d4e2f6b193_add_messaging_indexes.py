@@ -0,0 +1,61 @@
+"""Add messaging indexes
+
+Revision ID: a8d4e2f6b193
+Revises: e5a1c7d3f926
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d4e2f6b193'
+down_revision: Union[str, None] = 'e5a1c7d3f926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # History pages: WHERE conversation_id = ? AND (created_at, id) < cursor
+    op.create_index(
+        'ix_messages_conversation_id_created_at', 'messages',
+        ['conversation_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL')
+    )
+    # Unread counts in the inbox
+    op.create_index(
+        'ix_messages_conversation_id_unread', 'messages', ['conversation_id', 'sender_id'],
+        postgresql_where=sa.text('read_at IS NULL AND deleted_at IS NULL')
+    )
+    op.create_index(
+        'ix_conversations_shopper_id_last_message_at', 'conversations',
+        ['shopper_id', sa.text('last_message_at DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL')
+    )
+    op.create_index(
+        'ix_conversations_traveler_id_last_message_at', 'conversations',
+        ['traveler_id', sa.text('last_message_at DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL')
+    )
+
+    # Conversation.messages relies on the database to cascade deletes
+    op.drop_constraint('messages_conversation_id_fkey', 'messages', type_='foreignkey')
+    op.create_foreign_key(
+        'messages_conversation_id_fkey', 'messages', 'conversations',
+        ['conversation_id'], ['id'], ondelete='CASCADE'
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('messages_conversation_id_fkey', 'messages', type_='foreignkey')
+    op.create_foreign_key(
+        'messages_conversation_id_fkey', 'messages', 'conversations',
+        ['conversation_id'], ['id']
+    )
+    op.drop_index('ix_conversations_traveler_id_last_message_at', table_name='conversations')
+    op.drop_index('ix_conversations_shopper_id_last_message_at', table_name='conversations')
+    op.drop_index('ix_messages_conversation_id_unread', table_name='messages')
+    op.drop_index('ix_messages_conversation_id_created_at', table_name='messages')
@@ -0,0 +1,57 @@
+"""Add rating sums to users and an index for public review listings
+
+Revision ID: b6e3f9a2c481
+Revises: f2b8c4e1d057
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e3f9a2c481'
+down_revision: Union[str, None] = 'f2b8c4e1d057'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('shopper_rating_sum', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('traveler_rating_sum', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from public reviews; travelers review shoppers and vice versa
+    op.execute("""
+        UPDATE users u
+        SET shopper_rating_sum = r.shopper_sum,
+            shopper_review_count = r.shopper_count,
+            shopper_rating = round(r.shopper_sum::numeric / nullif(r.shopper_count, 0), 2),
+            traveler_rating_sum = r.traveler_sum,
+            traveler_review_count = r.traveler_count,
+            traveler_rating = round(r.traveler_sum::numeric / nullif(r.traveler_count, 0), 2)
+        FROM (
+            SELECT reviewed_id,
+                   coalesce(sum(rating) FILTER (WHERE reviewer_role = 'traveler'), 0) AS shopper_sum,
+                   count(*) FILTER (WHERE reviewer_role = 'traveler') AS shopper_count,
+                   coalesce(sum(rating) FILTER (WHERE reviewer_role = 'shopper'), 0) AS traveler_sum,
+                   count(*) FILTER (WHERE reviewer_role = 'shopper') AS traveler_count
+            FROM reviews
+            WHERE deleted_at IS NULL AND is_public
+            GROUP BY reviewed_id
+        ) r
+        WHERE r.reviewed_id = u.id
+    """)
+
+    op.create_index(
+        'ix_reviews_reviewed_id_created_at', 'reviews',
+        ['reviewed_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL AND is_public')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reviews_reviewed_id_created_at', table_name='reviews')
+    op.drop_column('users', 'traveler_rating_sum')
+    op.drop_column('users', 'shopper_rating_sum')
@@ -0,0 +1,110 @@
+"""Partition notifications by month
+
+Revision ID: c4d7e2a9b815
+Revises: 9b2e5f1a7c83
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7e2a9b815'
+down_revision: Union[str, None] = '9b2e5f1a7c83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+COLUMNS = "id, user_id, type, title, message, data, is_read, read_at, created_at, updated_at, deleted_at"
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE notifications RENAME TO notifications_unpartitioned")
+    op.execute("ALTER TABLE notifications_unpartitioned RENAME CONSTRAINT notifications_pkey TO notifications_unpartitioned_pkey")
+    op.execute("ALTER TABLE notifications_unpartitioned DROP CONSTRAINT notifications_user_id_fkey")
+    op.drop_index('ix_notifications_user_id_is_read', table_name='notifications_unpartitioned')
+    op.drop_index('ix_notifications_user_id', table_name='notifications_unpartitioned')
+
+    # The partition key has to be part of the primary key
+    op.execute("""
+        CREATE TABLE notifications (
+            id UUID NOT NULL,
+            user_id UUID NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            type notificationtype NOT NULL,
+            title VARCHAR(255) NOT NULL,
+            message TEXT NOT NULL,
+            data JSONB,
+            is_read BOOLEAN NOT NULL DEFAULT false,
+            read_at TIMESTAMP WITH TIME ZONE,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            deleted_at TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("CREATE TABLE notifications_default PARTITION OF notifications DEFAULT")
+
+    now = datetime.now(timezone.utc)
+    oldest = op.get_bind().execute(sa.text("SELECT min(created_at) FROM notifications_unpartitioned")).scalar()
+    oldest = (oldest or now).astimezone(timezone.utc)
+    today = now.date()
+    month = date(oldest.year, oldest.month, 1)
+    last = _add_months(date(today.year, today.month, 1), MONTHS_AHEAD)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE notifications_p{month.year:04d}_{month.month:02d} PARTITION OF notifications "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{_add_months(month, 1).isoformat()} 00:00:00+00')"
+        )
+        month = _add_months(month, 1)
+
+    op.create_index('ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at'])
+    op.create_index(
+        'ix_notifications_user_id_unread', 'notifications', ['user_id', 'created_at'],
+        postgresql_where=sa.text('is_read = false')
+    )
+
+    op.execute(f"""
+        INSERT INTO notifications ({COLUMNS})
+        SELECT id, user_id, type, title, message, data::jsonb, is_read, read_at, created_at, updated_at, deleted_at
+        FROM notifications_unpartitioned
+    """)
+    op.execute("DROP TABLE notifications_unpartitioned")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE notifications RENAME TO notifications_partitioned")
+    op.execute("ALTER TABLE notifications_partitioned RENAME CONSTRAINT notifications_pkey TO notifications_partitioned_pkey")
+    op.execute("ALTER TABLE notifications_partitioned DROP CONSTRAINT notifications_user_id_fkey")
+    op.create_table('notifications',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('type', sa.dialects.postgresql.ENUM(name='notificationtype', create_type=False), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('message', sa.Text(), nullable=False),
+        sa.Column('data', sa.JSON(), nullable=True),
+        sa.Column('is_read', sa.Boolean(), nullable=False, default=False),
+        sa.Column('read_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(f"""
+        INSERT INTO notifications ({COLUMNS})
+        SELECT id, user_id, type, title, message, data::json, is_read, read_at, created_at, updated_at, deleted_at
+        FROM notifications_partitioned
+    """)
+    op.execute("DROP TABLE notifications_partitioned")
+    op.create_index('ix_notifications_user_id', 'notifications', ['user_id'])
+    op.create_index('ix_notifications_user_id_is_read', 'notifications', ['user_id', 'is_read'])
@@ -0,0 +1,44 @@
+"""Add payout idempotency keys and escrow release indexes
+
+Revision ID: c9f1a3e7b520
+Revises: b6e3f9a2c481
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9f1a3e7b520'
+down_revision: Union[str, None] = 'b6e3f9a2c481'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('transactions', sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+    op.create_unique_constraint('transactions_idempotency_key_key', 'transactions', ['idempotency_key'])
+    # Payouts are recorded before the provider assigns an id
+    op.alter_column('transactions', 'provider_transaction_id', existing_type=sa.String(length=255), nullable=True)
+    op.create_index(
+        'ix_transactions_pending_payouts', 'transactions', ['created_at'],
+        postgresql_where=sa.text("transaction_type = 'traveler_payout' AND status = 'pending'")
+    )
+
+    op.create_index(
+        'ix_escrow_holdings_unreleased', 'escrow_holdings', ['order_id'],
+        postgresql_where=sa.text('is_released IS NOT TRUE AND is_disputed IS NOT TRUE AND deleted_at IS NULL')
+    )
+    op.create_index('ix_escrow_holdings_release_transaction_id', 'escrow_holdings', ['release_transaction_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_escrow_holdings_release_transaction_id', table_name='escrow_holdings')
+    op.drop_index('ix_escrow_holdings_unreleased', table_name='escrow_holdings')
+    op.drop_index('ix_transactions_pending_payouts', table_name='transactions')
+    op.alter_column('transactions', 'provider_transaction_id', existing_type=sa.String(length=255), nullable=False)
+    op.drop_constraint('transactions_idempotency_key_key', 'transactions', type_='unique')
+    op.drop_column('transactions', 'idempotency_key')
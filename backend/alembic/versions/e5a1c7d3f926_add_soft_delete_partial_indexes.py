@@ -0,0 +1,49 @@
+"""Add partial indexes on live (not soft-deleted) rows
+
+Revision ID: e5a1c7d3f926
+Revises: c4d7e2a9b815
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c7d3f926'
+down_revision: Union[str, None] = 'c4d7e2a9b815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE = sa.text('deleted_at IS NULL')
+
+# (name, table, columns) - every repository query filters deleted_at IS NULL
+INDEXES = [
+    ('ix_orders_status_created_at', 'orders', ['status', sa.text('created_at DESC')]),
+    ('ix_orders_destination_country_status_created_at', 'orders',
+     ['destination_country', 'status', sa.text('created_at DESC')]),
+    ('ix_orders_shopper_id_created_at', 'orders', ['shopper_id', sa.text('created_at DESC')]),
+    ('ix_orders_matched_traveler_id_created_at', 'orders', ['matched_traveler_id', sa.text('created_at DESC')]),
+    ('ix_offers_traveler_id_status', 'offers', ['traveler_id', 'status']),
+    ('ix_users_phone', 'users', ['phone']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_where=LIVE,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
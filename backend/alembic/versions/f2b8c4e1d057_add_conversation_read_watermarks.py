@@ -0,0 +1,48 @@
+"""Add per-participant read watermarks to conversations
+
+Revision ID: f2b8c4e1d057
+Revises: a8d4e2f6b193
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8c4e1d057'
+down_revision: Union[str, None] = 'a8d4e2f6b193'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (watermark column, the participant whose messages it covers)
+WATERMARKS = [
+    ('shopper_read_up_to', 'traveler_id'),
+    ('traveler_read_up_to', 'shopper_id'),
+]
+
+
+def upgrade() -> None:
+    for column, _ in WATERMARKS:
+        op.add_column('conversations', sa.Column(column, sa.DateTime(timezone=True), nullable=True))
+
+    # Start each watermark at the newest message the participant already read
+    for column, other in WATERMARKS:
+        op.execute(f"""
+            UPDATE conversations c
+            SET {column} = m.read_up_to
+            FROM (
+                SELECT conversation_id, sender_id, max(created_at) AS read_up_to
+                FROM messages
+                WHERE read_at IS NOT NULL
+                GROUP BY conversation_id, sender_id
+            ) m
+            WHERE m.conversation_id = c.id AND m.sender_id = c.{other}
+        """)
+
+
+def downgrade() -> None:
+    for column, _ in reversed(WATERMARKS):
+        op.drop_column('conversations', column)
@@ -1,11 +1,12 @@
 
 from typing import Optional
-from fastapi import Depends, HTTPException, status, Request
+from uuid import UUID
+from fastapi import Depends, HTTPException, status, Request, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.models.user import User
-from app.services.auth_service import AuthService
+from app.models.user import User, UserRole
+from app.services.auth_service import AuthService, STREAM_TICKET_SCOPE
 
 security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
@@ -28,6 +29,41 @@ def get_current_user(
     
     return user
 
+def _user_id_from_token(token: Optional[str], scope: Optional[str] = None) -> UUID:
+    payload = auth_service.verify_token(token, scope) if token else None
+    user_id = payload.get("sub") if payload else None
+    
+    try:
+        return UUID(user_id)
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> UUID:
+    """Authenticate from the JWT alone, without loading the user.
+
+    For cheap, high-frequency read endpoints. A deactivated user keeps access
+    until their token expires, so don't use it for anything that mutates.
+    """
+    return _user_id_from_token(credentials.credentials)
+
+def get_stream_user_id(
+    ticket: Optional[str] = Query(None, description="Stream ticket from POST /notifications/stream-ticket, for clients that can't set headers (EventSource)"),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> UUID:
+    """Like get_current_user_id, also accepting a stream ticket as a query parameter.
+    
+    Access tokens are only read from the header, never from the URL.
+    """
+    if credentials:
+        return _user_id_from_token(credentials.credentials)
+    return _user_id_from_token(ticket, STREAM_TICKET_SCOPE)
+
 def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -39,6 +75,17 @@ def get_current_active_user(
         )
     return current_user
 
+def get_current_admin_user(
+    current_user: User = Depends(get_current_active_user)
+) -> User:
+    
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required"
+        )
+    return current_user
+
 def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
     db: Session = Depends(get_db)
@@ -0,0 +1,66 @@
+"""Sparse fieldsets for list endpoints.
+
+``?fields=id,product_name,status`` asks for just those fields. The names are
+checked against an allow-list: the response schema's fields that are plain
+columns of the model. Repositories select only those columns, and the rows
+are rendered through a cut-down copy of the response schema, so the values
+come out exactly as in the full response.
+"""
+from functools import cached_property, lru_cache
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, create_model
+from sqlalchemy import inspect
+
+MAX_FIELDSET_MODELS = 256
+
+
+@lru_cache(maxsize=MAX_FIELDSET_MODELS)
+def _fieldset_model(schema: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=schema.model_config,
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields}
+    )
+
+
+class SparseFields:
+    """Dependency for the ``fields`` query parameter. Resolves to the
+    requested field names in schema order (``always`` included), or None
+    when the parameter is absent."""
+
+    def __init__(self, schema: Type[BaseModel], model: Any, always: Sequence[str] = ("id",)):
+        self.schema = schema
+        self.model = model
+        self.always = tuple(always)
+
+    @cached_property
+    def allowed(self) -> List[str]:
+        # Inspecting the columns configures the mappers, which needs every
+        # model imported; wait for the first request rather than import time
+        columns = set(inspect(self.model).column_attrs.keys())
+        return [name for name in self.schema.model_fields if name in columns]
+
+    def __call__(
+        self,
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return; defaults to all")
+    ) -> Optional[List[str]]:
+        if fields is None:
+            return None
+
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested.difference(self.allowed)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}. Allowed: {', '.join(self.allowed)}"
+            )
+
+        requested.update(self.always)
+        return [name for name in self.allowed if name in requested]
+
+    def render(self, rows: Iterable[Any], fields: Sequence[str]) -> List[BaseModel]:
+        """Validate projected rows against the requested part of the schema"""
+        model = _fieldset_model(self.schema, tuple(fields))
+        return [model.model_validate(row) for row in rows]
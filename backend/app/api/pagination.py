@@ -0,0 +1,33 @@
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+
+from app.repositories.base import TotalCount
+
+
+def set_total_count(response: Response, total: TotalCount) -> None:
+    """Total-count hint for list endpoints. ``X-Total-Count-Exact: false``
+    means the value is a lower bound (capped count) or a planner estimate."""
+    response.headers["X-Total-Count"] = str(total.value)
+    response.headers["X-Total-Count-Exact"] = "true" if total.exact else "false"
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """Opaque keyset cursor for lists ordered by (created_at, id)"""
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
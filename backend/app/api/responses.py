@@ -0,0 +1,87 @@
+"""JSON rendering for API responses.
+
+``ORJSONResponse`` is the app's default response class. Besides what orjson
+handles natively (UUID, datetime, date, enums), it encodes ``Decimal`` as a
+string and Pydantic models as their fields, matching what FastAPI's own
+``response_model`` serialization produces.
+
+When an endpoint returns data, FastAPI dumps it, validates it against the
+``response_model`` and serializes it once more before rendering. Endpoints
+that already hold validated response models can skip all of that by
+returning ``model_response(...)``. The ``response_model`` on the route still
+documents the schema.
+"""
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Type
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+# Per model class: how to turn an instance into something orjson encodes
+_encoders: Dict[Type[BaseModel], Callable[[BaseModel], Any]] = {}
+
+
+def _fields(model: BaseModel) -> Dict[str, Any]:
+    return model.__dict__
+
+
+def _dump(model: BaseModel) -> Dict[str, Any]:
+    return model.model_dump(mode="json", by_alias=True)
+
+
+def _model_encoder(cls: Type[BaseModel]) -> Callable[[BaseModel], Any]:
+    """Models whose JSON form is exactly their field values are encoded
+    straight from ``__dict__``; anything with aliases, serializers, computed
+    fields or extras goes through Pydantic"""
+    decorators = cls.__pydantic_decorators__
+    plain = (
+        not any(field.serialization_alias or field.alias for field in cls.model_fields.values())
+        and not decorators.field_serializers
+        and not decorators.model_serializers
+        and not decorators.computed_fields
+        and cls.model_config.get("extra") != "allow"
+    )
+    return _fields if plain else _dump
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        encoder = _encoders.get(type(obj))
+        if encoder is None:
+            encoder = _encoders[type(obj)] = _model_encoder(type(obj))
+        return encoder(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def model_response(
+    content: Any,
+    status_code: int = 200,
+    response: Optional[Response] = None
+) -> ORJSONResponse:
+    """Render validated response models (or lists of them) directly,
+    bypassing ``response_model`` re-validation. Pass the endpoint's injected
+    ``response`` to keep the status code and headers set on it."""
+    if response is not None and response.status_code:
+        status_code = response.status_code
+    rendered = ORJSONResponse(content, status_code=status_code)
+    if response is not None:
+        rendered.raw_headers.extend(response.raw_headers)
+    return rendered
@@ -1,13 +1,23 @@
+from fastapi import FastAPI
+from app.api.v1.endpoints import auth, users, orders, offers, locations, amazon, notifications, conversations, reviews, payouts
 
-from fastapi import APIRouter
-from app.api.v1.endpoints import auth, users, orders, offers, locations, amazon, notifications
+# (router, path, tags)
+ROUTERS = [
+    (auth.router, "/auth", ["Authentication"]),
+    (users.router, "/users", ["Users"]),
+    (orders.router, "/orders", ["Orders"]),
+    (offers.router, "/offers", ["Offers"]),
+    (locations.router, "/locations", ["Locations"]),
+    (amazon.router, "/amazon", ["Amazon"]),
+    (notifications.router, "/notifications", ["Notifications"]),
+    (conversations.router, "/conversations", ["Conversations"]),
+    (reviews.router, "/reviews", ["Reviews"]),
+    (payouts.router, "/payouts", ["Payouts"]),
+]
 
-api_router = APIRouter()
 
-api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
-api_router.include_router(users.router, prefix="/users", tags=["Users"])
-api_router.include_router(orders.router, prefix="/orders", tags=["Orders"])
-api_router.include_router(offers.router, prefix="/offers", tags=["Offers"])
-api_router.include_router(locations.router, prefix="/locations", tags=["Locations"])
-api_router.include_router(amazon.router, prefix="/amazon", tags=["Amazon"])
-api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
\ No newline at end of file
+def include_api_routers(app: FastAPI, prefix: str) -> None:
+    # Straight onto the app: including them in an intermediate APIRouter
+    # first would build every route twice
+    for router, path, tags in ROUTERS:
+        app.include_router(router, prefix=f"{prefix}{path}", tags=tags)
@@ -0,0 +1,182 @@
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.api.deps import get_current_user
+from app.api.pagination import decode_cursor, encode_cursor
+from app.models.conversation import Message
+from app.models.user import User
+from app.schemas.conversation import (
+    ConversationResponse,
+    InboxConversation,
+    MessageCreate,
+    MessagePage,
+    MessagePreview,
+    MessageResponse,
+    ReadReceiptCreate,
+    ReadReceiptResponse
+)
+from app.services.message_service import MessageService
+
+router = APIRouter()
+
+PREVIEW_LENGTH = 100
+BLOCKED_PREVIEW = "[Message blocked due to policy violations]"
+
+
+def _message_response(message: Message) -> MessageResponse:
+    response = MessageResponse.model_validate(message)
+    response.content = message.get_display_content()
+    return response
+
+
+@router.get("/", response_model=List[InboxConversation])
+def get_inbox(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, gt=0, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Conversations with last-message preview and unread count, latest first"""
+    message_service = MessageService(db)
+    inbox = []
+    for row in message_service.get_inbox(current_user.id, skip, limit):
+        last_message = None
+        if row.last_message_id:
+            content = BLOCKED_PREVIEW if row.last_message_is_blocked else \
+                (row.last_message_filtered_content or row.last_message_content)
+            last_message = MessagePreview(
+                id=row.last_message_id,
+                sender_id=row.last_message_sender_id,
+                message_type=row.last_message_type,
+                content=content[:PREVIEW_LENGTH],
+                created_at=row.last_message_created_at
+            )
+        inbox.append(InboxConversation(
+            **ConversationResponse.model_validate(row.Conversation).model_dump(),
+            counterpart_id=row.counterpart_id,
+            counterpart_name=row.counterpart_name,
+            unread_count=row.unread_count,
+            last_message=last_message
+        ))
+    return inbox
+
+
+@router.post("/orders/{order_id}", response_model=ConversationResponse)
+def open_order_conversation(
+    order_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get or start the conversation between an order's shopper and traveler"""
+    message_service = MessageService(db)
+    
+    try:
+        conversation = message_service.get_or_create_for_order(order_id, current_user.id)
+        return ConversationResponse.model_validate(conversation)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/{conversation_id}", response_model=ConversationResponse)
+def get_conversation(
+    conversation_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    message_service = MessageService(db)
+    conversation = message_service.get_conversation(conversation_id, current_user.id)
+    
+    if not conversation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
+    
+    return ConversationResponse.model_validate(conversation)
+
+
+@router.get("/{conversation_id}/messages", response_model=MessagePage)
+def get_messages(
+    conversation_id: UUID,
+    before: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, gt=0, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Message history, newest first, paged by (created_at, id) cursor"""
+    message_service = MessageService(db)
+    page = message_service.get_messages(
+        conversation_id,
+        current_user.id,
+        before=decode_cursor(before) if before else None,
+        limit=limit
+    )
+    
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
+    
+    messages, has_more = page
+    next_cursor = encode_cursor(messages[-1].created_at, messages[-1].id) if has_more else None
+    return MessagePage(items=[_message_response(m) for m in messages], next_cursor=next_cursor)
+
+
+@router.post("/{conversation_id}/messages", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
+def send_message(
+    conversation_id: UUID,
+    message_data: MessageCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    message_service = MessageService(db)
+    
+    try:
+        message = message_service.send_message(conversation_id, current_user.id, message_data)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    if not message:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
+    
+    return _message_response(message)
+
+
+@router.post("/{conversation_id}/read", response_model=ReadReceiptResponse)
+def mark_read(
+    conversation_id: UUID,
+    receipt: ReadReceiptCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Mark the conversation read up to a message; repeated receipts are no-ops"""
+    message_service = MessageService(db)
+    
+    try:
+        result = message_service.mark_read(conversation_id, current_user.id, receipt.message_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
+    
+    return ReadReceiptResponse(conversation_id=conversation_id, read_up_to=result.read_up_to, marked=result.marked)
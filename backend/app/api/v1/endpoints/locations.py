@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.api.responses import model_response
 from app.schemas.location import CountryResponse, CityResponse, CityWithCountry
 from app.services.location_service import LocationService
 
@@ -12,7 +13,7 @@ router = APIRouter()
 def get_countries(db: Session = Depends(get_db)):
     location_service = LocationService(db)
     countries = location_service.get_countries()
-    return [CountryResponse.model_validate(country) for country in countries]
+    return model_response([CountryResponse.model_validate(country) for country in countries])
 
 @router.get("/countries/{country_code}", response_model=CountryResponse)
 def get_country(
@@ -38,7 +39,7 @@ def get_cities_by_country(
 ):
     location_service = LocationService(db)
     cities = location_service.get_cities_by_country(country_code.upper(), limit)
-    return [CityResponse.model_validate(city) for city in cities]
+    return model_response([CityResponse.model_validate(city) for city in cities])
 
 @router.get("/cities/search", response_model=List[CityWithCountry])
 def search_cities(
@@ -50,7 +51,7 @@ def search_cities(
     location_service = LocationService(db)
     country_filter = country_code.upper() if country_code else None
     cities = location_service.search_cities(q, country_filter, limit)
-    return [CityWithCountry.model_validate(city) for city in cities]
+    return model_response([CityWithCountry.model_validate(city) for city in cities])
 
 @router.get("/cities/nearby", response_model=List[CityWithCountry])
 def get_nearby_cities(
@@ -62,7 +63,7 @@ def get_nearby_cities(
 ):
     location_service = LocationService(db)
     cities = location_service.get_nearby_cities(latitude, longitude, radius_km, limit)
-    return [CityWithCountry.model_validate(city) for city in cities]
+    return model_response([CityWithCountry.model_validate(city) for city in cities])
 
 @router.get("/cities/{city_id}", response_model=CityWithCountry)
 def get_city(
@@ -1,16 +1,27 @@
-from typing import List
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.core.broker import broker
+from app.core.config import settings
+from app.core.database import get_db, SessionLocal
+from app.api.deps import get_current_user, get_current_admin_user, get_current_user_id, get_stream_user_id
+from app.api.responses import model_response
 from app.models.user import User
+from app.repositories.user_repository import UserRepository
 from app.schemas.notification import (
+    NotificationBroadcast,
+    NotificationBroadcastResponse,
     NotificationResponse, 
     NotificationSummary,
+    StreamTicketResponse,
     UnreadCountResponse
 )
+from app.services.auth_service import AuthService
 from app.services.notification_service import NotificationService
 
 router = APIRouter()
@@ -32,20 +43,127 @@ def get_notifications(
         skip=skip,
         limit=limit
     )
-    return [NotificationSummary.model_validate(n) for n in notifications]
+    return model_response([NotificationSummary.model_validate(n) for n in notifications])
 
 
 @router.get("/unread-count", response_model=UnreadCountResponse)
 def get_unread_count(
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Get count of unread notifications"""
     notification_service = NotificationService(db)
-    count = notification_service.get_unread_count(current_user.id)
+    count = notification_service.get_unread_count(current_user_id)
     return UnreadCountResponse(unread_count=count)
 
 
+def _format_event(event: Dict[str, Any]) -> str:
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+def _load_events(user_id: UUID, after_id: Optional[UUID] = None, notification_id: Optional[UUID] = None) -> List[Dict[str, Any]]:
+    """Load stream events with a short-lived session, so an open stream never
+    holds a pooled connection"""
+    db = SessionLocal()
+    try:
+        notification_service = NotificationService(db)
+        if after_id is not None:
+            notifications = notification_service.get_notifications_after(
+                user_id, after_id, limit=settings.NOTIFICATION_STREAM_REPLAY_LIMIT
+            )
+        else:
+            notification = notification_service.get_notification(notification_id, user_id)
+            notifications = [notification] if notification else []
+        return [NotificationService.stream_event(n) for n in notifications]
+    finally:
+        db.close()
+
+
+async def _event_stream(user_id: UUID, last_event_id: Optional[UUID]) -> AsyncIterator[str]:
+    # Subscribe before replaying so nothing published in between is lost
+    with broker.subscribe(user_id) as subscription:
+        yield "retry: 5000\n\n"
+        
+        replayed = set()
+        if last_event_id is not None:
+            for event in await run_in_threadpool(_load_events, user_id, after_id=last_event_id):
+                replayed.add(event["id"])
+                yield _format_event(event)
+        
+        while not subscription.closed:
+            event = await subscription.get(settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS)
+            if event is None:
+                if not subscription.closed:
+                    yield ": keep-alive\n\n"
+                continue
+            if event["id"] in replayed:
+                continue
+            if event.get("ref"):
+                for loaded in await run_in_threadpool(_load_events, user_id, notification_id=UUID(event["id"])):
+                    yield _format_event(loaded)
+                continue
+            yield _format_event(event)
+
+
+@router.post("/stream-ticket", response_model=StreamTicketResponse)
+def create_stream_ticket(
+    current_user: User = Depends(get_current_user)
+):
+    """Issue a short-lived ticket for GET /stream?ticket=...
+    
+    For EventSource, which can't send the Authorization header. The ticket
+    opens the stream and nothing else.
+    """
+    return StreamTicketResponse(
+        ticket=AuthService.create_stream_ticket(current_user.id),
+        expires_in=settings.NOTIFICATION_STREAM_TICKET_SECONDS
+    )
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_notifications(
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user_id: UUID = Depends(get_stream_user_id)
+):
+    """Server-Sent Events stream of new notifications.
+    
+    Each event's id is the notification id; reconnecting with Last-Event-ID
+    replays what was created since. A comment line is sent as a heartbeat
+    when idle. Clients that can't set the Authorization header pass
+    ?ticket= from POST /stream-ticket, and need a fresh one to reconnect.
+    """
+    try:
+        resume_from = UUID(last_event_id) if last_event_id else None
+    except ValueError:
+        resume_from = None
+    
+    return StreamingResponse(
+        _event_stream(current_user_id, resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/broadcast", response_model=NotificationBroadcastResponse, status_code=status.HTTP_201_CREATED)
+def broadcast_notification(
+    broadcast: NotificationBroadcast,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Send a notification to the given active users, or to all of them (admin only)"""
+    user_ids = UserRepository(db).get_active_user_ids(broadcast.user_ids)
+    
+    notification_service = NotificationService(db)
+    created = notification_service.broadcast(
+        user_ids=user_ids,
+        notification_type=broadcast.type,
+        title=broadcast.title,
+        message=broadcast.message,
+        data=broadcast.data
+    )
+    return NotificationBroadcastResponse(created=len(created))
+
+
 @router.get("/{notification_id}", response_model=NotificationResponse)
 def get_notification(
     notification_id: UUID,
@@ -54,14 +172,7 @@ def get_notification(
 ):
     """Get a specific notification"""
     notification_service = NotificationService(db)
-    notifications = notification_service.get_user_notifications(
-        user_id=current_user.id,
-        skip=0,
-        limit=1000
-    )
-    
-    # Find the specific notification
-    notification = next((n for n in notifications if n.id == notification_id), None)
+    notification = notification_service.get_notification(notification_id, current_user.id)
     
     if not notification:
         raise HTTPException(
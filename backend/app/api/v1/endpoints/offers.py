@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.api.deps import get_current_user, get_optional_current_user
+from app.api.responses import model_response
 from app.models.user import User
 from app.models.offer import OfferStatus
 from app.schemas.offer import (
@@ -47,8 +48,10 @@ def get_order_offers(
     offer_service = OfferService(db)
     offers = offer_service.get_order_offers(order_id, status_filter, skip, limit)
     
-    return [OfferResponse.model_validate(offer) for offer in offers if 
-            offer_service._can_user_view_offer(offer, current_user.id)]
+    return model_response([
+        OfferResponse.model_validate(offer) for offer in offers
+        if offer_service._can_user_view_offer(offer, current_user.id)
+    ])
 
 @router.get("/", response_model=List[OfferResponse])
 def get_my_offers(
@@ -60,7 +63,7 @@ def get_my_offers(
 ):
     offer_service = OfferService(db)
     offers = offer_service.get_traveler_offers(current_user.id, status_filter, skip, limit)
-    return [OfferResponse.model_validate(offer) for offer in offers]
+    return model_response([OfferResponse.model_validate(offer) for offer in offers])
 
 @router.get("/stats", response_model=OfferStats)
 def get_offer_stats(
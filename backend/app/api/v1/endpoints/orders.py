@@ -1,12 +1,16 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.api.deps import get_current_user, get_optional_current_user
+from app.api.fieldsets import SparseFields
+from app.api.pagination import set_total_count
+from app.api.responses import model_response
 from app.models.user import User
-from app.models.order import OrderStatus
+from app.models.order import Order, OrderStatus
+from app.repositories.base import CountMode
 from app.schemas.order import (
     OrderCreate, OrderUpdate, OrderResponse, OrderSummary,
     OrderFilter, OrderStatusUpdate, OrderWithOffers
@@ -15,6 +19,45 @@ from app.services.order_service import OrderService
 
 router = APIRouter()
 
+order_fields = SparseFields(OrderResponse, Order)
+order_summary_fields = SparseFields(OrderSummary, Order)
+
+def _order_summary(order) -> OrderSummary:
+    city = order.destination_city
+    shopper = order.shopper
+    return OrderSummary(
+        id=order.id,
+        product_name=order.product_name,
+        product_image_url=order.product_image_url,
+        product_price=order.product_price,
+        destination_country=order.destination_country,
+        destination_city_id=order.destination_city_id,
+        destination_city={
+            'id': str(city.id),
+            'name': city.name,
+            'country_code': city.country_code
+        } if city else None,
+        deadline_date=order.deadline_date,
+        preferred_delivery_date=order.preferred_delivery_date,
+        reward_amount=order.reward_amount,
+        reward_currency=order.reward_currency,
+        special_instructions=order.special_instructions,
+        status=order.status,
+        created_at=order.created_at,
+        updated_at=order.updated_at,
+        shopper_id=order.shopper_id,
+        shopper={
+            'id': str(shopper.id),
+            'first_name': shopper.first_name,
+            'last_name': shopper.last_name,
+            'display_name': shopper.display_name or f"{shopper.first_name} {shopper.last_name[0]}.",
+            'avatar_url': shopper.avatar_url,
+            'rating': float(shopper.shopper_rating or 0),
+            'review_count': shopper.shopper_review_count or 0,
+            'verified': shopper.identity_verified
+        } if shopper else None
+    )
+
 @router.post("/", response_model=OrderResponse, status_code=status.HTTP_201_CREATED)
 def create_order(
     order_data: OrderCreate,
@@ -25,7 +68,7 @@ def create_order(
     
     try:
         order = order_service.create_order(order_data, current_user.id)
-        return OrderResponse.model_validate(order)
+        return model_response(OrderResponse.model_validate(order), status.HTTP_201_CREATED)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -34,6 +77,7 @@ def create_order(
 
 @router.get("/", response_model=List[OrderSummary])
 def list_orders(
+    response: Response,
     destination_country: Optional[str] = Query(None, max_length=2),
     destination_city_id: Optional[str] = Query(None),
     status_filter: Optional[OrderStatus] = Query(None, alias="status"),
@@ -44,29 +88,15 @@ def list_orders(
     search_query: Optional[str] = Query(None, max_length=100),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, gt=0, le=100),
+    count: Optional[CountMode] = Query(None, description="Return a total in X-Total-Count"),
+    fields: Optional[List[str]] = Depends(order_summary_fields),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_optional_current_user)
 ):
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    # Log all incoming parameters
-    logger.info("=== ORDER SEARCH REQUEST ===")
-    logger.info(f"destination_country: {destination_country}")
-    logger.info(f"destination_city_id: {destination_city_id}")
-    logger.info(f"status_filter: {status_filter}")
-    logger.info(f"min_reward: {min_reward}")
-    logger.info(f"max_reward: {max_reward}")
-    logger.info(f"deadline_before: {deadline_before}")
-    logger.info(f"deadline_after: {deadline_after}")
-    logger.info(f"search_query: {search_query}")
-    logger.info(f"skip: {skip}, limit: {limit}")
-    
     order_service = OrderService(db)
     
     # Convert destination_city_id string to UUID if provided
     city_id = UUID(destination_city_id) if destination_city_id else None
-    logger.info(f"Converted city_id: {city_id}")
     
     filters = OrderFilter(
         destination_country=destination_country,
@@ -81,70 +111,16 @@ def list_orders(
         limit=limit
     )
     
-    logger.info(f"Created filters object: {filters}")
-    
     # Exclude current user's orders if they are authenticated
     exclude_user_id = current_user.id if current_user else None
-    if exclude_user_id:
-        logger.info(f"Excluding orders from user: {exclude_user_id}")
-    
-    orders = order_service.search_orders(filters, exclude_user_id=exclude_user_id)
-    logger.info(f"Found {len(orders)} orders from database")
-    
-    # Convert orders to summaries with city information
-    order_summaries = []
-    for order in orders:
-        # Create order dict without destination_city first
-        order_data = {
-            'id': order.id,
-            'product_name': order.product_name,
-            'product_image_url': order.product_image_url,
-            'product_price': order.product_price,
-            'destination_country': order.destination_country,
-            'destination_city_id': order.destination_city_id,
-            'deadline_date': order.deadline_date,
-            'preferred_delivery_date': order.preferred_delivery_date,
-            'reward_amount': order.reward_amount,
-            'reward_currency': order.reward_currency,
-            'special_instructions': order.special_instructions,
-            'status': order.status,
-            'created_at': order.created_at,
-            'updated_at': order.updated_at,
-            'shopper_id': order.shopper_id
-        }
-        
-        # Add city information if available
-        if order.destination_city:
-            order_data['destination_city'] = {
-                'id': str(order.destination_city.id),
-                'name': order.destination_city.name,
-                'country_code': order.destination_city.country_code
-            }
-        else:
-            order_data['destination_city'] = None
-            
-        # Add shopper information if available
-        if order.shopper:
-            order_data['shopper'] = {
-                'id': str(order.shopper.id),
-                'first_name': order.shopper.first_name,
-                'last_name': order.shopper.last_name,
-                'display_name': order.shopper.display_name or f"{order.shopper.first_name} {order.shopper.last_name[0]}.",
-                'avatar_url': order.shopper.avatar_url,
-                'rating': order.shopper.rating_as_shopper if hasattr(order.shopper, 'rating_as_shopper') else 0,
-                'review_count': order.shopper.review_count_as_shopper if hasattr(order.shopper, 'review_count_as_shopper') else 0,
-                'verified': order.shopper.identity_verified
-            }
-        else:
-            order_data['shopper'] = None
-            
-        order_summaries.append(order_data)
-        logger.info(f"Order {order.id}: {order.product_name[:30]}... -> {order.destination_city.name if order.destination_city else 'No city'}")
     
-    logger.info(f"Returning {len(order_summaries)} order summaries")
-    logger.info("=== END ORDER SEARCH ===")
+    orders = order_service.search_orders(filters, exclude_user_id=exclude_user_id, columns=fields)
+    if count:
+        set_total_count(response, order_service.count_search_orders(filters, exclude_user_id, count))
     
-    return order_summaries
+    if fields:
+        return model_response(order_summary_fields.render(orders, fields), response=response)
+    return model_response([_order_summary(order) for order in orders], response=response)
 
 @router.get("/active", response_model=List[OrderSummary])
 def get_active_orders(
@@ -158,22 +134,29 @@ def get_active_orders(
     # Exclude current user's orders if they are authenticated
     exclude_user_id = current_user.id if current_user else None
     orders = order_service.get_active_orders(destination_country, skip, limit, exclude_user_id)
-    return [OrderSummary.model_validate(order) for order in orders]
+    return model_response([_order_summary(order) for order in orders])
 
 @router.get("/my", response_model=List[OrderResponse])
 def get_my_orders(
+    response: Response,
     as_shopper: bool = Query(True),
     status_filter: Optional[OrderStatus] = Query(None, alias="status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, gt=0, le=100),
+    count: Optional[CountMode] = Query(None, description="Return a total in X-Total-Count"),
+    fields: Optional[List[str]] = Depends(order_fields),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     order_service = OrderService(db)
     orders = order_service.get_user_orders(
-        current_user.id, as_shopper, status_filter, skip, limit
+        current_user.id, as_shopper, status_filter, skip, limit, columns=fields
     )
-    return [OrderResponse.model_validate(order) for order in orders]
+    if count:
+        set_total_count(response, order_service.count_user_orders(current_user.id, as_shopper, status_filter, count))
+    if fields:
+        return model_response(order_fields.render(orders, fields), response=response)
+    return model_response([OrderResponse.model_validate(order) for order in orders], response=response)
 
 @router.get("/nearby", response_model=List[OrderSummary])
 def get_nearby_orders(
@@ -188,7 +171,7 @@ def get_nearby_orders(
     # Exclude current user's orders if they are authenticated
     exclude_user_id = current_user.id if current_user else None
     orders = order_service.get_nearby_orders(latitude, longitude, radius_km, limit, exclude_user_id)
-    return [OrderSummary.model_validate(order) for order in orders]
+    return model_response([_order_summary(order) for order in orders])
 
 @router.get("/{order_id}", response_model=OrderResponse)
 def get_order(
@@ -206,7 +189,7 @@ def get_order(
             detail="Order not found"
         )
     
-    return OrderResponse.model_validate(order)
+    return model_response(OrderResponse.model_validate(order))
 
 @router.put("/{order_id}", response_model=OrderResponse)
 def update_order(
@@ -224,7 +207,7 @@ def update_order(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Order not found or you don't have permission to update it"
             )
-        return OrderResponse.model_validate(order)
+        return model_response(OrderResponse.model_validate(order))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -270,7 +253,7 @@ def update_order_status(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Order not found"
             )
-        return OrderResponse.model_validate(order)
+        return model_response(OrderResponse.model_validate(order))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
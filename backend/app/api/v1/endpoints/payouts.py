@@ -0,0 +1,68 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.api.deps import get_current_user, get_current_admin_user
+from app.models.payment import PaymentStatus
+from app.models.user import User
+from app.schemas.payment import BalanceResponse, PayoutReportResponse, PayoutResponse
+from app.services.ledger_service import LedgerService
+
+router = APIRouter()
+
+
+@router.get("/balance", response_model=List[BalanceResponse])
+def get_my_balance(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Escrow the current user can be paid out now, per currency"""
+    ledger_service = LedgerService(db)
+    return [
+        BalanceResponse.model_validate(row)
+        for row in ledger_service.get_releasable_balances(traveler_id=current_user.id)
+    ]
+
+
+@router.get("/balances", response_model=List[BalanceResponse])
+def get_balances(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, gt=0, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Releasable balance of every traveler, per currency"""
+    ledger_service = LedgerService(db)
+    return [
+        BalanceResponse.model_validate(row)
+        for row in ledger_service.get_releasable_balances(skip=skip, limit=limit)
+    ]
+
+
+@router.post("/run", response_model=PayoutReportResponse)
+def run_payouts(
+    dry_run: bool = Query(True, description="Only report what would be paid"),
+    chunk_size: int = Query(settings.PAYOUT_CHUNK_SIZE, gt=0, le=1000, description="Travelers per transaction"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Release delivered orders' escrow to their travelers"""
+    ledger_service = LedgerService(db)
+    
+    try:
+        report = ledger_service.run_payouts(dry_run=dry_run, chunk_size=chunk_size)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return PayoutReportResponse(
+        dry_run=report.dry_run,
+        payouts=[PayoutResponse.model_validate(payout) for payout in report.payouts],
+        retried=[PayoutResponse.model_validate(payout) for payout in report.retried],
+        totals=report.totals(),
+        paid=report.totals(PaymentStatus.CAPTURED)
+    )
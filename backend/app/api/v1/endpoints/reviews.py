@@ -0,0 +1,97 @@
+from typing import Literal, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.api.deps import get_current_user
+from app.api.pagination import decode_cursor, encode_cursor
+from app.models.user import User
+from app.schemas.review import ReviewCreate, ReviewPage, ReviewReply, ReviewResponse
+from app.services.review_service import ReviewService
+
+router = APIRouter()
+
+
+@router.get("/users/{user_id}", response_model=ReviewPage)
+def get_user_reviews(
+    user_id: UUID,
+    role: Optional[Literal["shopper", "traveler"]] = Query(None, description="Only reviews left by shoppers or by travelers"),
+    before: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(20, gt=0, le=100),
+    db: Session = Depends(get_db)
+):
+    """Public reviews about a user, newest first, paged by (created_at, id) cursor"""
+    review_service = ReviewService(db)
+    reviews, has_more = review_service.get_user_reviews(
+        user_id,
+        reviewer_role=role,
+        before=decode_cursor(before) if before else None,
+        limit=limit
+    )
+    
+    next_cursor = encode_cursor(reviews[-1].created_at, reviews[-1].id) if has_more else None
+    return ReviewPage(items=[ReviewResponse.model_validate(r) for r in reviews], next_cursor=next_cursor)
+
+
+@router.post("/orders/{order_id}", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
+def create_review(
+    order_id: UUID,
+    review_data: ReviewCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Review the other participant of a delivered order"""
+    review_service = ReviewService(db)
+    
+    try:
+        review = review_service.create_review(order_id, current_user.id, review_data)
+        return ReviewResponse.model_validate(review)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.post("/{review_id}/response", response_model=ReviewResponse)
+def reply_to_review(
+    review_id: UUID,
+    reply: ReviewReply,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    review_service = ReviewService(db)
+    
+    try:
+        review = review_service.reply_to_review(review_id, current_user.id, reply.response)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    if not review:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+    
+    return ReviewResponse.model_validate(review)
+
+
+@router.delete("/{review_id}")
+def delete_review(
+    review_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    review_service = ReviewService(db)
+    
+    if not review_service.delete_review(review_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Review not found"
+        )
+    
+    return {"message": "Review deleted successfully"}
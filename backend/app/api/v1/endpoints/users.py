@@ -1,5 +1,5 @@
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
@@ -7,37 +7,51 @@ from app.core.database import get_db
 from app.schemas.user import UserResponse, UserPublicResponse, UserUpdate
 from app.repositories.user_repository import UserRepository
 from app.api.deps import get_current_user, get_current_active_user
+from app.api.fieldsets import SparseFields
+from app.api.responses import model_response
 from app.models.user import User
 
 router = APIRouter()
 
+user_fields = SparseFields(UserPublicResponse, User)
+
+
+def _users_response(users, fields: Optional[List[str]]):
+    if fields:
+        return model_response(user_fields.render(users, fields))
+    return model_response([UserPublicResponse.model_validate(user) for user in users])
+
+
 @router.get("/", response_model=List[UserPublicResponse])
 def get_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    fields: Optional[List[str]] = Depends(user_fields),
     db: Session = Depends(get_db)
 ):
     
     user_repo = UserRepository(db)
-    users = user_repo.get_active_users(skip=skip, limit=limit)
-    return [UserPublicResponse.model_validate(user) for user in users]
+    users = user_repo.get_active_users(skip=skip, limit=limit, columns=fields)
+    return _users_response(users, fields)
 
 @router.get("/shoppers", response_model=List[UserPublicResponse])
 def get_shoppers(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    fields: Optional[List[str]] = Depends(user_fields),
     db: Session = Depends(get_db)
 ):
     
     user_repo = UserRepository(db)
-    users = user_repo.get_shoppers(skip=skip, limit=limit)
-    return [UserPublicResponse.model_validate(user) for user in users]
+    users = user_repo.get_shoppers(skip=skip, limit=limit, columns=fields)
+    return _users_response(users, fields)
 
 @router.get("/travelers", response_model=List[UserPublicResponse])
 def get_travelers(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     verified_only: bool = Query(False),
+    fields: Optional[List[str]] = Depends(user_fields),
     db: Session = Depends(get_db)
 ):
     
@@ -45,21 +59,23 @@ def get_travelers(
     users = user_repo.get_travelers(
         skip=skip, 
         limit=limit, 
-        verified_only=verified_only
+        verified_only=verified_only,
+        columns=fields
     )
-    return [UserPublicResponse.model_validate(user) for user in users]
+    return _users_response(users, fields)
 
 @router.get("/search", response_model=List[UserPublicResponse])
 def search_users(
     q: str = Query(..., min_length=2),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    fields: Optional[List[str]] = Depends(user_fields),
     db: Session = Depends(get_db)
 ):
     
     user_repo = UserRepository(db)
-    users = user_repo.search_users(query=q, skip=skip, limit=limit)
-    return [UserPublicResponse.model_validate(user) for user in users]
+    users = user_repo.search_users(query=q, skip=skip, limit=limit, columns=fields)
+    return _users_response(users, fields)
 
 @router.get("/{user_id}", response_model=UserPublicResponse)
 def get_user(
@@ -89,7 +105,7 @@ def update_current_user(
 
     update_data = user_update.model_dump(exclude_unset=True)
 
-    updated_user = user_repo.update(current_user.id, **update_data)
+    updated_user = user_repo.update_returning(current_user.id, **update_data)
     
     if not updated_user:
         raise HTTPException(
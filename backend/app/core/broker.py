@@ -0,0 +1,239 @@
+"""Per-user pub/sub for pushing events to open streams.
+
+``InMemoryBroker`` fans events out to subscribers in this process.
+``PostgresBroker`` routes every publish through Postgres LISTEN/NOTIFY so
+all workers sharing the database see it, then fans out locally the same
+way. Select one with ``NOTIFICATION_BROKER`` ("memory" or "postgres").
+
+``publish`` is synchronous and thread-safe so services running in the
+threadpool can call it; subscriptions are consumed from the event loop.
+"""
+import asyncio
+import json
+import logging
+import select
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+stream_subscribers = registry.gauge(
+    "notification_stream_subscribers",
+    "Open notification stream subscriptions in this process",
+)
+
+Event = Dict[str, Any]
+
+
+class Subscription:
+    """Bounded event queue for one open stream. When a slow client lets the
+    queue fill up the subscription is closed; the client reconnects with
+    Last-Event-ID and replays what it missed."""
+
+    def __init__(self, broker: "NotificationBroker", user_id: str, maxsize: int):
+        self.broker = broker
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.closed = False
+
+    def _put(self, event: Optional[Event]) -> None:
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning("Notification stream for user %s overflowed, closing", self.user_id)
+            self.closed = True
+            self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    def deliver(self, event: Event) -> None:
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    async def get(self, timeout: float) -> Optional[Event]:
+        """Next event, or None on timeout or when the subscription closed"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class NotificationBroker:
+
+    def publish(self, user_id: UUID, event: Event) -> None:
+        raise NotImplementedError
+
+    def publish_many(self, events: List[Tuple[UUID, Event]]) -> None:
+        for user_id, event in events:
+            self.publish(user_id, event)
+
+    def subscribe(self, user_id: UUID) -> Subscription:
+        raise NotImplementedError
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        raise NotImplementedError
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class InMemoryBroker(NotificationBroker):
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: UUID) -> Subscription:
+        subscription = Subscription(self, str(user_id), self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(subscription.user_id, set()).add(subscription)
+        stream_subscribers.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if not subscribers or subscription not in subscribers:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.user_id]
+        subscription.closed = True
+        stream_subscribers.dec()
+
+    def deliver_local(self, user_id: str, event: Event) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.deliver(event)
+            except RuntimeError:
+                # Event loop already closed (worker shutting down)
+                self.unsubscribe(subscription)
+
+    def publish(self, user_id: UUID, event: Event) -> None:
+        self.deliver_local(str(user_id), event)
+
+
+class PostgresBroker(InMemoryBroker):
+    """Shares events between workers through LISTEN/NOTIFY on the app
+    database. Every event, including this worker's own, arrives through the
+    listener thread, so local delivery happens exactly once."""
+
+    # NOTIFY payloads must stay below 8000 bytes
+    MAX_PAYLOAD_BYTES = 7900
+
+    def __init__(self, dsn: str, channel: str = "notification_events", queue_size: int = 100):
+        super().__init__(queue_size)
+        self.dsn = dsn
+        self.channel = channel
+        self._publish_conn = None
+        self._publish_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _connect(self):
+        import psycopg2
+
+        conn = psycopg2.connect(self.dsn)
+        conn.autocommit = True
+        return conn
+
+    def _payload(self, user_id: UUID, event: Event) -> str:
+        payload = json.dumps({"user_id": str(user_id), "event": event}, default=str)
+        if len(payload.encode()) > self.MAX_PAYLOAD_BYTES:
+            # Subscribers replay by id; send the reference only
+            payload = json.dumps({"user_id": str(user_id), "event": {"id": event.get("id"), "ref": True}})
+        return payload
+
+    def publish(self, user_id: UUID, event: Event) -> None:
+        self.publish_many([(user_id, event)])
+
+    def publish_many(self, events: List[Tuple[UUID, Event]]) -> None:
+        """All payloads in one round trip"""
+        if not events:
+            return
+        payloads = [self._payload(user_id, event) for user_id, event in events]
+
+        with self._publish_lock:
+            for attempt in range(2):
+                try:
+                    if self._publish_conn is None or self._publish_conn.closed:
+                        self._publish_conn = self._connect()
+                    with self._publish_conn.cursor() as cursor:
+                        cursor.execute(
+                            "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload",
+                            (self.channel, payloads)
+                        )
+                    return
+                except Exception:
+                    self._publish_conn = None
+                    if attempt:
+                        raise
+
+    def _listen(self) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                conn = self._connect()
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+                backoff = 1.0
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        message = json.loads(conn.notifies.pop(0).payload)
+                        self.deliver_local(message["user_id"], message["event"])
+                conn.close()
+            except Exception:
+                logger.exception("Notification listener failed, reconnecting in %.0fs", backoff)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="notification-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(5.0)
+            self._thread = None
+        with self._publish_lock:
+            if self._publish_conn is not None:
+                self._publish_conn.close()
+                self._publish_conn = None
+
+
+def create_broker() -> NotificationBroker:
+    if settings.NOTIFICATION_BROKER == "postgres":
+        return PostgresBroker(settings.DATABASE_URL, queue_size=settings.NOTIFICATION_STREAM_QUEUE_SIZE)
+    if settings.NOTIFICATION_BROKER != "memory":
+        raise ValueError(f"Unknown NOTIFICATION_BROKER: {settings.NOTIFICATION_BROKER}")
+    return InMemoryBroker(queue_size=settings.NOTIFICATION_STREAM_QUEUE_SIZE)
+
+
+broker = create_broker()
@@ -0,0 +1,339 @@
+"""Response compression with Accept-Encoding negotiation.
+
+``CompressionMiddleware`` compresses JSON, NDJSON and text responses with
+the best encoding the client accepts: zstd, then brotli, then gzip. zstd
+and brotli need the optional ``zstandard`` and ``brotli`` packages; gzip is
+always available.
+
+- Complete bodies below ``minimum_size`` are sent as they are; compressing
+  a few hundred bytes costs more than it saves.
+- Streamed responses (``more_body``) are compressed chunk by chunk and
+  flushed after every chunk, so NDJSON lines reach the client as they are
+  produced rather than when the stream ends.
+- Responses of ``cache_paths`` (reference data such as the country list)
+  are compressed once per distinct body, at a higher level, and served from
+  a small in-memory cache afterwards.
+- Server-sent events, responses that are already encoded and responses
+  marked ``Cache-Control: no-transform`` are left alone.
+
+``benchmarks/bench_compression.py`` measures CPU time against bytes saved
+for typical payloads, see ``benchmarks/README.md``.
+"""
+import hashlib
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.metrics import record_cache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+UNCOMPRESSIBLE_TYPES = ("text/event-stream",)
+# Bodies this large are compressed off the event loop
+THREADPOOL_THRESHOLD = 256 * 1024
+CACHE_ENTRIES = 64
+
+
+class Codec:
+    """One content encoding: one-shot compression at the default or the
+    cached level, and a streaming compressor that flushes every chunk"""
+
+    name = "identity"
+    level = 0
+    cached_level = 0
+
+    def compress(self, data: bytes, cached: bool = False) -> bytes:
+        raise NotImplementedError
+
+    def stream(self) -> "StreamCompressor":
+        raise NotImplementedError
+
+
+class StreamCompressor:
+
+    def compress(self, chunk: bytes) -> bytes:
+        raise NotImplementedError
+
+    def finish(self) -> bytes:
+        raise NotImplementedError
+
+
+class _GzipStream(StreamCompressor):
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class GzipCodec(Codec):
+
+    name = "gzip"
+
+    def __init__(self, level: int = 6, cached_level: int = 9):
+        self.level = level
+        self.cached_level = cached_level
+
+    def compress(self, data: bytes, cached: bool = False) -> bytes:
+        # wbits=31: gzip container, without gzip.compress's header timestamp
+        compressor = zlib.compressobj(self.cached_level if cached else self.level, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+
+    def stream(self) -> StreamCompressor:
+        return _GzipStream(self.level)
+
+
+class _BrotliStream(StreamCompressor):
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class BrotliCodec(Codec):
+
+    name = "br"
+
+    def __init__(self, level: int = 4, cached_level: int = 11):
+        # Brotli calls the level "quality"
+        self.level = level
+        self.cached_level = cached_level
+
+    def compress(self, data: bytes, cached: bool = False) -> bytes:
+        return brotli.compress(data, quality=self.cached_level if cached else self.level)
+
+    def stream(self) -> StreamCompressor:
+        return _BrotliStream(self.level)
+
+
+class _ZstdStream(StreamCompressor):
+
+    def __init__(self, compressor):
+        self._compressor = compressor.compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class ZstdCodec(Codec):
+
+    name = "zstd"
+
+    def __init__(self, level: int = 3, cached_level: int = 15):
+        self.level = level
+        self.cached_level = cached_level
+
+    def compress(self, data: bytes, cached: bool = False) -> bytes:
+        # A compressor per call: ZstdCompressor isn't safe to share across
+        # the threadpool
+        return zstandard.ZstdCompressor(level=self.cached_level if cached else self.level).compress(data)
+
+    def stream(self) -> StreamCompressor:
+        return _ZstdStream(zstandard.ZstdCompressor(level=self.level))
+
+
+def available_codecs(gzip_level: int = 6, brotli_quality: int = 4, zstd_level: int = 3) -> List[Codec]:
+    """Codecs in server preference order, skipping optional ones that
+    aren't installed"""
+    codecs: List[Codec] = []
+    if zstandard is not None:
+        codecs.append(ZstdCodec(zstd_level))
+    if brotli is not None:
+        codecs.append(BrotliCodec(brotli_quality))
+    codecs.append(GzipCodec(gzip_level))
+    return codecs
+
+
+@lru_cache(maxsize=256)
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Accept-Encoding as encoding -> q-value"""
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+    return accepted
+
+
+def negotiate(header: str, codecs: Sequence[Codec]) -> Optional[Codec]:
+    """The codec with the highest q-value; server preference breaks ties"""
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for codec in codecs:
+        q = accepted.get(codec.name, wildcard)
+        if q > best_q:
+            best, best_q = codec, q
+    return best
+
+
+def _compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) and not content_type.startswith(UNCOMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware, see the module docstring"""
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+        cache_paths: Sequence[str] = ()
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.codecs = available_codecs(gzip_level, brotli_quality, zstd_level)
+        self.cache_paths = frozenset(cache_paths)
+        # (encoding, body digest) -> compressed body, least recently used first
+        self._cache: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = next(
+            (value.decode("latin-1") for name, value in scope["headers"] if name == b"accept-encoding"),
+            None
+        )
+        codec = negotiate(accept_encoding, self.codecs) if accept_encoding else None
+        if codec is None:
+            await self.app(scope, receive, send)
+            return
+
+        cached = scope["path"] in self.cache_paths
+        start_message = None
+        headers: Optional[MutableHeaders] = None
+        chunks: List[bytes] = []
+        stream: Optional[StreamCompressor] = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, headers, stream, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=list(message["headers"]))
+                length = headers.get("content-length")
+                if not _compressible(headers) or (length is not None and int(length) < self.minimum_size):
+                    passthrough = True
+                    await send(message)
+                    return
+                # Held back until the body shows how to compress
+                start_message = {**message, "headers": headers.raw}
+                headers.add_vary_header("Accept-Encoding")
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if stream is not None:
+                chunk = stream.compress(body) if body else b""
+                if not more_body:
+                    chunk += stream.finish()
+                if chunk or not more_body:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+
+            if more_body and "content-length" not in headers:
+                # A stream of unknown length: compress as it goes
+                stream = codec.stream()
+                headers["content-encoding"] = codec.name
+                await send(start_message)
+                chunk = stream.compress(body) if body else b""
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                return
+
+            # Known length (possibly re-chunked by an inner middleware):
+            # collect the body and compress it in one go
+            chunks.append(body)
+            if more_body:
+                return
+            body = b"".join(chunks)
+            passthrough = True
+
+            if len(body) < self.minimum_size:
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            compressed = await self._compress(codec, body, cached)
+            headers["content-encoding"] = codec.name
+            headers["content-length"] = str(len(compressed))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _compress(self, codec: Codec, body: bytes, cached: bool) -> bytes:
+        if not cached:
+            if len(body) >= THREADPOOL_THRESHOLD:
+                return await run_in_threadpool(codec.compress, body)
+            return codec.compress(body)
+
+        key = (codec.name, hashlib.blake2b(body, digest_size=16).digest())
+        compressed = self._cache.get(key)
+        record_cache("compression", compressed is not None)
+        if compressed is not None:
+            self._cache.move_to_end(key)
+            return compressed
+
+        compressed = await run_in_threadpool(codec.compress, body, True)
+        self._cache[key] = compressed
+        if len(self._cache) > CACHE_ENTRIES:
+            self._cache.popitem(last=False)
+        return compressed
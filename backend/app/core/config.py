@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import validator
 import os
@@ -55,6 +55,71 @@ class Settings(BaseSettings):
     ALLOWED_EXTENSIONS: List[str] = ["jpg", "jpeg", "png", "gif", "pdf"]
     
     LOG_LEVEL: str = "INFO"
+    LOG_DIR: str = "logs"
+    LOG_ROTATION: str = "size"
+    LOG_MAX_BYTES: int = 50 * 1024 * 1024
+    LOG_ROTATION_WHEN: str = "midnight"
+    LOG_BACKUP_COUNT: int = 7
+    LOG_QUEUE_SIZE: int = 10000
+    
+    METRICS_ENABLED: bool = True
+    
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    # Responses of these paths are compressed once per distinct body
+    COMPRESSION_CACHE_PATHS: List[str] = ["/api/v1/locations/countries"]
+    
+    NOTIFICATION_BROKER: str = "memory"
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS: int = 15
+    NOTIFICATION_STREAM_QUEUE_SIZE: int = 100
+    NOTIFICATION_STREAM_REPLAY_LIMIT: int = 100
+    # Lifetime of the ticket EventSource clients put in the stream URL
+    NOTIFICATION_STREAM_TICKET_SECONDS: int = 60
+    
+    NOTIFICATION_RETENTION_DAYS: int = 180
+    NOTIFICATION_PARTITIONS_AHEAD: int = 3
+    NOTIFICATION_PARTITION_MAINTENANCE_SECONDS: int = 24 * 3600
+    
+    OUTBOX_POLL_SECONDS: float = 1.0
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_TTL_SECONDS: int = 24 * 3600
+    IDEMPOTENCY_WAIT_SECONDS: float = 10.0
+    IDEMPOTENCY_MAX_BODY_BYTES: int = 1024 * 1024
+    IDEMPOTENCY_PURGE_SECONDS: int = 3600
+    
+    PAYMENT_PROVIDER: str = "local"
+    PAYOUT_CHUNK_SIZE: int = 200
+    # Let real (non-dry) payout runs settle against the local provider,
+    # which moves no money; always allowed with DEBUG
+    PAYOUT_ALLOW_LOCAL_PROVIDER: bool = False
+    
+    SCHEDULER_ENABLED: bool = True
+    NOTIFICATION_COUNTER_RECONCILE_SECONDS: int = 3600
+    RATING_RECOMPUTE_SECONDS: int = 86400
+    
+    DB_N_PLUS_ONE_THRESHOLD: int = 5
+    # Keyed by "METHOD route", the route as templated by the router
+    DB_QUERY_BUDGETS: Dict[str, int] = {
+        "GET /api/v1/notifications/unread-count": 1,
+        "GET /api/v1/notifications/{notification_id}": 2,
+        "PUT /api/v1/notifications/{notification_id}/read": 4,
+        "DELETE /api/v1/notifications/{notification_id}": 3,
+    }
+    DB_QUERY_BUDGET_STRICT: bool = False
+    LOG_REQUESTS_SAMPLE_RATE: float = 1.0
+    LOG_REQUESTS_ROUTE_SAMPLE_RATES: Dict[str, float] = {}
+    LOG_REQUESTS_SLOW_SECONDS: float = 1.0
+    LOG_REQUESTS_VERBOSE: bool = False
+    
+    CONTENT_FILTER_ENABLED: bool = True
+    CONTENT_FILTER_BANNED_PHRASES: List[str] = []
+    CONTENT_FILTER_BLOCK_RULES: List[str] = ["banned"]
     
     class Config:
         env_file = str(BASE_DIR.parent / ".env")
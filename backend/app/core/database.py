@@ -1,25 +1,63 @@
+import threading
+from typing import Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
+from .query_stats import install_query_instrumentation
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    echo=settings.DEBUG
-)
 
-SessionLocal = sessionmaker(
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """The application engine, created on first use rather than at import:
+    creating it loads the psycopg2 dialect, which tools that only need the
+    models (alembic, benchmarks, the app factory itself) don't pay for"""
+    global _engine
+
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(
+                    settings.DATABASE_URL,
+                    pool_pre_ping=True,
+                    pool_size=10,
+                    max_overflow=20,
+                    echo=settings.DEBUG
+                )
+                install_query_instrumentation(engine)
+                _engine = engine
+    return _engine
+
+
+class _LazySessionMaker(sessionmaker):
+    """sessionmaker that binds to ``get_engine()`` on the first session"""
+
+    def __call__(self, **local_kw):
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionMaker(
     autocommit=False,
-    autoflush=False,
-    bind=engine
+    autoflush=False
 )
 
 Base = declarative_base()
 
 
+def __getattr__(name: str):
+    # ``from app.core.database import engine`` still works
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -31,9 +69,9 @@ def get_db():
 def test_connection():
     try:
         from sqlalchemy import text
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             result = conn.execute(text("SELECT 1"))
             return result.scalar() == 1
     except Exception as e:
         print(f"Database connection failed: {e}")
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,321 @@
+"""Idempotency-Key support for write endpoints.
+
+A POST/PUT/PATCH/DELETE sent with an ``Idempotency-Key`` header runs once
+per (user, key). The response is stored in ``idempotency_keys`` for
+``IDEMPOTENCY_TTL_SECONDS``, and retries with the same key get it back
+without the handler running again (marked ``Idempotent-Replayed: true``),
+status, headers and body alike.
+Concurrent duplicates wait for the first request to finish and then
+replay its response. Reusing a key for a different request is a 422.
+
+Only authenticated requests take part: keys are scoped to the user in the
+bearer token, and requests without a valid one pass straight through. 5xx
+responses and unhandled errors aren't stored, so the client's retry runs
+the request again.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from jose import JWTError, jwt
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.idempotency import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+HEADER = b"idempotency-key"
+METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+MAX_KEY_LENGTH = 255
+# How long a claim survives a worker that died mid-request
+IN_FLIGHT_SECONDS = 60
+POLL_SECONDS = (0.05, 0.1, 0.2, 0.5)
+# Not stored: they describe the original connection, and Content-Length is
+# recomputed on replay
+UNSTORED_HEADERS = frozenset({
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailer", "transfer-encoding", "upgrade", "content-length",
+})
+
+# Status code, [name, value] header pairs, body
+StoredResponse = Tuple[int, List[List[str]], bytes]
+
+
+def _user_id(scope) -> Optional[UUID]:
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer":
+                return None
+            try:
+                payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+                return UUID(payload.get("sub"))
+            except (JWTError, TypeError, ValueError):
+                return None
+    return None
+
+
+def _fingerprint(scope, body: bytes) -> str:
+    digest = hashlib.sha256()
+    digest.update(scope["method"].encode())
+    digest.update(scope["path"].encode())
+    digest.update(b"?" + scope.get("query_string", b""))
+    digest.update(body)
+    return digest.hexdigest()
+
+
+class IdempotencyStore:
+
+    def __init__(self, session_factory=SessionLocal, ttl_seconds: int = 86400):
+        self.session_factory = session_factory
+        self.ttl = timedelta(seconds=ttl_seconds)
+
+    def claim(self, user_id: UUID, key: str, fingerprint: str) -> Tuple[bool, Optional[IdempotencyKey]]:
+        """Claim the key for this request. When someone else holds it,
+        returns their record (finished, or still in flight); None if it
+        vanished in between. Expired records are taken over."""
+        now = datetime.utcnow()
+        stmt = insert(IdempotencyKey).values(
+            user_id=user_id,
+            key=key,
+            fingerprint=fingerprint,
+            created_at=now,
+            expires_at=now + timedelta(seconds=IN_FLIGHT_SECONDS)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKey.user_id, IdempotencyKey.key],
+            set_={
+                "fingerprint": stmt.excluded.fingerprint,
+                "status_code": None,
+                "content_type": None,
+                "headers": None,
+                "body": None,
+                "created_at": stmt.excluded.created_at,
+                "expires_at": stmt.excluded.expires_at
+            },
+            where=IdempotencyKey.expires_at < now
+        ).returning(IdempotencyKey.key)
+
+        with self.session_factory() as db:
+            claimed = db.execute(stmt).first()
+            if claimed:
+                db.commit()
+                return True, None
+            record = db.get(IdempotencyKey, (user_id, key))
+            if record is not None:
+                db.expunge(record)
+            return False, record
+
+    def complete(self, user_id: UUID, key: str, response: StoredResponse) -> None:
+        status_code, headers, body = response
+        content_type = next((value for name, value in headers if name == "content-type"), None)
+        with self.session_factory() as db:
+            db.query(IdempotencyKey).filter(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key
+            ).update({
+                "status_code": status_code,
+                "content_type": content_type,
+                "headers": headers,
+                "body": body,
+                "expires_at": datetime.utcnow() + self.ttl
+            }, synchronize_session=False)
+            db.commit()
+
+    def release(self, user_id: UUID, key: str) -> None:
+        """Drop an unfinished claim so a retry runs the request again"""
+        with self.session_factory() as db:
+            db.execute(delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                IdempotencyKey.status_code.is_(None)
+            ))
+            db.commit()
+
+    def purge_expired(self, batch_size: int = 5000) -> int:
+        purged = 0
+        with self.session_factory() as db:
+            while True:
+                expired = select(IdempotencyKey.user_id, IdempotencyKey.key)\
+                    .where(IdempotencyKey.expires_at < datetime.utcnow())\
+                    .limit(batch_size)
+                deleted = db.execute(delete(IdempotencyKey).where(
+                    tuple_(IdempotencyKey.user_id, IdempotencyKey.key).in_(expired)
+                )).rowcount
+                db.commit()
+                purged += deleted
+                if deleted < batch_size:
+                    return purged
+
+
+class IdempotencyMiddleware:
+    """Pure ASGI middleware, see the module docstring"""
+
+    def __init__(
+        self,
+        app,
+        store: Optional[IdempotencyStore] = None,
+        wait_seconds: float = 10.0,
+        max_body_bytes: int = 1024 * 1024
+    ):
+        self.app = app
+        self.store = store or IdempotencyStore(ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS)
+        self.wait_seconds = wait_seconds
+        self.max_body_bytes = max_body_bytes
+        # Requests running in this process, so local duplicates wake up as
+        # soon as they finish instead of polling
+        self._in_flight: Dict[Tuple[UUID, str], asyncio.Event] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        key = next((value for name, value in scope["headers"] if name == HEADER), None)
+        user_id = _user_id(scope) if key is not None else None
+        if user_id is None:
+            await self.app(scope, receive, send)
+            return
+
+        key = key.decode("latin-1")
+        if not key or len(key) > MAX_KEY_LENGTH:
+            await self._error(send, 400, f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters")
+            return
+
+        body, receive = await self._buffer(receive)
+        fingerprint = _fingerprint(scope, body)
+
+        deadline = asyncio.get_running_loop().time() + self.wait_seconds
+        attempt = 0
+        while True:
+            claimed, record = await run_in_threadpool(self.store.claim, user_id, key, fingerprint)
+            if claimed:
+                break
+            if record is None:
+                continue
+            if record.fingerprint != fingerprint:
+                await self._error(send, 422, "Idempotency-Key was already used for a different request")
+                return
+            if record.status_code is not None:
+                await self._replay(send, record)
+                return
+
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                await self._error(send, 409, "A request with this Idempotency-Key is still in progress")
+                return
+            await self._wait((user_id, key), min(remaining, POLL_SECONDS[min(attempt, len(POLL_SECONDS) - 1)]))
+            attempt += 1
+
+        event = self._in_flight[(user_id, key)] = asyncio.Event()
+        try:
+            response = await self._run(scope, receive, send)
+            if response is not None:
+                await run_in_threadpool(self.store.complete, user_id, key, response)
+            else:
+                await run_in_threadpool(self.store.release, user_id, key)
+        except BaseException:
+            await run_in_threadpool(self.store.release, user_id, key)
+            raise
+        finally:
+            self._in_flight.pop((user_id, key), None)
+            event.set()
+
+    async def _wait(self, in_flight_key: Tuple[UUID, str], timeout: float) -> None:
+        event = self._in_flight.get(in_flight_key)
+        if event is None:
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _buffer(self, receive):
+        """Read the whole request body, for fingerprinting, and a receive
+        that hands it to the app"""
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+        sent = False
+
+        async def replay_receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return body, replay_receive
+
+    async def _run(self, scope, receive, send) -> Optional[StoredResponse]:
+        """Run the app, passing the response through; returns it when it
+        should be stored"""
+        status_code = 500
+        headers: List[List[str]] = []
+        chunks = []
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                for name, value in message.get("headers", []):
+                    name = name.decode("latin-1").lower()
+                    if name not in UNSTORED_HEADERS:
+                        headers.append([name, value.decode("latin-1")])
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+                if size <= self.max_body_bytes:
+                    chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if status_code >= 500 or size > self.max_body_bytes:
+            return None
+        return status_code, headers, b"".join(chunks)
+
+    async def _replay(self, send, record: IdempotencyKey) -> None:
+        body = record.body or b""
+        stored = record.headers
+        if stored is None:
+            stored = [["content-type", record.content_type]] if record.content_type else []
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in stored]
+        headers += [
+            (b"content-length", str(len(body)).encode()),
+            (b"idempotent-replayed", b"true"),
+        ]
+        await send({"type": "http.response.start", "status": record.status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _error(self, send, status_code: int, detail: str) -> None:
+        body = json.dumps({"detail": detail}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def purge_expired_idempotency_keys() -> int:
+    """Scheduled job: delete stored responses past their TTL"""
+    purged = IdempotencyStore().purge_expired()
+    if purged:
+        logger.info("Purged %d expired idempotency keys", purged)
+    return purged
@@ -1,20 +1,35 @@
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
+import re
 import sys
+import threading
 from pathlib import Path
-from typing import Any
-import json
+from typing import Any, Dict, Optional
 from datetime import datetime
 from app.core.config import settings
 
-LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
+try:
+    import orjson
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, default=str)
+
+LOG_DIR = Path(settings.LOG_DIR)
 
 
 class JSONFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         log_obj = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -25,22 +40,111 @@ class JSONFormatter(logging.Formatter):
         
         if record.exc_info:
             log_obj["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_obj["exception"] = record.exc_text
         
         if hasattr(record, "extra_fields"):
             log_obj.update(record.extra_fields)
         
-        return json.dumps(log_obj)
+        return _dumps(log_obj)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that never blocks the caller.
+
+    Records are rendered to plain data on the calling thread and pushed onto a
+    bounded queue; when the writer thread falls behind, new records are
+    dropped and counted instead of stalling the request.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._lock = threading.Lock()
+        self.dropped: Dict[str, int] = {}
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+
+    @property
+    def dropped_total(self) -> int:
+        return sum(self.dropped.values())
+
+
+_exception_formatter = logging.Formatter()
+_queue_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _file_handler(filename: str) -> logging.Handler:
+    path = LOG_DIR / filename
+    if settings.LOG_ROTATION == "time":
+        return logging.handlers.TimedRotatingFileHandler(
+            path,
+            when=settings.LOG_ROTATION_WHEN,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            utc=True,
+            delay=True
+        )
+    return logging.handlers.RotatingFileHandler(
+        path,
+        maxBytes=settings.LOG_MAX_BYTES,
+        backupCount=settings.LOG_BACKUP_COUNT,
+        delay=True
+    )
+
+
+# Query parameters that carry credentials
+_CREDENTIAL_PARAM_RE = re.compile(r"(^|[?&])(ticket|token)=[^&\s]*")
+
+
+def redact_url(url: str) -> str:
+    """Mask credential query parameters (e.g. the stream ticket) in a URL or query string"""
+    if "=" not in url:
+        return url
+    return _CREDENTIAL_PARAM_RE.sub(r"\1\2=REDACTED", url)
+
+
+class RedactAccessLogFilter(logging.Filter):
+    """Redacts the path uvicorn logs with each request, query string included"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        args = record.args
+        if isinstance(args, tuple) and len(args) > 2 and isinstance(args[2], str):
+            record.args = args[:2] + (redact_url(args[2]),) + args[3:]
+        return True
+
+
+_access_log_filter = RedactAccessLogFilter()
 
 
 def setup_logging():
+    global _queue_handler, _listener
+
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
     
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
+    shutdown_logging()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     
@@ -53,22 +157,27 @@ def setup_logging():
         console_format = JSONFormatter()
     
     console_handler.setFormatter(console_format)
-    root_logger.addHandler(console_handler)
     
-    file_handler = logging.FileHandler(
-        LOG_DIR / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-    )
+    file_handler = _file_handler("app.log")
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(file_handler)
     
-    error_handler = logging.FileHandler(
-        LOG_DIR / f"errors_{datetime.now().strftime('%Y%m%d')}.log"
-    )
+    error_handler = _file_handler("errors.log")
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(error_handler)
     
+    # Formatting and disk writes happen on the listener's thread; callers only
+    # pay for building the record and a non-blocking put.
+    _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+    _listener = logging.handlers.QueueListener(
+        _queue_handler.queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    root_logger.addHandler(_queue_handler)
     
     if settings.DEBUG:
         logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
@@ -76,6 +185,7 @@ def setup_logging():
         logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
     
     logging.getLogger("uvicorn.access").setLevel(logging.INFO)
+    logging.getLogger("uvicorn.access").addFilter(_access_log_filter)
     logging.getLogger("uvicorn.error").setLevel(logging.INFO)
     
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -84,6 +194,38 @@ def setup_logging():
     return root_logger
 
 
+def shutdown_logging():
+    """Flush queued records and stop the writer thread"""
+    global _listener
+
+    if _listener is None:
+        return
+
+    if _queue_handler is not None and _queue_handler.dropped_total:
+        logging.getLogger(__name__).warning(
+            "Dropped %d log records because the log queue was full",
+            _queue_handler.dropped_total
+        )
+
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    if _queue_handler is None:
+        return {"queue_size": 0, "queue_capacity": 0, "dropped": {}}
+    return {
+        "queue_size": _queue_handler.queue.qsize(),
+        "queue_capacity": _queue_handler.queue.maxsize,
+        "dropped": dict(_queue_handler.dropped),
+    }
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
@@ -107,49 +249,3 @@ class LoggerMixin:
     
     def log_debug(self, message: str, **kwargs):
         self.logger.debug(message, extra={"extra_fields": kwargs})
-
-
-from fastapi import Request, Response
-from typing import Callable
-import time
-import uuid
-
-
-async def log_requests(request: Request, call_next: Callable) -> Response:
-    request_id = str(uuid.uuid4())
-    
-    start_time = time.time()
-    
-    logger = get_logger("app.requests")
-    
-    logger.info(
-        "Request started",
-        extra={
-            "extra_fields": {
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "client_host": request.client.host if request.client else None,
-            }
-        }
-    )
-    
-    response = await call_next(request)
-    
-    duration = time.time() - start_time
-    
-    logger.info(
-        "Request completed",
-        extra={
-            "extra_fields": {
-                "request_id": request_id,
-                "status_code": response.status_code,
-                "duration_seconds": round(duration, 3),
-            }
-        }
-    )
-    
-    response.headers["X-Request-ID"] = request_id
-    
-    return response
\ No newline at end of file
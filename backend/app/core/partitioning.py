@@ -0,0 +1,156 @@
+"""Helpers for tables range-partitioned by month on a timestamptz column.
+
+Partitions are named ``<table>_pYYYY_MM`` and cover
+``[first of month, first of next month)`` in UTC; a ``<table>_default``
+partition catches anything outside the pre-created range. Rows only land
+there when maintenance fell behind. ``create_monthly_partitions`` moves them
+into their month's partition when it creates it; Postgres would otherwise
+refuse to create a partition whose range overlaps rows in the default one.
+"""
+import logging
+import os
+import re
+import time
+import uuid
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+def month_floor(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month.year:04d}_{month.month:02d}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def _month_range(month: date) -> Tuple[str, str]:
+    return f"{month.isoformat()} 00:00:00+00", f"{add_months(month, 1).isoformat()} 00:00:00+00"
+
+
+def list_monthly_partitions(db: Session, table: str) -> List[Tuple[str, date]]:
+    """Existing monthly partitions of ``table`` as (name, month), oldest first"""
+    names = db.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = :table
+    """), {"table": table}).scalars().all()
+
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})_(\d{{2}})$")
+    partitions = []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda item: item[1])
+
+
+def default_partition_months(db: Session, table: str, column: str = "created_at") -> List[date]:
+    """Months that have rows in the default partition, oldest first"""
+    default = default_partition_name(table)
+    if db.execute(text("SELECT to_regclass(:name)"), {"name": f'"{default}"'}).scalar() is None:
+        return []
+    return db.execute(text(
+        f"SELECT DISTINCT date_trunc('month', \"{column}\" AT TIME ZONE 'UTC')::date AS month "
+        f'FROM "{default}" ORDER BY month'
+    )).scalars().all()
+
+
+def create_monthly_partitions(
+    db: Session,
+    table: str,
+    start: date,
+    months: int,
+    column: str = "created_at"
+) -> List[str]:
+    """Create any missing partitions for ``months`` months from ``start``,
+    plus those for months with rows stranded in the default partition.
+
+    Stranded rows are moved into their new partitions: the default partition
+    is detached, the partitions created, the rows copied through the parent
+    and deleted from the default partition, and it is attached again.
+    Returns the names created; the caller commits, so it's all one
+    transaction.
+    """
+    existing = {name for name, _ in list_monthly_partitions(db, table)}
+    wanted = [add_months(month_floor(start), offset) for offset in range(months)]
+    stranded = default_partition_months(db, table, column)
+    missing = sorted(month for month in set(wanted) | set(stranded) if partition_name(table, month) not in existing)
+    moving = [month for month in missing if month in stranded]
+    default = default_partition_name(table)
+
+    if moving:
+        db.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{default}"'))
+
+    created = []
+    for month in missing:
+        name = partition_name(table, month)
+        lower, upper = _month_range(month)
+        db.execute(text(
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        ))
+        created.append(name)
+
+    if moving:
+        in_ranges = " OR ".join(
+            f"(\"{column}\" >= '{lower}' AND \"{column}\" < '{upper}')"
+            for lower, upper in map(_month_range, moving)
+        )
+        moved = db.execute(text(f'INSERT INTO "{table}" SELECT * FROM "{default}" WHERE {in_ranges}')).rowcount
+        db.execute(text(f'DELETE FROM "{default}" WHERE {in_ranges}'))
+        db.execute(text(f'ALTER TABLE "{table}" ATTACH PARTITION "{default}" DEFAULT'))
+        logger.error(
+            "Moved %d rows out of %s into new partitions for %s; partition maintenance had fallen behind",
+            moved,
+            default,
+            ", ".join(month.strftime("%Y-%m") for month in moving)
+        )
+    return created
+
+
+def retention_start(cutoff: datetime) -> date:
+    """First day of the month ``cutoff`` falls in: everything before it is
+    in months that have fully expired"""
+    return month_floor(cutoff.astimezone(timezone.utc).date() if cutoff.tzinfo else cutoff.date())
+
+
+def expired_partitions(db: Session, table: str, cutoff: datetime) -> List[str]:
+    """Partitions whose whole range ends at or before ``cutoff``"""
+    cutoff_month = retention_start(cutoff)
+    return [name for name, month in list_monthly_partitions(db, table) if add_months(month, 1) <= cutoff_month]
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (version 7): 48-bit Unix milliseconds, then random
+    bits. Lets lookups by id derive the partition from the id itself."""
+    value = (int(time.time() * 1000) & ((1 << 48) - 1)) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    value &= ~(0xF << 76)
+    value |= 0x7 << 76
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62
+    return uuid.UUID(int=value)
+
+
+def uuid7_datetime(value: uuid.UUID) -> Optional[datetime]:
+    """Creation time encoded in a version 7 UUID, None for other versions"""
+    if value.version != 7:
+        return None
+    return datetime.fromtimestamp((value.int >> 80) / 1000, tz=timezone.utc)
@@ -0,0 +1,62 @@
+"""Payment provider used to send traveler payouts.
+
+Every payout carries an idempotency key: a provider must treat a repeated
+key as the same payout and return the original result, so callers can
+retry after a crash or timeout without paying twice.
+
+``LocalPaymentProvider`` settles payouts in memory and is what development
+and test setups run against. Select the provider with ``PAYMENT_PROVIDER``.
+"""
+import threading
+import uuid
+from decimal import Decimal
+from typing import Dict, Iterable, NamedTuple, Optional
+from uuid import UUID
+
+from app.core.config import settings
+
+
+class PayoutResult(NamedTuple):
+    provider_transaction_id: Optional[str]
+    succeeded: bool
+    failure_reason: Optional[str] = None
+
+
+class PaymentProvider:
+
+    name = "base"
+
+    def payout(self, user_id: UUID, amount: Decimal, currency: str, idempotency_key: str) -> PayoutResult:
+        raise NotImplementedError
+
+
+class LocalPaymentProvider(PaymentProvider):
+    """In-process stand-in for a payment provider. Payouts to
+    ``failing_user_ids`` are declined, to exercise the failure path."""
+
+    name = "local"
+
+    def __init__(self, failing_user_ids: Iterable[UUID] = ()):
+        self.failing_user_ids = set(failing_user_ids)
+        self.payouts: Dict[str, PayoutResult] = {}
+        self._lock = threading.Lock()
+
+    def payout(self, user_id: UUID, amount: Decimal, currency: str, idempotency_key: str) -> PayoutResult:
+        with self._lock:
+            if idempotency_key in self.payouts:
+                return self.payouts[idempotency_key]
+            if user_id in self.failing_user_ids:
+                # Declines aren't stored, so a retry with the same key can succeed
+                return PayoutResult(None, False, "Payout declined by provider")
+            result = PayoutResult(f"local_po_{uuid.uuid4().hex}", True)
+            self.payouts[idempotency_key] = result
+            return result
+
+
+def create_payment_provider() -> PaymentProvider:
+    if settings.PAYMENT_PROVIDER != "local":
+        raise ValueError(f"Unknown PAYMENT_PROVIDER: {settings.PAYMENT_PROVIDER}")
+    return LocalPaymentProvider()
+
+
+payment_provider = create_payment_provider()
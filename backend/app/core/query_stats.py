@@ -0,0 +1,120 @@
+"""Per-request SQL statement accounting.
+
+Engine events record every statement into the ``QueryStats`` bound to the
+current request (via a context variable, which follows sync endpoints into
+the threadpool) and into any active ``track_queries()`` collectors.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.duration += duration
+            self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least ``threshold`` times, most frequent first"""
+        return sorted(
+            ((statement, count) for statement, count in self.statements.items() if count >= threshold),
+            key=lambda item: item[1],
+            reverse=True
+        )
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 2)
+
+
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+_collectors: Set[QueryStats] = set()
+_collectors_lock = threading.Lock()
+
+
+def start_request_stats() -> Tuple[QueryStats, Token]:
+    stats = QueryStats()
+    return stats, _request_stats.set(stats)
+
+
+def end_request_stats(token: Token) -> None:
+    _request_stats.reset(token)
+
+
+def get_request_stats() -> Optional[QueryStats]:
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+
+    if _collectors:
+        with _collectors_lock:
+            collectors = list(_collectors)
+        for collector in collectors:
+            collector.record(statement, duration)
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect every statement executed on instrumented engines, from any
+    thread, while the block runs. Intended for tests and benchmarks."""
+    stats = QueryStats()
+    with _collectors_lock:
+        _collectors.add(stats)
+    try:
+        yield stats
+    finally:
+        with _collectors_lock:
+            _collectors.discard(stats)
+
+
+@contextmanager
+def assert_max_queries(limit: int, n_plus_one_threshold: Optional[int] = None) -> Iterator[QueryStats]:
+    """Fail with QueryBudgetExceeded when the block runs more than ``limit``
+    statements, or repeats one statement ``n_plus_one_threshold`` times."""
+    with track_queries() as stats:
+        yield stats
+
+    if stats.count > limit:
+        raise QueryBudgetExceeded(
+            f"Expected at most {limit} queries, got {stats.count}:\n" +
+            "\n".join(f"{count}x {statement}" for statement, count in stats.repeated(1))
+        )
+    if n_plus_one_threshold is not None:
+        repeated = stats.repeated(n_plus_one_threshold)
+        if repeated:
+            statement, count = repeated[0]
+            raise QueryBudgetExceeded(f"Statement repeated {count} times (N+1?): {statement}")
@@ -0,0 +1,158 @@
+import logging
+import random
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.core.config import settings
+from app.core.logging import redact_url
+from app.core.query_stats import (
+    QueryBudgetExceeded, QueryStats, start_request_stats, end_request_stats
+)
+
+logger = logging.getLogger("app.requests")
+
+
+def get_route_path(request: Request) -> Optional[str]:
+    """Return the templated path of the matched route (e.g. /orders/{order_id})"""
+    route = request.scope.get("route")
+    return getattr(route, "path", None)
+
+
+class RequestSampler:
+    """Decides whether a completed request is written to the access log.
+
+    Server errors and slow requests are always logged; everything else is
+    sampled with the per-route rate, falling back to the default rate.
+    """
+
+    def __init__(
+        self,
+        default_rate: float = 1.0,
+        route_rates: Optional[Dict[str, float]] = None,
+        slow_seconds: float = 1.0
+    ):
+        self.default_rate = default_rate
+        self.route_rates = route_rates or {}
+        self.slow_seconds = slow_seconds
+
+    def should_log(self, route: str, status_code: int, duration: float) -> bool:
+        if status_code >= 500 or duration >= self.slow_seconds:
+            return True
+
+        rate = self.route_rates.get(route, self.default_rate)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        return random.random() < rate
+
+
+sampler = RequestSampler(
+    default_rate=settings.LOG_REQUESTS_SAMPLE_RATE,
+    route_rates=settings.LOG_REQUESTS_ROUTE_SAMPLE_RATES,
+    slow_seconds=settings.LOG_REQUESTS_SLOW_SECONDS
+)
+
+verbose = settings.DEBUG and settings.LOG_REQUESTS_VERBOSE
+
+
+def check_query_stats(stats: QueryStats, method: str, route: str) -> None:
+    """Warn about likely N+1 patterns and enforce per-route query budgets"""
+    if stats.count >= settings.DB_N_PLUS_ONE_THRESHOLD:
+        for statement, count in stats.repeated(settings.DB_N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                "Possible N+1 on %s %s: statement executed %d times",
+                method,
+                route,
+                count,
+                extra={"extra_fields": {"route": route, "statement": statement, "executions": count}}
+            )
+
+    budget = settings.DB_QUERY_BUDGETS.get(f"{method} {route}")
+    if budget is not None and stats.count > budget:
+        message = f"{method} {route} ran {stats.count} queries, budget is {budget}"
+        if settings.DB_QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message, extra={"extra_fields": {"route": route, "db_queries": stats.count}})
+
+
+async def log_requests(request: Request, call_next: Callable) -> Response:
+    request_id = str(uuid.uuid4())
+    start_time = time.perf_counter()
+
+    if verbose and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Request started %s %s",
+            request.method,
+            request.url.path,
+            extra={
+                "extra_fields": {
+                    "request_id": request_id,
+                    "query_params": redact_url(str(request.query_params)),
+                    "client_host": request.client.host if request.client else None,
+                }
+            }
+        )
+
+    stats, stats_token = start_request_stats()
+    try:
+        response = await call_next(request)
+    except Exception:
+        logger.exception(
+            "%s %s failed",
+            request.method,
+            request.url.path,
+            extra={
+                "extra_fields": {
+                    "request_id": request_id,
+                    "duration_ms": round((time.perf_counter() - start_time) * 1000, 2),
+                    "db_queries": stats.count,
+                }
+            }
+        )
+        raise
+    finally:
+        end_request_stats(stats_token)
+
+    duration = time.perf_counter() - start_time
+    response.headers["X-Request-ID"] = request_id
+    if settings.DEBUG:
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Time-Ms"] = str(stats.duration_ms)
+
+    route = get_route_path(request) or request.url.path
+    check_query_stats(stats, request.method, route)
+
+    if not logger.isEnabledFor(logging.INFO):
+        return response
+
+    if not sampler.should_log(route, response.status_code, duration):
+        return response
+
+    fields = {
+        "request_id": request_id,
+        "method": request.method,
+        "route": route,
+        "path": request.url.path,
+        "status_code": response.status_code,
+        "duration_ms": round(duration * 1000, 2),
+        "db_queries": stats.count,
+        "db_time_ms": stats.duration_ms,
+    }
+    if verbose:
+        fields["query_params"] = redact_url(str(request.query_params))
+        fields["client_host"] = request.client.host if request.client else None
+
+    logger.info(
+        "%s %s %s %.1fms",
+        request.method,
+        route,
+        response.status_code,
+        duration * 1000,
+        extra={"extra_fields": fields}
+    )
+
+    return response
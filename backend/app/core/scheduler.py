@@ -0,0 +1,92 @@
+"""Periodic background jobs run in daemon threads.
+
+Jobs are plain callables registered with an interval; each runs in its own
+thread so a slow job never delays another. Every worker process runs its
+own scheduler, so jobs must be safe to run concurrently (use row locks or
+idempotent statements).
+"""
+import logging
+import random
+import threading
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], None],
+        interval_seconds: float,
+        jitter: float = 0.1,
+        initial_delay: Optional[float] = None
+    ):
+        self.name = name
+        self.func = func
+        self.interval_seconds = interval_seconds
+        self.jitter = jitter
+        self.initial_delay = initial_delay
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _next_delay(self) -> float:
+        # Jitter keeps workers started together from running jobs in lockstep
+        return self.interval_seconds * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _run(self) -> None:
+        delay = self.initial_delay if self.initial_delay is not None else self._next_delay()
+        while not self._stop.wait(delay):
+            delay = self._next_delay()
+            try:
+                self.func()
+            except Exception:
+                logger.exception("Scheduled job %s failed", self.name)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"job-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+class Scheduler:
+
+    def __init__(self):
+        self.jobs: Dict[str, PeriodicJob] = {}
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], None],
+        interval_seconds: float,
+        initial_delay: Optional[float] = None
+    ) -> Optional[PeriodicJob]:
+        """Register a job; a non-positive interval disables it. Without an
+        initial_delay the first run happens one interval after start."""
+        if interval_seconds <= 0:
+            return None
+        job = PeriodicJob(name, func, interval_seconds, initial_delay=initial_delay)
+        self.jobs[name] = job
+        return job
+
+    def start(self) -> None:
+        for job in self.jobs.values():
+            job.start()
+        if self.jobs:
+            logger.info("Scheduler started with jobs: %s", ", ".join(self.jobs))
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        for job in self.jobs.values():
+            job.stop(timeout)
+
+
+scheduler = Scheduler()
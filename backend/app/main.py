@@ -1,63 +1,180 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.orm import configure_mappers
 from app.core.config import settings
-from app.core.logging import setup_logging, log_requests
-from app.api.v1 import api_router
+from app.core.logging import setup_logging, shutdown_logging
+from app.core.request_logging import log_requests
+from app.core.metrics import MetricsMiddleware, registry, CONTENT_TYPE_LATEST
+from app.core.compression import CompressionMiddleware
+from app.core.scheduler import scheduler
+from app.core.broker import broker
+from app.core.database import SessionLocal, get_engine
+from app.core.idempotency import IdempotencyMiddleware, purge_expired_idempotency_keys
+from app.services.notification_service import (
+    maintain_notification_partitions, reconcile_notification_counters
+)
+from app.services.outbox_service import OutboxDispatcher
+from app.services.review_service import recompute_user_ratings
+from app.api.responses import ORJSONResponse
+from app.api.v1 import include_api_routers
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
-app = FastAPI(
-    title=settings.APP_NAME,
-    version=settings.APP_VERSION,
-    openapi_url=f"{settings.API_V1_PREFIX}/openapi.json"
-)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+def _warm_up() -> None:
+    """Work deferred from boot that the first requests would otherwise pay for"""
+    get_engine()
+    configure_mappers()
+
+
+def create_app() -> FastAPI:
+    """Build the application.
+
+    Logging handlers are set up here rather than at import, and the database
+    engine, password hashing and the Amazon scraper's HTTP/HTML stack load on
+    first use, so importing ``app.main`` stays cheap and a worker's boot time
+    is mostly route and schema construction. ``benchmarks/profile_imports.py``
+    measures it against a target.
+
+    ``uvicorn app.main:create_app --factory`` builds the app in each worker;
+    ``uvicorn app.main:app`` keeps working through the module ``__getattr__``.
+    """
+    setup_logging()
+
+    app = FastAPI(
+        title=settings.APP_NAME,
+        version=settings.APP_VERSION,
+        openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+        default_response_class=ORJSONResponse
+    )
+
+    if settings.IDEMPOTENCY_ENABLED:
+        # Innermost: CORS, logging and metrics wrap it, so replayed responses
+        # and its own errors still get CORS headers and are logged and measured
+        app.add_middleware(
+            IdempotencyMiddleware,
+            wait_seconds=settings.IDEMPOTENCY_WAIT_SECONDS,
+            max_body_bytes=settings.IDEMPOTENCY_MAX_BODY_BYTES
+        )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.BACKEND_CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    @app.middleware("http")
+    async def add_request_logging(request, call_next):
+        return await log_requests(request, call_next)
+
+    if settings.METRICS_ENABLED:
+        # Long-lived streams would swamp the latency histogram
+        app.add_middleware(
+            MetricsMiddleware,
+            exclude_paths=("/metrics", f"{settings.API_V1_PREFIX}/notifications/stream")
+        )
+
+    if settings.COMPRESSION_ENABLED:
+        # Outermost, so idempotency replays, logs and metrics all deal in
+        # uncompressed bodies
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+            zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+            cache_paths=settings.COMPRESSION_CACHE_PATHS
+        )
+
+    include_api_routers(app, settings.API_V1_PREFIX)
+
+    try:
+        from app.api.routes import auth, shippers, travelers
+        app.include_router(auth.router, prefix="/api/auth", tags=["auth-legacy"])
+        app.include_router(shippers.router, prefix="/api/shippers", tags=["shippers-legacy"])
+        app.include_router(travelers.router, prefix="/api/travelers", tags=["travelers-legacy"])
+    except ImportError:
+        pass
+
+    @app.get("/")
+    async def root():
+        return {
+            "message": f"{settings.APP_NAME} API is running",
+            "version": settings.APP_VERSION,
+            "docs": "/docs",
+            "api_v1": settings.API_V1_PREFIX
+        }
+
+    @app.get("/health")
+    async def health_check():
+
+        return {
+            "status": "healthy",
+            "app": settings.APP_NAME,
+            "version": settings.APP_VERSION
+        }
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        if not settings.METRICS_ENABLED:
+            return Response(status_code=404)
+        return Response(content=registry.render(), media_type=CONTENT_TYPE_LATEST)
+
+    @app.on_event("startup")
+    async def startup_event():
+        logger.info(f"{settings.APP_NAME} starting up...")
+        logger.info(f"Environment: {settings.ENVIRONMENT}")
+        logger.info(f"Debug mode: {settings.DEBUG}")
+        # Off the event loop and without holding up startup, so it's usually
+        # done before the first request needs it
+        asyncio.get_running_loop().run_in_executor(None, _warm_up)
+        broker.start()
+        if settings.SCHEDULER_ENABLED:
+            scheduler.add_job(
+                "reconcile_notification_counters",
+                reconcile_notification_counters,
+                settings.NOTIFICATION_COUNTER_RECONCILE_SECONDS
+            )
+            # Shortly after boot too, so restarts don't postpone it indefinitely
+            scheduler.add_job(
+                "maintain_notification_partitions",
+                maintain_notification_partitions,
+                settings.NOTIFICATION_PARTITION_MAINTENANCE_SECONDS,
+                initial_delay=60
+            )
+            scheduler.add_job("recompute_user_ratings", recompute_user_ratings, settings.RATING_RECOMPUTE_SECONDS)
+            if settings.IDEMPOTENCY_ENABLED:
+                scheduler.add_job(
+                    "purge_expired_idempotency_keys",
+                    purge_expired_idempotency_keys,
+                    settings.IDEMPOTENCY_PURGE_SECONDS
+                )
+            outbox_dispatcher = OutboxDispatcher(
+                SessionLocal,
+                batch_size=settings.OUTBOX_BATCH_SIZE,
+                max_attempts=settings.OUTBOX_MAX_ATTEMPTS
+            )
+            scheduler.add_job("outbox_dispatcher", outbox_dispatcher.run, settings.OUTBOX_POLL_SECONDS)
+            scheduler.start()
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        logger.info(f"{settings.APP_NAME} shutting down...")
+        scheduler.shutdown()
+        broker.stop()
+        shutdown_logging()
+
+    return app
+
 
-@app.middleware("http")
-async def add_request_logging(request, call_next):
-    return await log_requests(request, call_next)
-
-app.include_router(api_router, prefix=settings.API_V1_PREFIX)
-
-try:
-    from app.api.routes import auth, shippers, travelers
-    app.include_router(auth.router, prefix="/api/auth", tags=["auth-legacy"])
-    app.include_router(shippers.router, prefix="/api/shippers", tags=["shippers-legacy"])
-    app.include_router(travelers.router, prefix="/api/travelers", tags=["travelers-legacy"])
-except ImportError:
-    pass
-
-@app.get("/")
-async def root():
-    return {
-        "message": f"{settings.APP_NAME} API is running",
-        "version": settings.APP_VERSION,
-        "docs": "/docs",
-        "api_v1": settings.API_V1_PREFIX
-    }
-
-@app.get("/health")
-async def health_check():
-    
-    return {
-        "status": "healthy",
-        "app": settings.APP_NAME,
-        "version": settings.APP_VERSION
-    }
-
-@app.on_event("startup")
-async def startup_event():
-    logger.info(f"{settings.APP_NAME} starting up...")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.info(f"{settings.APP_NAME} shutting down...")
\ No newline at end of file
+def __getattr__(name: str):
+    # ``app.main:app`` builds the app on first access, once
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
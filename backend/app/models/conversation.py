@@ -2,7 +2,7 @@
 from datetime import datetime
 import enum
 from sqlalchemy import (
-    Column, ForeignKey, Text, DateTime, Boolean, Enum
+    Column, ForeignKey, Text, DateTime, Boolean, Enum, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -32,10 +32,33 @@ class Conversation(BaseModel):
 
     last_message_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Read watermarks: each participant has read every message the other
+    # sent up to and including this created_at
+    shopper_read_up_to = Column(DateTime(timezone=True), nullable=True)
+    traveler_read_up_to = Column(DateTime(timezone=True), nullable=True)
+
     order = relationship("Order")
     shopper = relationship("User", foreign_keys=[shopper_id])
     traveler = relationship("User", foreign_keys=[traveler_id])
-    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan")
+    # Never loaded as a whole; page through history with MessageService
+    messages = relationship(
+        "Message",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        lazy="write_only",
+        passive_deletes=True
+    )
+    
+    __table_args__ = (
+        Index(
+            "ix_conversations_shopper_id_last_message_at", "shopper_id", text("last_message_at DESC"),
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        Index(
+            "ix_conversations_traveler_id_last_message_at", "traveler_id", text("last_message_at DESC"),
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+    )
     
     @property
     def participant_ids(self) -> list:
@@ -46,6 +69,14 @@ class Conversation(BaseModel):
         
         return user_id in self.participant_ids
     
+    def read_watermark_column(self, user_id: UUID) -> str:
+        
+        return "shopper_read_up_to" if user_id == self.shopper_id else "traveler_read_up_to"
+    
+    def read_up_to(self, user_id: UUID):
+        
+        return getattr(self, self.read_watermark_column(user_id))
+    
     def unlock(self):
         
         if not self.is_unlocked:
@@ -87,6 +118,17 @@ class Message(BaseModel):
     conversation = relationship("Conversation", back_populates="messages")
     sender = relationship("User")
     
+    __table_args__ = (
+        Index(
+            "ix_messages_conversation_id_created_at", "conversation_id", text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        Index(
+            "ix_messages_conversation_id_unread", "conversation_id", "sender_id",
+            postgresql_where=text("read_at IS NULL AND deleted_at IS NULL")
+        ),
+    )
+    
     @property
     def is_read(self) -> bool:
         
@@ -0,0 +1,36 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, Index
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from app.core.database import Base
+
+
+class IdempotencyKey(Base):
+    """Response to a write request sent with an Idempotency-Key header,
+    replayed when the client retries with the same key.
+
+    ``status_code`` is NULL while the first request is still running.
+    ``headers`` holds the response headers as [name, value] pairs, minus
+    hop-by-hop headers and Content-Length; NULL on rows stored before it
+    existed, which replay with just ``content_type``.
+    No foreign key to users: rows are short-lived and shouldn't slow down
+    user deletes.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    key = Column(String(255), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    content_type = Column(String(100), nullable=True)
+    headers = Column(JSONB, nullable=True)
+    body = Column(LargeBinary, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+
+    def __repr__(self):
+        return f"<IdempotencyKey(user_id={self.user_id}, key={self.key}, status_code={self.status_code})>"
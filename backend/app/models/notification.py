@@ -1,9 +1,11 @@
 from datetime import datetime
 import enum
-from sqlalchemy import Column, ForeignKey, Text, Boolean, DateTime, Enum, String
+from sqlalchemy import Column, ForeignKey, Text, Boolean, DateTime, Enum, String, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
+from app.core.database import Base
+from app.core.partitioning import uuid7
 
 
 class NotificationType(str, enum.Enum):
@@ -25,6 +27,17 @@ class NotificationType(str, enum.Enum):
 class Notification(BaseModel):
     __tablename__ = "notifications"
 
+    # Range-partitioned by month on created_at, so the partition key is part
+    # of the primary key. Ids are time-ordered (UUIDv7) so a lookup by id can
+    # bound created_at and touch a single partition.
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        default=datetime.utcnow
+    )
+
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     type = Column(
         Enum(NotificationType, values_callable=lambda obj: [e.value for e in obj]), 
@@ -39,6 +52,14 @@ class Notification(BaseModel):
     # Relationships
     user = relationship("User", back_populates="notifications")
     
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+        Index(
+            "ix_notifications_user_id_unread", "user_id", "created_at",
+            postgresql_where=text("is_read = false")
+        ),
+    )
+    
     def mark_as_read(self):
         """Mark notification as read"""
         if not self.is_read:
@@ -46,4 +67,24 @@ class Notification(BaseModel):
             self.read_at = datetime.utcnow()
     
     def __repr__(self):
-        return f"<Notification(user_id={self.user_id}, type={self.type}, is_read={self.is_read})>"
\ No newline at end of file
+        return f"<Notification(user_id={self.user_id}, type={self.type}, is_read={self.is_read})>"
+
+
+class NotificationCounter(Base):
+    """Denormalized unread count per user, maintained by NotificationService in
+    the same transaction as the notification change and periodically
+    reconciled against the notifications table."""
+
+    __tablename__ = "notification_counters"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    unread_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+
+    def __repr__(self):
+        return f"<NotificationCounter(user_id={self.user_id}, unread_count={self.unread_count})>"
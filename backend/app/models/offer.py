@@ -3,7 +3,7 @@ from datetime import date, datetime, timezone
 import enum
 from sqlalchemy import (
     Column, ForeignKey, Text, Date, DateTime, 
-    Enum, CheckConstraint, UniqueConstraint, Numeric
+    Enum, CheckConstraint, UniqueConstraint, Numeric, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -42,6 +42,10 @@ class Offer(BaseModel):
             "proposed_delivery_date >= CURRENT_DATE",
             name="offers_future_delivery"
         ),
+        Index(
+            "ix_offers_traveler_id_status", "traveler_id", "status",
+            postgresql_where=text("deleted_at IS NULL")
+        ),
     )
     
     @property
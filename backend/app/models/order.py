@@ -3,7 +3,7 @@ from datetime import date, datetime
 import enum
 from sqlalchemy import (
     Column, String, Integer, ForeignKey, Text, Date, 
-    Numeric, DateTime, Enum, CheckConstraint, UniqueConstraint
+    Numeric, DateTime, Enum, CheckConstraint, UniqueConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -81,6 +81,23 @@ class Order(BaseModel):
             "deadline_date >= CURRENT_DATE",
             name="orders_future_deadline"
         ),
+        Index(
+            "ix_orders_status_created_at", "status", text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        Index(
+            "ix_orders_destination_country_status_created_at",
+            "destination_country", "status", text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        Index(
+            "ix_orders_shopper_id_created_at", "shopper_id", text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL")
+        ),
+        Index(
+            "ix_orders_matched_traveler_id_created_at", "matched_traveler_id", text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL")
+        ),
     )
     
     @property
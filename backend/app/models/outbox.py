@@ -0,0 +1,22 @@
+from sqlalchemy import Column, BigInteger, DateTime, Identity, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.database import Base
+
+
+class OutboxEvent(Base):
+    """Side effect recorded in the same transaction as the business change
+    and delivered later by the outbox dispatcher (at least once)."""
+
+    __tablename__ = "outbox_events"
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    topic = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    # Database clock, the same one the dispatcher compares available_at with
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    available_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, topic={self.topic}, attempts={self.attempts})>"
@@ -3,7 +3,7 @@ from datetime import datetime
 import enum
 from sqlalchemy import (
     Column, String, Integer, ForeignKey, Boolean, 
-    Numeric, DateTime, Enum, Text
+    Numeric, DateTime, Enum, Text, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -75,8 +75,10 @@ class Transaction(BaseModel):
     currency = Column(String(3), nullable=False, default='USD')
 
     provider = Column(String(50), nullable=False)
-    provider_transaction_id = Column(String(255), nullable=False)
+    provider_transaction_id = Column(String(255), nullable=True)  # None until the provider answers
     provider_response = Column(Text, nullable=True)
+    # Sent with the provider call; retries reuse it so nothing is paid twice
+    idempotency_key = Column(String(64), nullable=True, unique=True)
 
     status = Column(Enum(PaymentStatus, values_callable=lambda obj: [e.value for e in obj]), nullable=False, default=PaymentStatus.PENDING.value)
 
@@ -94,6 +96,14 @@ class Transaction(BaseModel):
         uselist=False
     )
     
+    __table_args__ = (
+        # Payouts a crashed run left pending
+        Index(
+            "ix_transactions_pending_payouts", "created_at",
+            postgresql_where=text("transaction_type = 'traveler_payout' AND status = 'pending'")
+        ),
+    )
+    
     @property
     def is_successful(self) -> bool:
         
@@ -139,6 +149,15 @@ class EscrowHolding(BaseModel):
     transaction = relationship("Transaction", foreign_keys=[transaction_id], back_populates="escrow_holding")
     release_transaction = relationship("Transaction", foreign_keys=[release_transaction_id])
     
+    __table_args__ = (
+        # Holdings still awaiting release, see EscrowRepository.releasable
+        Index(
+            "ix_escrow_holdings_unreleased", "order_id",
+            postgresql_where=text("is_released IS NOT TRUE AND is_disputed IS NOT TRUE AND deleted_at IS NULL")
+        ),
+        Index("ix_escrow_holdings_release_transaction_id", "release_transaction_id"),
+    )
+    
     @property
     def can_be_released(self) -> bool:
         
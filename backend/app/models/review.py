@@ -1,6 +1,6 @@
 
 from sqlalchemy import (
-    Column, ForeignKey, Text, Integer, Boolean, DateTime, CheckConstraint, UniqueConstraint
+    Column, ForeignKey, Text, Integer, Boolean, DateTime, CheckConstraint, UniqueConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
@@ -33,6 +33,11 @@ class Review(BaseModel):
         CheckConstraint("reviewer_role IN ('shopper', 'traveler')", name='reviews_role_check'),
         UniqueConstraint('reviewer_id', 'order_id', name='unique_review_per_order'),
         CheckConstraint('reviewer_id != reviewed_id', name='reviews_no_self_review'),
+        # Public review listings, newest first
+        Index(
+            'ix_reviews_reviewed_id_created_at', 'reviewed_id', text('created_at DESC'), text('id DESC'),
+            postgresql_where=text('deleted_at IS NULL AND is_public')
+        ),
     )
     
     @property
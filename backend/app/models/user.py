@@ -3,7 +3,7 @@ from typing import Optional
 import enum
 from sqlalchemy import (
     Column, String, Boolean, DateTime, Integer, 
-    Numeric, Date, ForeignKey, Text, Enum, CheckConstraint
+    Numeric, Date, ForeignKey, Text, Enum, CheckConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import UUID, INET, JSONB
 from sqlalchemy.orm import relationship
@@ -53,9 +53,12 @@ class User(BaseModel):
     preferred_language = Column(String(5), default='en')
     preferred_currency = Column(String(3), default='USD')
     
+    # *_rating is *_rating_sum / *_review_count, kept in step by UserRepository.adjust_rating
     shopper_rating = Column(Numeric(3, 2), default=0.00)
+    shopper_rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
     shopper_review_count = Column(Integer, default=0)
     traveler_rating = Column(Numeric(3, 2), default=0.00)
+    traveler_rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
     traveler_review_count = Column(Integer, default=0)
     total_orders_as_shopper = Column(Integer, default=0)
     total_orders_as_traveler = Column(Integer, default=0)
@@ -79,6 +82,7 @@ class User(BaseModel):
             "shopper_rating >= 0 AND shopper_rating <= 5 AND traveler_rating >= 0 AND traveler_rating <= 5",
             name="users_rating_check"
         ),
+        Index("ix_users_phone", "phone", postgresql_where=text("deleted_at IS NULL")),
     )
     
     @property
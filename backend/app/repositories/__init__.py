@@ -2,10 +2,18 @@ from app.repositories.base import BaseRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.order_repository import OrderRepository
 from app.repositories.offer_repository import OfferRepository
+from app.repositories.conversation_repository import ConversationRepository, MessageRepository
+from app.repositories.review_repository import ReviewRepository
+from app.repositories.payment_repository import EscrowRepository, TransactionRepository
 
 __all__ = [
     'BaseRepository',
     'UserRepository',
     'OrderRepository',
-    'OfferRepository'
+    'OfferRepository',
+    'ConversationRepository',
+    'MessageRepository',
+    'ReviewRepository',
+    'EscrowRepository',
+    'TransactionRepository'
 ]
\ No newline at end of file
@@ -1,12 +1,74 @@
-from typing import Generic, TypeVar, Type, Optional, List, Dict, Any
-from datetime import datetime
+import csv
+import enum
+import io
+import json
+from typing import Generic, TypeVar, Type, Optional, List, Dict, Any, Iterator, NamedTuple, Sequence
+from datetime import date, datetime
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import Row, and_, or_, desc, asc, cast, column, func, insert, inspect, literal_column, select, update, values
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 from app.models.base import BaseModel
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
+# Rows per statement for the bulk helpers; keeps bind parameters well under
+# the 65535 Postgres allows per statement
+BULK_CHUNK_SIZE = 1000
+COPY_CHUNK_SIZE = 50000
+
+
+# Capped counts stop here; lists show "1,000+" beyond it
+DEFAULT_COUNT_CAP = 1000
+
+
+class CountMode(str, enum.Enum):
+    EXACT = "exact"
+    CAPPED = "capped"
+    ESTIMATE = "estimate"
+
+
+class TotalCount(NamedTuple):
+    value: int
+    # False for planner estimates and for capped counts that hit the cap
+    exact: bool
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _default_value(default: Any) -> Any:
+    """Evaluate a Python-side Column default outside of an INSERT"""
+    return default.arg(None) if default.is_callable else default.arg
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return "\\N"
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
 
 class BaseRepository(Generic[ModelType]):
     
@@ -63,30 +125,85 @@ class BaseRepository(Generic[ModelType]):
         self.db.refresh(db_obj)
         return db_obj
     
+    def _commit_loaded(self, db_obj: ModelType) -> ModelType:
+        """Commit, keeping db_obj's column values loaded rather than expired
+        so reading them afterwards doesn't cost another SELECT"""
+        loaded = {attr.key: getattr(db_obj, attr.key) for attr in inspect(self.model).column_attrs}
+        self.db.commit()
+        for key, value in loaded.items():
+            set_committed_value(db_obj, key, value)
+        return db_obj
+    
+    def _update_returning(self, id: UUID, changes: Dict[str, Any], *criteria) -> Optional[ModelType]:
+        table = self.model.__table__
+        changes = {key: value for key, value in changes.items() if key in table.c}
+        # The database's clock, and read back from RETURNING:
+        # populate_existing overwrites an instance already in the session
+        # instead of keeping its stale (or client-side, naive) values
+        changes['updated_at'] = func.now()
+        stmt = update(self.model)\
+            .where(self.model.id == id, *criteria)\
+            .values(changes)\
+            .returning(self.model)\
+            .execution_options(populate_existing=True)
+        db_obj = self.db.scalars(stmt).first()
+        if db_obj is None:
+            return None
+        return self._commit_loaded(db_obj)
+    
+    def update_returning(self, id: UUID, **kwargs) -> Optional[ModelType]:
+        """Like update(), in one UPDATE ... RETURNING instead of a SELECT,
+        the UPDATE and a refresh. None if the row is missing or soft-deleted."""
+        return self._update_returning(id, kwargs, self.model.deleted_at.is_(None))
+    
+    def soft_delete_returning(self, id: UUID) -> Optional[ModelType]:
+        """Soft-delete a live row in one statement; None if there was none"""
+        return self._update_returning(id, {'deleted_at': func.now()}, self.model.deleted_at.is_(None))
+    
+    def soft_delete(self, id: UUID) -> bool:
+        """Soft-delete a live row; False if it is missing or already deleted"""
+        return bool(self.soft_delete_many([id]))
+    
+    def soft_delete_many(self, ids: Sequence[UUID], chunk_size: int = BULK_CHUNK_SIZE) -> List[UUID]:
+        """Soft-delete live rows with one UPDATE ... RETURNING id per chunk,
+        in one transaction. Returns the ids that were actually deleted."""
+        now = func.now()
+        deleted = []
+        for chunk in _chunks(list(ids), chunk_size):
+            stmt = update(self.model)\
+                .where(self.model.id.in_(chunk), self.model.deleted_at.is_(None))\
+                .values(deleted_at=now, updated_at=now)\
+                .returning(self.model.id)\
+                .execution_options(synchronize_session="fetch")
+            deleted.extend(self.db.scalars(stmt).all())
+        self.db.commit()
+        return deleted
+    
     def delete(self, id: UUID, hard_delete: bool = False) -> bool:
+        if not hard_delete:
+            return self.soft_delete_returning(id) is not None
+        
         db_obj = self.get(id, include_deleted=True)
         if not db_obj:
             return False
         
-        if hard_delete:
-            self.db.delete(db_obj)
-        else:
-            db_obj.soft_delete()
-        
+        self.db.delete(db_obj)
         self.db.commit()
         return True
     
     def restore(self, id: UUID) -> Optional[ModelType]:
-        db_obj = self.get(id, include_deleted=True)
-        if not db_obj or not db_obj.is_deleted:
-            return None
-        
-        db_obj.restore()
-        self.db.commit()
-        self.db.refresh(db_obj)
-        return db_obj
+        return self._update_returning(id, {'deleted_at': None}, self.model.deleted_at.isnot(None))
     
     def count(self, include_deleted: bool = False, **filters) -> int:
+        return self.count_total(CountMode.EXACT, include_deleted=include_deleted, **filters).value
+    
+    def count_total(
+        self,
+        mode: CountMode = CountMode.EXACT,
+        cap: int = DEFAULT_COUNT_CAP,
+        include_deleted: bool = False,
+        **filters
+    ) -> TotalCount:
         query = self.db.query(self.model)
         
         if not include_deleted:
@@ -96,11 +213,43 @@ class BaseRepository(Generic[ModelType]):
             if hasattr(self.model, key):
                 query = query.filter(getattr(self.model, key) == value)
         
-        return query.count()
+        return self.count_query(query, mode, cap)
+    
+    def count_query(self, query: Query, mode: CountMode = CountMode.EXACT, cap: int = DEFAULT_COUNT_CAP) -> TotalCount:
+        """Count the rows a filter-only ``query`` matches, ignoring its
+        ordering and eager loads. The query must not have a limit, offset,
+        DISTINCT or GROUP BY.
+        
+        EXACT counts every row. CAPPED stops after ``cap`` + 1 rows, so the
+        cost is bounded however many match. ESTIMATE returns the planner's
+        row estimate from EXPLAIN without running the query; it is only as
+        good as the table statistics.
+        """
+        query = query.enable_eagerloads(False).order_by(None)
+        if mode == CountMode.ESTIMATE:
+            plan = self.db.execute(_Explain(query.statement)).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return TotalCount(int(plan[0]["Plan"]["Plan Rows"]), False)
+        
+        if mode == CountMode.CAPPED:
+            limited = query.with_entities(literal_column("1")).limit(cap + 1).subquery()
+            value = self.db.execute(select(func.count()).select_from(limited)).scalar()
+            return TotalCount(min(value, cap), value <= cap)
+        
+        # count(*) directly rather than Query.count()'s count over a subquery
+        return TotalCount(query.with_entities(func.count()).scalar(), True)
     
     def exists(self, id: UUID, include_deleted: bool = False) -> bool:
         return self.get(id, include_deleted) is not None
     
+    def project(self, query: Query, columns: Optional[Sequence[str]] = None) -> Query:
+        """Select only ``columns`` (attribute names) of the model; the query
+        then yields rows instead of instances"""
+        if not columns:
+            return query
+        return query.with_entities(*(getattr(self.model, name) for name in columns))
+    
     def filter(
         self,
         skip: int = 0,
@@ -108,6 +257,7 @@ class BaseRepository(Generic[ModelType]):
         include_deleted: bool = False,
         order_by: str = None,
         order_desc: bool = True,
+        columns: Optional[Sequence[str]] = None,
         **filters
     ) -> List[ModelType]:
         query = self.db.query(self.model)
@@ -143,19 +293,103 @@ class BaseRepository(Generic[ModelType]):
         else:
             query = query.order_by(desc(self.model.created_at))
         
-        return query.offset(skip).limit(limit).all()
+        return self.project(query, columns).offset(skip).limit(limit).all()
     
-    def bulk_create(self, objects: List[Dict[str, Any]]) -> List[ModelType]:
-        db_objs = [self.model(**obj) for obj in objects]
-        self.db.add_all(db_objs)
+    def bulk_create(self, objects: List[Dict[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> List[ModelType]:
+        """Insert with multi-row INSERT ... RETURNING, one transaction.
+        Instances expire on commit like any other; use bulk_insert when
+        only a few columns (e.g. ids) are needed afterwards."""
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        db_objs = []
+        for chunk in _chunks(objects, chunk_size):
+            db_objs.extend(self.db.scalars(stmt, list(chunk)).all())
         self.db.commit()
         return db_objs
     
-    def bulk_update(self, updates: List[Dict[str, Any]]) -> int:
+    def bulk_insert(
+        self,
+        objects: List[Dict[str, Any]],
+        returning: Sequence[str] = (),
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> List[Row]:
+        """Insert with multi-row INSERTs, one transaction. Returns rows of
+        the ``returning`` columns in input order, or [] when none are asked."""
+        table = self.model.__table__
+        rows = []
+        for chunk in _chunks(objects, chunk_size):
+            if returning:
+                stmt = insert(table).returning(
+                    *(table.c[name] for name in returning), sort_by_parameter_order=True
+                )
+                rows.extend(self.db.execute(stmt, list(chunk)).all())
+            else:
+                self.db.execute(insert(table), list(chunk))
+        self.db.commit()
+        return rows
+    
+    def copy_insert(self, objects: List[Dict[str, Any]], chunk_size: int = COPY_CHUNK_SIZE) -> int:
+        """Load rows with COPY ... FROM STDIN, one transaction; the fastest
+        path for large imports. Every object must have the same keys;
+        Python-side column defaults (id, timestamps) are filled in here."""
+        if not objects:
+            return 0
+        table = self.model.__table__
+        keys = set(objects[0])
+        if any(set(obj) != keys for obj in objects):
+            raise ValueError("copy_insert needs the same keys in every object")
+        
+        defaults = {
+            col.name: col.default for col in table.columns
+            if col.name not in keys and col.default is not None
+            and (col.default.is_scalar or col.default.is_callable)
+        }
+        columns = [col.name for col in table.columns if col.name in keys or col.name in defaults]
+        quoted = ", ".join(f'"{name}"' for name in columns)
+        sql = f"""COPY "{table.name}" ({quoted}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"""
+        
+        cursor = self.db.connection().connection.cursor()
+        try:
+            for chunk in _chunks(objects, chunk_size):
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for obj in chunk:
+                    writer.writerow([
+                        _copy_value(obj[name] if name in keys else _default_value(defaults[name]))
+                        for name in columns
+                    ])
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+        finally:
+            cursor.close()
+        self.db.commit()
+        return len(objects)
+    
+    def bulk_update(self, updates: List[Dict[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """Apply per-row changes with UPDATE ... FROM (VALUES ...), one
+        statement per chunk of rows sharing the same keys and one
+        transaction. Each dict carries ``id``; soft-deleted rows are skipped.
+        Returns the number of rows updated."""
+        table = self.model.__table__
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        for item in updates:
+            if 'id' not in item:
+                continue
+            keys = tuple(sorted(key for key in item if key != 'id' and key in table.c))
+            if keys:
+                groups.setdefault(keys, []).append(item)
+        
         updated_count = 0
-        for update in updates:
-            if 'id' in update:
-                id = update.pop('id')
-                if self.update(id, **update):
-                    updated_count += 1
+        for keys, items in groups.items():
+            for chunk in _chunks(items, chunk_size):
+                data = values(
+                    column('id', table.c.id.type),
+                    *(column(key, table.c[key].type) for key in keys),
+                    name='v'
+                ).data([(item['id'], *(item[key] for key in keys)) for item in chunk])
+                # VALUES columns come through untyped; cast back to the column type
+                stmt = update(table)\
+                    .where(table.c.id == data.c.id, table.c.deleted_at.is_(None))\
+                    .values({key: cast(data.c[key], table.c[key].type) for key in keys})
+                updated_count += self.db.execute(stmt).rowcount
+        self.db.commit()
         return updated_count
\ No newline at end of file
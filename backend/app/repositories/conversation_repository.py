@@ -0,0 +1,184 @@
+from typing import Optional, List, Tuple
+from uuid import UUID
+from datetime import datetime
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import Row, case, func, literal, or_, select, true, tuple_, update
+from app.models.conversation import Conversation, Message
+from app.models.user import User
+from app.repositories.base import BaseRepository
+
+
+class ConversationRepository(BaseRepository[Conversation]):
+    
+    def __init__(self, db: Session):
+        super().__init__(Conversation, db)
+    
+    def get_by_order(self, order_id: UUID) -> Optional[Conversation]:
+        return self.db.query(Conversation).filter(
+            Conversation.order_id == order_id,
+            Conversation.deleted_at.is_(None)
+        ).first()
+    
+    def get_for_update(self, conversation_id: UUID) -> Optional[Conversation]:
+        """A live conversation with its row locked until commit, reloaded
+        even if it is already in the session"""
+        return self.db.query(Conversation).filter(
+            Conversation.id == conversation_id,
+            Conversation.deleted_at.is_(None)
+        ).with_for_update().populate_existing().first()
+    
+    def touch_last_message(self, conversation_id: UUID) -> datetime:
+        """Stamp a new message: move last_message_at forward to the database
+        clock and return it, as the message's created_at. Does not commit.
+        
+        The UPDATE holds the conversation row lock until commit, and read
+        receipts take the same lock (get_for_update) before picking their
+        watermark. So a message is either committed, and visible to the
+        receipt, or stamped after the receipt's watermark, never in between.
+        """
+        return self.db.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(
+                # GREATEST skips NULL; never backwards if the clock steps back
+                last_message_at=func.greatest(Conversation.last_message_at, func.clock_timestamp()),
+                updated_at=func.now()
+            )
+            .returning(Conversation.last_message_at)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
+    
+    def advance_read_watermark(self, conversation_id: UUID, column: str, up_to: datetime) -> datetime:
+        """Move a participant's read watermark forward to ``up_to`` (never
+        backwards) and return the stored value. Does not commit."""
+        watermark = getattr(Conversation, column)
+        return self.db.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values({column: func.greatest(func.coalesce(watermark, up_to), up_to)})
+            .returning(watermark)
+            .execution_options(synchronize_session=False)
+        ).scalar_one()
+    
+    def get_inbox(self, user_id: UUID, skip: int = 0, limit: int = 20) -> List[Row]:
+        """The user's conversations, most recent activity first, each with
+        its last message, the other participant and the number of messages
+        the user hasn't read, in one query. Unread messages are the ones
+        after the user's read watermark, an index range rather than a scan.
+        
+        Rows carry ``Conversation``, ``counterpart_id``, ``counterpart_name``,
+        ``unread_count`` and ``last_message_*`` columns (NULL when the
+        conversation has no messages yet).
+        """
+        counterpart = aliased(User)
+        counterpart_id = case(
+            (Conversation.shopper_id == user_id, Conversation.traveler_id),
+            else_=Conversation.shopper_id
+        )
+        
+        last_message = select(
+            Message.id.label("last_message_id"),
+            Message.sender_id.label("last_message_sender_id"),
+            Message.message_type.label("last_message_type"),
+            Message.content.label("last_message_content"),
+            Message.filtered_content.label("last_message_filtered_content"),
+            Message.is_blocked.label("last_message_is_blocked"),
+            Message.created_at.label("last_message_created_at")
+        ).where(
+            Message.conversation_id == Conversation.id,
+            Message.deleted_at.is_(None)
+        ).order_by(
+            Message.created_at.desc(), Message.id.desc()
+        ).limit(1).lateral("last_message")
+        
+        read_up_to = case(
+            (Conversation.shopper_id == user_id, Conversation.shopper_read_up_to),
+            else_=Conversation.traveler_read_up_to
+        )
+        
+        unread_count = select(func.count()).where(
+            Message.conversation_id == Conversation.id,
+            or_(read_up_to.is_(None), Message.created_at > read_up_to),
+            Message.sender_id != user_id,
+            Message.deleted_at.is_(None)
+        ).scalar_subquery()
+        
+        stmt = select(
+            Conversation,
+            counterpart_id.label("counterpart_id"),
+            (counterpart.first_name + literal(" ") + counterpart.last_name).label("counterpart_name"),
+            unread_count.label("unread_count"),
+            *last_message.c
+        ).join(
+            counterpart, counterpart.id == counterpart_id
+        ).outerjoin(
+            last_message, true()
+        ).where(
+            or_(Conversation.shopper_id == user_id, Conversation.traveler_id == user_id),
+            Conversation.deleted_at.is_(None)
+        ).order_by(
+            Conversation.last_message_at.desc().nulls_last(), Conversation.id
+        ).offset(skip).limit(limit)
+        
+        return self.db.execute(stmt).all()
+
+
+class MessageRepository(BaseRepository[Message]):
+    
+    def __init__(self, db: Session):
+        super().__init__(Message, db)
+    
+    def get_page(
+        self,
+        conversation_id: UUID,
+        before: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50
+    ) -> List[Message]:
+        """Newest-first page of a conversation, strictly older than the
+        ``before`` (created_at, id) cursor. Fetches one extra row so the
+        caller can tell whether another page follows."""
+        query = self.db.query(Message).filter(
+            Message.conversation_id == conversation_id,
+            Message.deleted_at.is_(None)
+        )
+        
+        if before is not None:
+            query = query.filter(tuple_(Message.created_at, Message.id) < tuple_(*before))
+        
+        return query.order_by(Message.created_at.desc(), Message.id.desc())\
+                   .limit(limit + 1)\
+                   .all()
+    
+    def get_created_at(self, conversation_id: UUID, message_id: UUID) -> Optional[datetime]:
+        return self.db.execute(
+            select(Message.created_at).where(
+                Message.id == message_id,
+                Message.conversation_id == conversation_id,
+                Message.deleted_at.is_(None)
+            )
+        ).scalar_one_or_none()
+    
+    def get_latest_created_at(self, conversation_id: UUID) -> Optional[datetime]:
+        return self.db.execute(
+            select(Message.created_at).where(
+                Message.conversation_id == conversation_id,
+                Message.deleted_at.is_(None)
+            ).order_by(Message.created_at.desc()).limit(1)
+        ).scalar_one_or_none()
+    
+    def mark_read_up_to(self, conversation_id: UUID, reader_id: UUID, up_to: datetime) -> int:
+        """Stamp read_at on every unread message the other participant sent
+        up to ``up_to``, in one UPDATE. Returns the number marked; does not
+        commit."""
+        return self.db.execute(
+            update(Message)
+            .where(
+                Message.conversation_id == conversation_id,
+                Message.sender_id != reader_id,
+                Message.read_at.is_(None),
+                Message.deleted_at.is_(None),
+                Message.created_at <= up_to
+            )
+            .values(read_at=func.now(), updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        ).rowcount
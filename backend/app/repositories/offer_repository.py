@@ -20,7 +20,8 @@ class OfferRepository(BaseRepository[Offer]):
         limit: int = 100
     ) -> List[Offer]:
         query = self.db.query(Offer).filter(
-            Offer.order_id == order_id
+            Offer.order_id == order_id,
+            Offer.deleted_at.is_(None)
         )
         
         if status:
@@ -36,7 +37,8 @@ class OfferRepository(BaseRepository[Offer]):
         limit: int = 100
     ) -> List[Offer]:
         query = self.db.query(Offer).filter(
-            Offer.traveler_id == traveler_id
+            Offer.traveler_id == traveler_id,
+            Offer.deleted_at.is_(None)
         )
         
         if status:
@@ -61,6 +63,7 @@ class OfferRepository(BaseRepository[Offer]):
             and_(
                 Offer.order_id == order_id,
                 Offer.status == OfferStatus.ACTIVE,
+                Offer.deleted_at.is_(None),
                 or_(
                     Offer.expires_at.is_(None),
                     Offer.expires_at > datetime.utcnow()
@@ -72,6 +75,7 @@ class OfferRepository(BaseRepository[Offer]):
         return self.db.query(Offer).filter(
             and_(
                 Offer.status == OfferStatus.ACTIVE,
+                Offer.deleted_at.is_(None),
                 Offer.expires_at.isnot(None),
                 Offer.expires_at <= datetime.utcnow()
             )
@@ -83,7 +87,8 @@ class OfferRepository(BaseRepository[Offer]):
         status: Optional[OfferStatus] = None
     ) -> int:
         query = self.db.query(Offer).filter(
-            Offer.order_id == order_id
+            Offer.order_id == order_id,
+            Offer.deleted_at.is_(None)
         )
         
         if status:
@@ -97,7 +102,8 @@ class OfferRepository(BaseRepository[Offer]):
         status: Optional[OfferStatus] = None
     ) -> int:
         query = self.db.query(Offer).filter(
-            Offer.traveler_id == traveler_id
+            Offer.traveler_id == traveler_id,
+            Offer.deleted_at.is_(None)
         )
         
         if status:
@@ -111,6 +117,7 @@ class OfferRepository(BaseRepository[Offer]):
                 Offer.order_id == order_id,
                 Offer.traveler_id == traveler_id,
                 Offer.status == OfferStatus.ACTIVE,
+                Offer.deleted_at.is_(None),
                 or_(
                     Offer.expires_at.is_(None),
                     Offer.expires_at > datetime.utcnow()
@@ -1,9 +1,10 @@
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from uuid import UUID
 from datetime import date
-from sqlalchemy.orm import Session
+from sqlalchemy import desc
+from sqlalchemy.orm import Session, joinedload
 from app.models.order import Order, OrderStatus
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, CountMode, DEFAULT_COUNT_CAP, TotalCount
 
 
 class OrderRepository(BaseRepository[Order]):
@@ -16,20 +17,20 @@ class OrderRepository(BaseRepository[Order]):
         user_id: UUID,
         as_shopper: bool = True,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        status: OrderStatus = None,
+        columns: Optional[Sequence[str]] = None
     ) -> List[Order]:
+        filters = {}
         if as_shopper:
-            return self.filter(
-                skip=skip,
-                limit=limit,
-                shopper_id=user_id
-            )
+            filters['shopper_id'] = user_id
         else:
-            return self.filter(
-                skip=skip,
-                limit=limit,
-                matched_traveler_id=user_id
-            )
+            filters['matched_traveler_id'] = user_id
+        
+        if status:
+            filters['status'] = status
+        
+        return self.filter(skip=skip, limit=limit, columns=columns, **filters)
     
     def get_active_orders(
         self,
@@ -37,15 +38,17 @@ class OrderRepository(BaseRepository[Order]):
         skip: int = 0,
         limit: int = 100
     ) -> List[Order]:
-        filters = {'status': OrderStatus.ACTIVE.value}
+        query = self.db.query(Order).options(
+            joinedload(Order.destination_city),
+            joinedload(Order.shopper)
+        ).filter(
+            Order.deleted_at.is_(None),
+            Order.status == OrderStatus.ACTIVE
+        )
         if destination_country:
-            filters['destination_country'] = destination_country
+            query = query.filter(Order.destination_country == destination_country)
         
-        return self.filter(
-            skip=skip,
-            limit=limit,
-            **filters
-        )
+        return query.order_by(desc(Order.created_at)).offset(skip).limit(limit).all()
     
     def get_orders_by_status(
         self,
@@ -129,8 +132,10 @@ class OrderRepository(BaseRepository[Order]):
         self,
         user_id: UUID,
         as_shopper: bool = True,
-        status: OrderStatus = None
-    ) -> int:
+        status: OrderStatus = None,
+        mode: CountMode = CountMode.EXACT,
+        cap: int = DEFAULT_COUNT_CAP
+    ) -> TotalCount:
         filters = {}
         if as_shopper:
             filters['shopper_id'] = user_id
@@ -140,4 +145,4 @@ class OrderRepository(BaseRepository[Order]):
         if status:
             filters['status'] = status
         
-        return self.count(**filters)
\ No newline at end of file
+        return self.count_total(mode, cap, **filters)
\ No newline at end of file
@@ -0,0 +1,152 @@
+import uuid
+from typing import Optional, List, Dict, Any, Sequence
+from uuid import UUID
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import Row, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from app.models.order import Order, OrderStatus
+from app.models.payment import EscrowHolding, PaymentStatus, Transaction, TransactionType
+from app.repositories.base import BaseRepository
+
+
+class EscrowRepository(BaseRepository[EscrowHolding]):
+    
+    def __init__(self, db: Session):
+        super().__init__(EscrowHolding, db)
+    
+    def _releasable(self, traveler_ids: Optional[Sequence[UUID]] = None) -> list:
+        """Set-based EscrowHolding.can_be_released, over holdings joined to
+        their orders"""
+        criteria = [
+            EscrowHolding.is_released.isnot(True),
+            EscrowHolding.is_disputed.isnot(True),
+            EscrowHolding.deleted_at.is_(None),
+            Order.status == OrderStatus.DELIVERED,
+            Order.matched_traveler_id.isnot(None)
+        ]
+        if traveler_ids is not None:
+            criteria.append(Order.matched_traveler_id.in_(traveler_ids))
+        return criteria
+    
+    def get_releasable_balances(
+        self,
+        traveler_ids: Optional[Sequence[UUID]] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Row]:
+        """Per traveler and currency: ``holdings`` and the ``amount`` that
+        can be paid out now, in one aggregate query"""
+        stmt = select(
+            Order.matched_traveler_id.label("traveler_id"),
+            EscrowHolding.currency,
+            func.count().label("holdings"),
+            func.sum(EscrowHolding.traveler_payout).label("amount")
+        ).join(
+            Order, Order.id == EscrowHolding.order_id
+        ).where(
+            *self._releasable(traveler_ids)
+        ).group_by(
+            Order.matched_traveler_id, EscrowHolding.currency
+        ).order_by(
+            Order.matched_traveler_id, EscrowHolding.currency
+        ).offset(skip).limit(limit)
+        
+        return self.db.execute(stmt).all()
+    
+    def get_releasable_traveler_ids(self) -> List[UUID]:
+        stmt = select(Order.matched_traveler_id).distinct().join(
+            EscrowHolding, EscrowHolding.order_id == Order.id
+        ).where(
+            *self._releasable()
+        ).order_by(Order.matched_traveler_id)
+        
+        return self.db.execute(stmt).scalars().all()
+    
+    def lock_releasable(self, traveler_ids: Sequence[UUID]) -> List[Row]:
+        """Lock the travelers' releasable holdings for this transaction.
+        Holdings another payout run already holds are skipped."""
+        stmt = select(
+            EscrowHolding.id,
+            Order.matched_traveler_id.label("traveler_id"),
+            EscrowHolding.currency,
+            EscrowHolding.traveler_payout
+        ).join(
+            Order, Order.id == EscrowHolding.order_id
+        ).where(
+            *self._releasable(traveler_ids)
+        ).order_by(EscrowHolding.id).with_for_update(of=EscrowHolding, skip_locked=True)
+        
+        return self.db.execute(stmt).all()
+    
+    def unrelease(self, transaction_ids: Sequence[UUID]) -> int:
+        """Put the holdings of failed payouts back up for release. Does not
+        commit."""
+        return self.db.execute(
+            update(EscrowHolding)
+            .where(EscrowHolding.release_transaction_id.in_(transaction_ids))
+            .values(is_released=False, released_at=None, release_transaction_id=None, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+
+class TransactionRepository(BaseRepository[Transaction]):
+    
+    def __init__(self, db: Session):
+        super().__init__(Transaction, db)
+    
+    def is_order_paid(self, order_id: UUID) -> bool:
+        """Whether the shopper's payment for an order was captured or is
+        held in escrow"""
+        captured = select(Transaction.id).where(
+            Transaction.order_id == order_id,
+            Transaction.transaction_type == TransactionType.ORDER_PAYMENT,
+            Transaction.status == PaymentStatus.CAPTURED,
+            Transaction.deleted_at.is_(None)
+        ).exists()
+        held = select(EscrowHolding.id).where(
+            EscrowHolding.order_id == order_id,
+            EscrowHolding.deleted_at.is_(None)
+        ).exists()
+        return self.db.scalar(select(or_(captured, held)))
+    
+    def upsert_payouts(self, payouts: List[Dict[str, Any]]) -> Dict[str, UUID]:
+        """Insert pending payout transactions in one statement, keyed by
+        idempotency_key. A key that already failed is reset to pending and
+        reused; one that didn't fail is left alone and missing from the
+        returned key -> id map. Does not commit."""
+        if not payouts:
+            return {}
+        
+        now = datetime.utcnow()
+        stmt = insert(Transaction).values([
+            {
+                "id": uuid.uuid4(),
+                "transaction_type": TransactionType.TRAVELER_PAYOUT.value,
+                "status": PaymentStatus.PENDING.value,
+                "created_at": now,
+                "updated_at": now,
+                **payout
+            }
+            for payout in payouts
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Transaction.idempotency_key],
+            set_={
+                "status": PaymentStatus.PENDING.value,
+                "failed_at": None,
+                "failure_reason": None,
+                "updated_at": now
+            },
+            where=Transaction.status == PaymentStatus.FAILED
+        ).returning(Transaction.idempotency_key, Transaction.id)
+        
+        return dict(self.db.execute(stmt).all())
+    
+    def get_pending_payouts(self, updated_before: datetime) -> List[Transaction]:
+        return self.db.query(Transaction).filter(
+            Transaction.transaction_type == TransactionType.TRAVELER_PAYOUT,
+            Transaction.status == PaymentStatus.PENDING,
+            Transaction.updated_at < updated_before,
+            Transaction.deleted_at.is_(None)
+        ).order_by(Transaction.created_at).all()
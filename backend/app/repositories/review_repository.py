@@ -0,0 +1,60 @@
+from typing import Optional, List, Tuple
+from uuid import UUID
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import Row, func, tuple_, update
+from app.models.review import Review
+from app.repositories.base import BaseRepository
+
+
+class ReviewRepository(BaseRepository[Review]):
+    
+    def __init__(self, db: Session):
+        super().__init__(Review, db)
+    
+    def get_by_order_and_reviewer(self, order_id: UUID, reviewer_id: UUID) -> Optional[Review]:
+        return self.db.query(Review).filter(
+            Review.order_id == order_id,
+            Review.reviewer_id == reviewer_id
+        ).first()
+    
+    def get_public_page(
+        self,
+        reviewed_id: UUID,
+        reviewer_role: Optional[str] = None,
+        before: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20
+    ) -> List[Review]:
+        """Newest-first public reviews of a user, strictly older than the
+        ``before`` (created_at, id) cursor. Fetches one extra row so the
+        caller can tell whether another page follows."""
+        query = self.db.query(Review).filter(
+            Review.reviewed_id == reviewed_id,
+            Review.is_public.is_(True),
+            Review.deleted_at.is_(None)
+        )
+        
+        if reviewer_role:
+            query = query.filter(Review.reviewer_role == reviewer_role)
+        
+        if before is not None:
+            query = query.filter(tuple_(Review.created_at, Review.id) < tuple_(*before))
+        
+        return query.order_by(Review.created_at.desc(), Review.id.desc())\
+                   .limit(limit + 1)\
+                   .all()
+    
+    def soft_delete_by_reviewer(self, review_id: UUID, reviewer_id: UUID) -> Optional[Row]:
+        """Soft-delete the reviewer's own live review, returning what the
+        rating aggregates need to take it back out. Does not commit."""
+        return self.db.execute(
+            update(Review)
+            .where(
+                Review.id == review_id,
+                Review.reviewer_id == reviewer_id,
+                Review.deleted_at.is_(None)
+            )
+            .values(deleted_at=func.now(), updated_at=func.now())
+            .returning(Review.reviewed_id, Review.reviewer_role, Review.rating, Review.is_public)
+            .execution_options(synchronize_session=False)
+        ).first()
@@ -1,10 +1,17 @@
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from uuid import UUID
+from sqlalchemy import Numeric, and_, cast, func, or_, select, update
 from sqlalchemy.orm import Session
+from app.models.review import Review
 from app.models.user import User, UserRole, UserStatus
 from app.repositories.base import BaseRepository
 
 
+def _average(rating_sum, review_count):
+    """SQL expression for the 2-decimal average the rating columns store"""
+    return func.coalesce(func.round(cast(rating_sum, Numeric) / func.nullif(review_count, 0), 2), 0)
+
+
 class UserRepository(BaseRepository[User]):
     
     def __init__(self, db: Session):
@@ -22,24 +29,46 @@ class UserRepository(BaseRepository[User]):
             User.deleted_at.is_(None)
         ).first()
     
-    def get_active_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+    def get_active_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[User]:
         return self.filter(
             skip=skip,
             limit=limit,
+            columns=columns,
             status=UserStatus.ACTIVE
         )
     
-    def get_shoppers(self, skip: int = 0, limit: int = 100) -> List[User]:
-        return self.db.query(User).filter(
+    def get_active_user_ids(self, user_ids: Optional[List[UUID]] = None) -> List[UUID]:
+        query = self.db.query(User.id).filter(
+            User.status == UserStatus.ACTIVE,
+            User.deleted_at.is_(None)
+        )
+        if user_ids is not None:
+            query = query.filter(User.id.in_(user_ids))
+        return [row.id for row in query]
+    
+    def get_shoppers(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[User]:
+        query = self.db.query(User).filter(
             User.role.in_([UserRole.SHOPPER, UserRole.BOTH]),
             User.deleted_at.is_(None)
-        ).offset(skip).limit(limit).all()
+        )
+        return self.project(query, columns).offset(skip).limit(limit).all()
     
     def get_travelers(
         self, 
         skip: int = 0, 
         limit: int = 100,
-        verified_only: bool = False
+        verified_only: bool = False,
+        columns: Optional[Sequence[str]] = None
     ) -> List[User]:
         query = self.db.query(User).filter(
             User.role.in_([UserRole.TRAVELER, UserRole.BOTH]),
@@ -52,7 +81,7 @@ class UserRepository(BaseRepository[User]):
                 User.status == UserStatus.ACTIVE
             )
         
-        return query.offset(skip).limit(limit).all()
+        return self.project(query, columns).offset(skip).limit(limit).all()
     
     def email_exists(self, email: str, exclude_id: UUID = None) -> bool:
         query = self.db.query(User).filter(
@@ -98,42 +127,88 @@ class UserRepository(BaseRepository[User]):
             return self.update(user_id, **updates)
         return self.get(user_id)
     
-    def update_ratings(
+    def adjust_rating(
         self,
         user_id: UUID,
         as_shopper: bool,
-        new_rating: float,
-        increment_count: bool = True
-    ) -> Optional[User]:
-        user = self.get(user_id)
-        if not user:
-            return None
+        rating_delta: int,
+        count_delta: int = 1
+    ) -> bool:
+        """Add a rating to (or, with negative deltas, remove one from) the
+        user's shopper or traveler aggregate in a single UPDATE, so
+        concurrent reviews serialize on the row lock instead of overwriting
+        each other. Does not commit."""
+        role = "shopper" if as_shopper else "traveler"
+        rating_sum = getattr(User, f"{role}_rating_sum") + rating_delta
+        review_count = func.coalesce(getattr(User, f"{role}_review_count"), 0) + count_delta
         
-        if as_shopper:
-            total_rating = user.shopper_rating * user.shopper_review_count
-            new_count = user.shopper_review_count + (1 if increment_count else 0)
-            if new_count > 0:
-                user.shopper_rating = (total_rating + new_rating) / new_count
-            user.shopper_review_count = new_count
-        else:
-            total_rating = user.traveler_rating * user.traveler_review_count
-            new_count = user.traveler_review_count + (1 if increment_count else 0)
-            if new_count > 0:
-                user.traveler_rating = (total_rating + new_rating) / new_count
-            user.traveler_review_count = new_count
+        result = self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values({
+                f"{role}_rating_sum": rating_sum,
+                f"{role}_review_count": review_count,
+                f"{role}_rating": _average(rating_sum, review_count),
+                "updated_at": func.now()
+            })
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+    
+    def recompute_ratings(self, user_ids: Sequence[UUID]) -> int:
+        """Rebuild the rating aggregates of ``user_ids`` from their public
+        reviews. Returns the number of users whose stored values were off;
+        callers lock the rows first so no adjust_rating lands in between.
+        Does not commit."""
+        # Travelers review shoppers and vice versa
+        as_shopper = Review.reviewer_role == "traveler"
+        as_traveler = Review.reviewer_role == "shopper"
+        totals = select(
+            User.id.label("user_id"),
+            func.coalesce(func.sum(Review.rating).filter(as_shopper), 0).label("shopper_sum"),
+            func.count(Review.id).filter(as_shopper).label("shopper_count"),
+            func.coalesce(func.sum(Review.rating).filter(as_traveler), 0).label("traveler_sum"),
+            func.count(Review.id).filter(as_traveler).label("traveler_count")
+        ).outerjoin(
+            Review,
+            and_(Review.reviewed_id == User.id, Review.deleted_at.is_(None), Review.is_public.is_(True))
+        ).where(
+            User.id.in_(user_ids)
+        ).group_by(User.id).subquery()
         
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        result = self.db.execute(
+            update(User)
+            .where(
+                User.id == totals.c.user_id,
+                or_(
+                    User.shopper_rating_sum != totals.c.shopper_sum,
+                    User.shopper_review_count.is_distinct_from(totals.c.shopper_count),
+                    User.traveler_rating_sum != totals.c.traveler_sum,
+                    User.traveler_review_count.is_distinct_from(totals.c.traveler_count)
+                )
+            )
+            .values(
+                shopper_rating_sum=totals.c.shopper_sum,
+                shopper_review_count=totals.c.shopper_count,
+                shopper_rating=_average(totals.c.shopper_sum, totals.c.shopper_count),
+                traveler_rating_sum=totals.c.traveler_sum,
+                traveler_review_count=totals.c.traveler_count,
+                traveler_rating=_average(totals.c.traveler_sum, totals.c.traveler_count),
+                updated_at=func.now()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
     
     def search_users(
         self,
         query: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None
     ) -> List[User]:
         search_term = f"%{query}%"
-        return self.db.query(User).filter(
+        users = self.db.query(User).filter(
             self.model.deleted_at.is_(None),
             (
                 User.email.ilike(search_term) |
@@ -142,4 +217,5 @@ class UserRepository(BaseRepository[User]):
                 User.display_name.ilike(search_term) |
                 User.phone.ilike(search_term)
             )
-        ).offset(skip).limit(limit).all()
\ No newline at end of file
+        )
+        return self.project(users, columns).offset(skip).limit(limit).all()
\ No newline at end of file
@@ -0,0 +1,72 @@
+from typing import Optional, List, Dict, Any
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.conversation import MessageType
+
+
+class MessageCreate(BaseModel):
+    content: str = Field(..., min_length=1, max_length=5000)
+    message_type: MessageType = MessageType.TEXT
+    attachment_url: Optional[str] = Field(None, max_length=2000)
+    attachment_metadata: Optional[Dict[str, Any]] = None
+
+
+class MessageResponse(BaseModel):
+    id: UUID
+    conversation_id: UUID
+    sender_id: UUID
+    message_type: MessageType
+    content: str
+    attachment_url: Optional[str] = None
+    attachment_metadata: Optional[Dict[str, Any]] = None
+    is_blocked: bool = False
+    read_at: Optional[datetime] = None
+    edited_at: Optional[datetime] = None
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MessagePage(BaseModel):
+    items: List[MessageResponse]
+    next_cursor: Optional[str] = Field(None, description="Pass as `before` to fetch older messages")
+
+
+class ReadReceiptCreate(BaseModel):
+    message_id: Optional[UUID] = Field(None, description="Read up to this message; defaults to the latest")
+
+
+class ReadReceiptResponse(BaseModel):
+    conversation_id: UUID
+    read_up_to: Optional[datetime] = None
+    marked: int
+
+
+class ConversationResponse(BaseModel):
+    id: UUID
+    order_id: UUID
+    shopper_id: UUID
+    traveler_id: UUID
+    is_unlocked: bool
+    is_active: bool
+    last_message_at: Optional[datetime] = None
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MessagePreview(BaseModel):
+    id: UUID
+    sender_id: UUID
+    message_type: MessageType
+    content: str
+    created_at: datetime
+
+
+class InboxConversation(ConversationResponse):
+    counterpart_id: UUID
+    counterpart_name: str
+    unread_count: int
+    last_message: Optional[MessagePreview] = None
@@ -1,7 +1,7 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.models.notification import NotificationType
 
@@ -47,4 +47,20 @@ class NotificationSummary(BaseModel):
 
 
 class UnreadCountResponse(BaseModel):
-    unread_count: int
\ No newline at end of file
+    unread_count: int
+
+
+class StreamTicketResponse(BaseModel):
+    ticket: str
+    expires_in: int = Field(..., description="Seconds until the ticket expires")
+
+class NotificationBroadcast(BaseModel):
+    type: NotificationType = NotificationType.SYSTEM
+    title: str = Field(..., min_length=1, max_length=255)
+    message: str = Field(..., min_length=1)
+    data: Optional[Dict[str, Any]] = None
+    user_ids: Optional[List[UUID]] = Field(None, description="Recipients; all active users when omitted")
+
+
+class NotificationBroadcastResponse(BaseModel):
+    created: int
@@ -0,0 +1,35 @@
+from typing import Optional, List, Dict
+from decimal import Decimal
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict
+
+from app.models.payment import PaymentStatus
+
+
+class BalanceResponse(BaseModel):
+    traveler_id: UUID
+    currency: str
+    holdings: int
+    amount: Decimal
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PayoutResponse(BaseModel):
+    traveler_id: UUID
+    currency: str
+    amount: Decimal
+    holdings: int
+    transaction_id: Optional[UUID] = None
+    status: Optional[PaymentStatus] = None
+    failure_reason: Optional[str] = None
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PayoutReportResponse(BaseModel):
+    dry_run: bool
+    payouts: List[PayoutResponse]
+    retried: List[PayoutResponse]
+    totals: Dict[str, Decimal]
+    paid: Dict[str, Decimal]
@@ -0,0 +1,35 @@
+from typing import Optional, List, Literal
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ReviewCreate(BaseModel):
+    rating: int = Field(..., ge=1, le=5)
+    comment: Optional[str] = Field(None, max_length=2000)
+    is_public: bool = True
+
+
+class ReviewReply(BaseModel):
+    response: str = Field(..., min_length=1, max_length=2000)
+
+
+class ReviewResponse(BaseModel):
+    id: UUID
+    order_id: UUID
+    reviewer_id: UUID
+    reviewed_id: UUID
+    reviewer_role: Literal["shopper", "traveler"]
+    rating: int
+    comment: Optional[str] = None
+    response: Optional[str] = None
+    response_at: Optional[datetime] = None
+    is_public: bool
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReviewPage(BaseModel):
+    items: List[ReviewResponse]
+    next_cursor: Optional[str] = Field(None, description="Pass as `before` to fetch older reviews")
@@ -1,7 +1,5 @@
 import re
 import json
-import requests
-from bs4 import BeautifulSoup
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse, parse_qs
 import logging
@@ -66,6 +64,10 @@ class AmazonScraper:
     
     async def fetch_product_info(self, url: str) -> Dict[str, Any]:
         """Fetch product information from Amazon URL"""
+        # requests, bs4 and lxml are only needed here; importing them lazily
+        # keeps them out of worker boot
+        import requests
+        from bs4 import BeautifulSoup
         
         # Validate URL
         if 'amazon.com' not in url.lower():
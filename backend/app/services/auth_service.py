@@ -1,27 +1,39 @@
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
-from passlib.context import CryptContext
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.models.user import User, UserStatus
 from app.repositories.user_repository import UserRepository
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# Scope of the tokens that only open the notification stream
+STREAM_TICKET_SCOPE = "stream"
+
+
+@lru_cache(maxsize=None)
+def pwd_context():
+    # passlib and the bcrypt backend load on the first login or sign-up,
+    # not at worker boot
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 
 class AuthService:
 
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         
-        return pwd_context.verify(plain_password, hashed_password)
+        return pwd_context().verify(plain_password, hashed_password)
     
     @staticmethod
     def get_password_hash(password: str) -> str:
         
-        return pwd_context.hash(password)
+        return pwd_context().hash(password)
     
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -41,17 +53,34 @@ class AuthService:
         return encoded_jwt
     
     @staticmethod
-    def verify_token(token: str) -> Optional[dict]:
+    def create_stream_ticket(user_id: UUID) -> str:
+        """A short-lived token that can only open the notification stream.
         
+        EventSource can't set headers, so the ticket travels in the URL and
+        ends up in proxy and access logs; an access token must never go there.
+        """
+        return AuthService.create_access_token(
+            {"sub": str(user_id), "scope": STREAM_TICKET_SCOPE},
+            expires_delta=timedelta(seconds=settings.NOTIFICATION_STREAM_TICKET_SECONDS)
+        )
+    
+    @staticmethod
+    def verify_token(token: str, scope: Optional[str] = None) -> Optional[dict]:
+        """Decode a token, rejecting it unless its scope is ``scope``.
+        
+        Access tokens have no scope, so a stream ticket is never accepted as one.
+        """
         try:
             payload = jwt.decode(
                 token, 
                 settings.JWT_SECRET_KEY, 
                 algorithms=[settings.JWT_ALGORITHM]
             )
-            return payload
         except JWTError:
             return None
+        if payload.get("scope") != scope:
+            return None
+        return payload
     
     def authenticate_user(self, db: Session, email: str, password: str) -> Optional[User]:
         
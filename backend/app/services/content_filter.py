@@ -0,0 +1,189 @@
+"""Message moderation: keeps contact details and payment handles from being
+shared off-platform, and blocks banned phrases.
+
+Every pattern - regexes and phrase lists alike - is compiled into a single
+alternation with one named group per rule, so a message is scanned in one
+pass however many rules there are. Phrase lists are folded into a trie
+first, which keeps the alternation from backtracking across thousands of
+entries, and each phrase letter also matches its usual look-alikes
+(``0`` for ``o``, ``$`` for ``s``) and single separators (``s.p.a.m``).
+
+Text is matched after normalization (NFKC, case folding, zero-width
+characters dropped); spans are mapped back to the original text before
+redaction.
+"""
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+REDACTION = "[removed]"
+
+# Character classes phrase letters also match
+LOOKALIKES = {
+    "a": "a4@", "b": "b8", "e": "e3", "g": "g9", "i": "i1!|l", "l": "l1|i",
+    "o": "o0", "s": "s5$", "t": "t7+", "z": "z2",
+}
+PHRASE_SEPARATOR = r"[\s._*-]?"
+
+_AT = r"(?:@|\s*[\[({<]\s*at\s*[\])}>]\s*|\s+at\s+)"
+_DOT = r"(?:\.|\s*[\[({<]\s*dot\s*[\])}>]\s*|\s+dot\s+)"
+_DIGIT_WORD = r"(?:zero|oh|one|two|three|four|five|six|seven|eight|nine)"
+
+# (rule, regex); rules are tried in order at each position
+DEFAULT_PATTERNS: List[Tuple[str, str]] = [
+    ("email", rf"(?<![\w.%+-])[\w.%+-]+{_AT}[\w-]+(?:{_DOT}[\w-]+)*{_DOT}[a-z]{{2,}}\b(?!@)"),
+    ("payment_handle", r"(?:paypal\.me|venmo\.com|cash\.app)/[\w.-]+"
+                       r"|(?<![\w$])\$[a-z][a-z0-9_]{2,19}\b"
+                       r"|\b(?:venmo|cash\s?app|zelle|paypal|revolut)\s*(?:me\s*)?[:\-]?\s*@[\w.-]{3,}"),
+    # 9-15 digits, either after a "+" or grouped the way phone numbers are
+    # written ("(555) 123-4567"); a bare run of digits is more likely an
+    # order, tracking or reference number
+    ("phone", r"(?<![\w+])\+\d(?:[\s().-]{0,2}\d){8,14}(?!\w)"),
+    ("phone", r"(?<![\w+#(])(?=\(?\d{1,5}[\s().-])\(?\d(?:[\s().-]{0,2}\d){8,14}(?!\w)"),
+    ("phone", rf"\b{_DIGIT_WORD}(?:[\s,.-]+{_DIGIT_WORD}){{6,}}\b"),
+]
+
+DEFAULT_PHRASES: Dict[str, List[str]] = {
+    "off_platform": [
+        "whatsapp", "telegram", "wechat", "signal me", "text me at", "call me at",
+        "pay outside", "pay me directly", "pay off the app", "outside the app", "off the platform",
+    ],
+}
+
+
+@dataclass
+class Violation:
+    rule: str
+    start: int
+    end: int
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"rule": self.rule, "start": self.start, "end": self.end}
+
+
+@dataclass
+class FilterResult:
+    text: str
+    violations: List[Violation] = field(default_factory=list)
+    blocked: bool = False
+
+    @property
+    def clean(self) -> bool:
+        return not self.violations
+
+
+def _phrase_trie(phrases: Iterable[str]) -> dict:
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in " ".join(phrase.casefold().split()):
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return trie
+
+
+def _trie_pattern(node: dict, after_letter: bool = False) -> str:
+    """Regex matching exactly the phrases in ``node``, sharing prefixes"""
+    branches = []
+    for char, child in sorted(node.items()):
+        if not char:
+            continue
+        if char == " ":
+            head = r"\s+"
+        elif char in LOOKALIKES:
+            head = "[" + re.escape(LOOKALIKES[char]) + "]"
+        else:
+            head = re.escape(char)
+        if after_letter and char != " ":
+            head = PHRASE_SEPARATOR + head
+        branches.append(head + _trie_pattern(child, char != " "))
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{body})?" if "" in node else body
+
+
+def phrase_pattern(phrases: Iterable[str]) -> str:
+    return r"(?<!\w)" + _trie_pattern(_phrase_trie(phrases)) + r"(?!\w)"
+
+
+def normalize(text: str) -> Tuple[str, Optional[List[int]]]:
+    """Matching view of ``text`` and, when lengths differ, the original
+    index of every normalized character (None means identity)"""
+    if text.isascii():
+        return text.lower(), None
+
+    chars: List[str] = []
+    index: List[int] = []
+    for position, char in enumerate(text):
+        if unicodedata.category(char) == "Cf":
+            continue
+        for folded in unicodedata.normalize("NFKC", char).casefold():
+            chars.append(folded)
+            index.append(position)
+    return "".join(chars), index
+
+
+class ContentFilter:
+
+    def __init__(
+        self,
+        patterns: Sequence[Tuple[str, str]] = (),
+        phrases: Optional[Dict[str, Sequence[str]]] = None,
+        block_rules: Iterable[str] = ()
+    ):
+        alternatives = []
+        self._rules: Dict[str, str] = {}
+        for rule, pattern in list(patterns) + [
+            (rule, phrase_pattern(words)) for rule, words in (phrases or {}).items() if words
+        ]:
+            group = f"r{len(self._rules)}"
+            self._rules[group] = rule
+            alternatives.append(f"(?P<{group}>{pattern})")
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+        self.block_rules = frozenset(block_rules)
+
+    def scan(self, text: str) -> FilterResult:
+        if self._regex is None or not text:
+            return FilterResult(text)
+
+        normalized, index = normalize(text)
+        violations = []
+        for match in self._regex.finditer(normalized):
+            start, end = match.span()
+            if index is not None:
+                start, end = index[start], index[end - 1] + 1
+            violations.append(Violation(self._rules[match.lastgroup], start, end))
+
+        if not violations:
+            return FilterResult(text)
+
+        parts = []
+        position = 0
+        for violation in violations:
+            # Folding can map neighbouring matches onto the same character
+            parts.append(text[position:max(position, violation.start)])
+            parts.append(REDACTION)
+            position = max(position, violation.end)
+        parts.append(text[position:])
+
+        blocked = any(violation.rule in self.block_rules for violation in violations)
+        return FilterResult("".join(parts), violations, blocked)
+
+
+def create_content_filter() -> ContentFilter:
+    phrases = dict(DEFAULT_PHRASES)
+    if settings.CONTENT_FILTER_BANNED_PHRASES:
+        phrases["banned"] = settings.CONTENT_FILTER_BANNED_PHRASES
+    return ContentFilter(DEFAULT_PATTERNS, phrases, block_rules=settings.CONTENT_FILTER_BLOCK_RULES)
+
+
+@lru_cache(maxsize=None)
+def get_content_filter() -> ContentFilter:
+    """The filter configured in settings, compiled on the first scan rather
+    than at import (a long banned phrase list takes seconds)"""
+    return create_content_filter()
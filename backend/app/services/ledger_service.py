@@ -0,0 +1,193 @@
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Optional, List, Dict, Sequence
+from uuid import UUID
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.payments import PaymentProvider, payment_provider
+from app.models.payment import PaymentStatus
+from app.repositories.payment_repository import EscrowRepository, TransactionRepository
+
+logger = logging.getLogger(__name__)
+
+# Payouts still pending after this long are assumed to belong to a crashed run
+PENDING_PAYOUT_RETRY_AFTER = timedelta(minutes=5)
+
+
+@dataclass
+class Payout:
+    traveler_id: UUID
+    currency: str
+    amount: Decimal
+    holdings: int
+    idempotency_key: Optional[str] = None
+    transaction_id: Optional[UUID] = None
+    status: Optional[PaymentStatus] = None
+    failure_reason: Optional[str] = None
+
+
+@dataclass
+class PayoutReport:
+    dry_run: bool
+    payouts: List[Payout] = field(default_factory=list)
+    # Pending payouts of earlier runs, settled again under their original key
+    retried: List[Payout] = field(default_factory=list)
+    
+    def totals(self, status: Optional[PaymentStatus] = None) -> Dict[str, Decimal]:
+        totals: Dict[str, Decimal] = {}
+        for payout in self.payouts + self.retried:
+            if status is None or payout.status == status:
+                totals[payout.currency] = totals.get(payout.currency, Decimal("0")) + payout.amount
+        return totals
+
+
+def payout_idempotency_key(holding_ids: Sequence[UUID]) -> str:
+    """Same holdings, same key: a payout retried for the same set of
+    holdings can't be paid twice"""
+    return hashlib.sha256(",".join(sorted(str(id) for id in holding_ids)).encode()).hexdigest()
+
+
+class LedgerService:
+    
+    def __init__(self, db: Session, provider: Optional[PaymentProvider] = None):
+        self.db = db
+        self.escrow_repo = EscrowRepository(db)
+        self.transaction_repo = TransactionRepository(db)
+        self.provider = provider or payment_provider
+    
+    def get_releasable_balances(
+        self,
+        traveler_id: Optional[UUID] = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Row]:
+        return self.escrow_repo.get_releasable_balances(
+            [traveler_id] if traveler_id else None, skip, limit
+        )
+    
+    def run_payouts(self, dry_run: bool = False, chunk_size: int = settings.PAYOUT_CHUNK_SIZE) -> PayoutReport:
+        """Pay every traveler their releasable escrow balance, one payout
+        per traveler and currency.
+        
+        Travelers are handled ``chunk_size`` at a time: their holdings are
+        locked, a pending payout transaction is recorded for each group and
+        the holdings are marked released against it, all in one
+        transaction, before the provider is called. Payouts the provider
+        declines put their holdings back. A dry run only reports what would
+        be paid.
+        
+        Raises ValueError for a real run against the local provider, unless
+        DEBUG or PAYOUT_ALLOW_LOCAL_PROVIDER is set: holdings would be
+        marked released and paid without any money moving.
+        """
+        if dry_run:
+            return PayoutReport(True, [
+                Payout(row.traveler_id, row.currency, row.amount, row.holdings)
+                for row in self.get_releasable_balances()
+            ])
+        
+        if self.provider.name == "local" and not (settings.DEBUG or settings.PAYOUT_ALLOW_LOCAL_PROVIDER):
+            raise ValueError("Payouts can't be sent with the local payment provider; configure PAYMENT_PROVIDER")
+        
+        report = PayoutReport(False)
+        report.retried = self._settle([
+            Payout(
+                transaction.user_id, transaction.currency, transaction.amount, 0,
+                idempotency_key=transaction.idempotency_key,
+                transaction_id=transaction.id
+            )
+            for transaction in self.transaction_repo.get_pending_payouts(
+                datetime.now(timezone.utc) - PENDING_PAYOUT_RETRY_AFTER
+            )
+        ])
+        
+        traveler_ids = self.escrow_repo.get_releasable_traveler_ids()
+        for start in range(0, len(traveler_ids), chunk_size):
+            report.payouts.extend(self._settle(self._release(traveler_ids[start:start + chunk_size])))
+        
+        return report
+    
+    def _release(self, traveler_ids: Sequence[UUID]) -> List[Payout]:
+        """Record pending payouts for the travelers' releasable holdings and
+        mark the holdings released, in one transaction"""
+        groups: Dict[tuple, List[Row]] = {}
+        for holding in self.escrow_repo.lock_releasable(traveler_ids):
+            groups.setdefault((holding.traveler_id, holding.currency), []).append(holding)
+        
+        if not groups:
+            self.db.rollback()
+            return []
+        
+        payouts = {}
+        for (traveler_id, currency), holdings in groups.items():
+            key = payout_idempotency_key([holding.id for holding in holdings])
+            payouts[key] = (
+                Payout(traveler_id, currency, sum(h.traveler_payout for h in holdings), len(holdings), key),
+                holdings
+            )
+        
+        transaction_ids = self.transaction_repo.upsert_payouts([
+            {
+                "user_id": payout.traveler_id,
+                "amount": payout.amount,
+                "currency": payout.currency,
+                "provider": self.provider.name,
+                "idempotency_key": key
+            }
+            for key, (payout, _) in payouts.items()
+        ])
+        
+        now = datetime.utcnow()
+        released = []
+        updates = []
+        for key, transaction_id in transaction_ids.items():
+            payout, holdings = payouts[key]
+            payout.transaction_id = transaction_id
+            released.append(payout)
+            updates.extend(
+                {"id": holding.id, "is_released": True, "released_at": now, "release_transaction_id": transaction_id}
+                for holding in holdings
+            )
+        # Commits the payout transactions together with the releases
+        self.escrow_repo.bulk_update(updates)
+        return released
+    
+    def _settle(self, payouts: List[Payout]) -> List[Payout]:
+        """Send recorded payouts to the provider and store the outcome,
+        in one transaction for the whole batch"""
+        if not payouts:
+            return payouts
+        
+        now = datetime.utcnow()
+        updates = []
+        for payout in payouts:
+            result = self.provider.payout(payout.traveler_id, payout.amount, payout.currency, payout.idempotency_key)
+            if result.succeeded:
+                payout.status = PaymentStatus.CAPTURED
+                updates.append({
+                    "id": payout.transaction_id,
+                    "status": PaymentStatus.CAPTURED,
+                    "provider_transaction_id": result.provider_transaction_id,
+                    "processed_at": now
+                })
+            else:
+                payout.status = PaymentStatus.FAILED
+                payout.failure_reason = result.failure_reason
+                updates.append({
+                    "id": payout.transaction_id,
+                    "status": PaymentStatus.FAILED,
+                    "failure_reason": result.failure_reason,
+                    "failed_at": now
+                })
+        
+        failed = [payout.transaction_id for payout in payouts if payout.status == PaymentStatus.FAILED]
+        if failed:
+            self.escrow_repo.unrelease(failed)
+            logger.warning("%d of %d payouts failed; their holdings stay releasable", len(failed), len(payouts))
+        self.transaction_repo.bulk_update(updates)
+        return payouts
@@ -0,0 +1,191 @@
+from typing import NamedTuple, Optional, List, Tuple
+from uuid import UUID
+from datetime import datetime
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.conversation import Conversation, Message
+from app.repositories.conversation_repository import ConversationRepository, MessageRepository
+from app.repositories.order_repository import OrderRepository
+from app.repositories.payment_repository import TransactionRepository
+from app.schemas.conversation import MessageCreate
+from app.services.content_filter import get_content_filter
+
+
+class ReadReceipt(NamedTuple):
+    read_up_to: Optional[datetime]
+    marked: int
+
+
+class MessageService:
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.conversation_repo = ConversationRepository(db)
+        self.message_repo = MessageRepository(db)
+        self.order_repo = OrderRepository(db)
+        self.transaction_repo = TransactionRepository(db)
+    
+    def get_conversation(self, conversation_id: UUID, user_id: UUID) -> Optional[Conversation]:
+        """A conversation the user takes part in"""
+        conversation = self.conversation_repo.get(conversation_id)
+        
+        if not conversation or not conversation.is_participant(user_id):
+            return None
+        
+        return conversation
+    
+    def _unlock_if_paid(self, conversation: Conversation) -> None:
+        """Messaging opens once the shopper has paid: a captured order
+        payment, or the funds held in escrow"""
+        if conversation.is_unlocked or not self.transaction_repo.is_order_paid(conversation.order_id):
+            return
+        conversation.unlock()
+        self.db.commit()
+    
+    def get_or_create_for_order(self, order_id: UUID, user_id: UUID) -> Conversation:
+        """The conversation between an order's shopper and its matched
+        traveler, opened the first time either asks for it. It stays locked
+        until the order is paid for."""
+        order = self.order_repo.get(order_id)
+        
+        if not order:
+            raise ValueError("Order not found")
+        
+        if user_id not in (order.shopper_id, order.matched_traveler_id):
+            raise ValueError("Only the shopper and the matched traveler can message about an order")
+        
+        if not order.matched_traveler_id:
+            raise ValueError("Order has no matched traveler yet")
+        
+        conversation = self.conversation_repo.get_by_order(order_id)
+        if conversation:
+            self._unlock_if_paid(conversation)
+            return conversation
+        
+        conversation = Conversation(
+            order_id=order.id,
+            shopper_id=order.shopper_id,
+            traveler_id=order.matched_traveler_id,
+            is_unlocked=False,
+            is_active=True
+        )
+        if self.transaction_repo.is_order_paid(order.id):
+            conversation.unlock()
+        self.db.add(conversation)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # The other participant opened it concurrently, or the order's
+            # conversation was deleted (order_id is unique, deleted or not)
+            self.db.rollback()
+            conversation = self.conversation_repo.get_by_order(order_id)
+            if conversation is None:
+                raise ValueError("The conversation for this order has been deleted")
+            return conversation
+        
+        self.db.refresh(conversation)
+        return conversation
+    
+    def send_message(
+        self,
+        conversation_id: UUID,
+        sender_id: UUID,
+        message_data: MessageCreate
+    ) -> Optional[Message]:
+        conversation = self.get_conversation(conversation_id, sender_id)
+        
+        if not conversation:
+            return None
+        
+        self._unlock_if_paid(conversation)
+        if not conversation.can_send_message(sender_id):
+            raise ValueError("Messages can't be sent in this conversation")
+        
+        message = Message(
+            conversation_id=conversation.id,
+            sender_id=sender_id,
+            message_type=message_data.message_type,
+            content=message_data.content,
+            attachment_url=message_data.attachment_url,
+            attachment_metadata=message_data.attachment_metadata
+        )
+        self._moderate(message)
+        message.created_at = self.conversation_repo.touch_last_message(conversation.id)
+        self.db.add(message)
+        self.db.commit()
+        self.db.refresh(message)
+        
+        return message
+    
+    def _moderate(self, message: Message) -> None:
+        """Redact contact details and payment handles; spans are stored,
+        never the matched text"""
+        if not settings.CONTENT_FILTER_ENABLED or not message.content:
+            return
+        
+        result = get_content_filter().scan(message.content)
+        if result.clean:
+            return
+        
+        message.filtered_content = result.text
+        message.violations_detected = [violation.to_dict() for violation in result.violations]
+        message.is_blocked = result.blocked
+    
+    def get_messages(
+        self,
+        conversation_id: UUID,
+        user_id: UUID,
+        before: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 50
+    ) -> Optional[Tuple[List[Message], bool]]:
+        """A newest-first page of history and whether older messages exist;
+        None if the user isn't a participant"""
+        if not self.get_conversation(conversation_id, user_id):
+            return None
+        
+        messages = self.message_repo.get_page(conversation_id, before, limit)
+        return messages[:limit], len(messages) > limit
+    
+    def mark_read(
+        self,
+        conversation_id: UUID,
+        user_id: UUID,
+        message_id: Optional[UUID] = None
+    ) -> Optional[ReadReceipt]:
+        """Mark everything the other participant sent up to ``message_id``
+        (default: the latest message) as read and advance the user's read
+        watermark. Repeated or out-of-order receipts the watermark already
+        covers don't write anything; None if the user isn't a participant.
+        
+        The conversation row stays locked until commit, so no message can be
+        committed with a created_at behind the new watermark (see
+        ConversationRepository.touch_last_message)."""
+        conversation = self.conversation_repo.get_for_update(conversation_id)
+        
+        if not conversation or not conversation.is_participant(user_id):
+            return None
+        
+        if message_id:
+            up_to = self.message_repo.get_created_at(conversation.id, message_id)
+            if up_to is None:
+                raise ValueError("Message not found in this conversation")
+        else:
+            up_to = self.message_repo.get_latest_created_at(conversation.id)
+        
+        watermark = conversation.read_up_to(user_id)
+        if up_to is None or (watermark is not None and up_to <= watermark):
+            return ReadReceipt(watermark, 0)
+        
+        marked = self.message_repo.mark_read_up_to(conversation.id, user_id, up_to)
+        watermark = self.conversation_repo.advance_read_watermark(
+            conversation.id, conversation.read_watermark_column(user_id), up_to
+        )
+        self.db.commit()
+        
+        return ReadReceipt(watermark, marked)
+    
+    def get_inbox(self, user_id: UUID, skip: int = 0, limit: int = 20) -> List[Row]:
+        return self.conversation_repo.get_inbox(user_id, skip, limit)
@@ -1,13 +1,45 @@
-from typing import Optional, List, Dict, Any
+import logging
+from collections import Counter
+from typing import Callable, Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, delete, func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
 
-from app.models.notification import Notification, NotificationType
+from app.models.notification import Notification, NotificationCounter, NotificationType
 from app.models.user import User
 from app.models.order import Order
 from app.models.offer import Offer
+from app.models.review import Review
+from app.models.outbox import OutboxEvent
+from app.schemas.notification import NotificationSummary
+from app.core.broker import broker
+from app.core.config import settings
+from app.core.partitioning import (
+    create_monthly_partitions, default_partition_name, expired_partitions, month_floor, retention_start,
+    uuid7, uuid7_datetime
+)
+from app.services.outbox_service import OutboxService, register_handler
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_CREATED = "notification.created"
+
+# Slack around the timestamp embedded in a UUIDv7 id when bounding created_at
+ID_TIMESTAMP_SLACK = timedelta(days=1)
+
+
+def notification_id_filter(notification_id: UUID) -> list:
+    """Criteria matching one notification by id. For time-ordered ids this
+    adds created_at bounds so Postgres prunes to the partition holding it."""
+    criteria = [Notification.id == notification_id]
+    created_at = uuid7_datetime(notification_id)
+    if created_at is not None:
+        criteria.append(Notification.created_at.between(
+            created_at - ID_TIMESTAMP_SLACK, created_at + ID_TIMESTAMP_SLACK
+        ))
+    return criteria
 
 
 class NotificationService:
@@ -31,17 +63,158 @@ class NotificationService:
             data=data or {}
         )
         self.db.add(notification)
+        self.db.flush()
+        self._adjust_unread_count(user_id, 1)
         self.db.commit()
         self.db.refresh(notification)
+        self.publish_notification(notification)
         return notification
     
+    @staticmethod
+    def stream_event(notification: Any) -> Dict[str, Any]:
+        """SSE event for a Notification, a result row or a column dict"""
+        data = NotificationSummary.model_validate(notification).model_dump(mode="json")
+        return {"id": data["id"], "event": "notification", "data": data}
+    
+    def publish_notification(self, notification: Notification) -> None:
+        """Push a committed notification to the user's open streams.
+        Best effort: clients that miss it catch up on reconnect."""
+        try:
+            broker.publish(notification.user_id, self.stream_event(notification))
+        except Exception:
+            logger.exception("Failed to publish notification %s", notification.id)
+    
+    def publish_notifications(self, notifications: List[Any]) -> None:
+        """Bulk form of publish_notification for rows or column dicts"""
+        try:
+            broker.publish_many([
+                (row["user_id"] if isinstance(row, dict) else row.user_id, self.stream_event(row))
+                for row in notifications
+            ])
+        except Exception:
+            logger.exception("Failed to publish %d notifications", len(notifications))
+    
+    def create_notifications_bulk(
+        self,
+        notifications: List[Dict[str, Any]],
+        chunk_size: int = 1000
+    ) -> List[UUID]:
+        """Create many notifications with multi-row INSERTs and one commit.
+        
+        Each item has user_id, notification_type, title, message and
+        optionally data. Unlike create_notification there is no per-row
+        refresh; returns the new ids in input order.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "id": uuid7(),
+                "user_id": item["user_id"],
+                "type": item["notification_type"],
+                "title": item["title"],
+                "message": item["message"],
+                "data": item.get("data") or {},
+                "is_read": False,
+                "created_at": now,
+                "updated_at": now
+            }
+            for item in notifications
+        ]
+        if not rows:
+            return []
+        
+        for start in range(0, len(rows), chunk_size):
+            self.db.execute(insert(Notification).values(rows[start:start + chunk_size]))
+        self._increment_unread_counts(Counter(row["user_id"] for row in rows), chunk_size)
+        self.db.commit()
+        
+        self.publish_notifications(rows)
+        return [row["id"] for row in rows]
+    
+    def broadcast(
+        self,
+        user_ids: List[UUID],
+        notification_type: NotificationType,
+        title: str,
+        message: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> List[UUID]:
+        """Send the same notification to every user in ``user_ids``"""
+        return self.create_notifications_bulk([
+            {
+                "user_id": user_id,
+                "notification_type": notification_type,
+                "title": title,
+                "message": message,
+                "data": data
+            }
+            for user_id in user_ids
+        ])
+    
+    def queue_notification(
+        self,
+        user_id: UUID,
+        notification_type: NotificationType,
+        title: str,
+        message: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> OutboxEvent:
+        """Record a notification in the caller's transaction through the
+        outbox; it is created once that transaction commits. Does not commit."""
+        return OutboxService(self.db).enqueue(NOTIFICATION_CREATED, {
+            "id": str(uuid7()),
+            "user_id": str(user_id),
+            "type": notification_type.value,
+            "title": title,
+            "message": message,
+            "data": data or {},
+            "created_at": datetime.utcnow().isoformat()
+        })
+    
+    def _adjust_unread_count(self, user_id: UUID, delta: int) -> None:
+        """Apply ``delta`` to the user's unread counter within the current
+        transaction. The row lock taken here serializes concurrent updates."""
+        if not delta:
+            return
+        stmt = insert(NotificationCounter).values(
+            user_id=user_id,
+            unread_count=max(delta, 0),
+            updated_at=datetime.utcnow()
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[NotificationCounter.user_id],
+            set_={
+                "unread_count": func.greatest(NotificationCounter.unread_count + delta, 0),
+                "updated_at": stmt.excluded.updated_at
+            }
+        )
+        self.db.execute(stmt)
+    
+    def _increment_unread_counts(self, increments: Dict[UUID, int], chunk_size: int = 1000) -> None:
+        """Bulk form of _adjust_unread_count for positive deltas"""
+        now = datetime.utcnow()
+        values = [
+            {"user_id": user_id, "unread_count": count, "updated_at": now}
+            for user_id, count in increments.items()
+        ]
+        for start in range(0, len(values), chunk_size):
+            stmt = insert(NotificationCounter).values(values[start:start + chunk_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[NotificationCounter.user_id],
+                set_={
+                    "unread_count": NotificationCounter.unread_count + stmt.excluded.unread_count,
+                    "updated_at": stmt.excluded.updated_at
+                }
+            )
+            self.db.execute(stmt)
+    
     def create_offer_received_notification(
         self,
         order: Order,
         offer: Offer,
         traveler: User
-    ) -> Notification:
-        """Create notification when an offer is received on an order"""
+    ) -> OutboxEvent:
+        """Queue notification when an offer is received on an order"""
         title = "New Offer Received!"
         message = f"{traveler.first_name} has made an offer on your order for {order.product_name}"
         
@@ -54,7 +227,7 @@ class NotificationService:
             "proposed_delivery_date": offer.proposed_delivery_date.isoformat() if offer.proposed_delivery_date else None
         }
         
-        return self.create_notification(
+        return self.queue_notification(
             user_id=order.shopper_id,
             notification_type=NotificationType.OFFER_RECEIVED,
             title=title,
@@ -66,8 +239,8 @@ class NotificationService:
         self,
         offer: Offer,
         order: Order
-    ) -> Notification:
-        """Create notification when an offer is accepted"""
+    ) -> OutboxEvent:
+        """Queue notification when an offer is accepted"""
         title = "Offer Accepted!"
         message = f"Your offer for {order.product_name} has been accepted"
         
@@ -77,7 +250,7 @@ class NotificationService:
             "product_name": order.product_name
         }
         
-        return self.create_notification(
+        return self.queue_notification(
             user_id=offer.traveler_id,
             notification_type=NotificationType.OFFER_ACCEPTED,
             title=title,
@@ -89,8 +262,8 @@ class NotificationService:
         self,
         offer: Offer,
         order: Order
-    ) -> Notification:
-        """Create notification when an offer is declined/rejected"""
+    ) -> OutboxEvent:
+        """Queue notification when an offer is declined/rejected"""
         title = "Offer Declined"
         message = f"Your offer for {order.product_name} was declined"
         
@@ -100,7 +273,7 @@ class NotificationService:
             "product_name": order.product_name
         }
         
-        return self.create_notification(
+        return self.queue_notification(
             user_id=offer.traveler_id,
             notification_type=NotificationType.OFFER_DECLINED,
             title=title,
@@ -108,6 +281,57 @@ class NotificationService:
             data=data
         )
     
+    def create_offers_withdrawn_notifications(
+        self,
+        offers: List[Offer],
+        order: Order
+    ) -> List[OutboxEvent]:
+        """Queue notifications for the competing offers withdrawn when
+        another traveler's offer on the order was accepted. The dispatcher
+        inserts them in one multi-row batch."""
+        title = "Offer Withdrawn"
+        message = f"The order for {order.product_name} was matched with another traveler"
+        
+        return [
+            self.queue_notification(
+                user_id=offer.traveler_id,
+                notification_type=NotificationType.OFFER_DECLINED,
+                title=title,
+                message=message,
+                data={
+                    "order_id": str(order.id),
+                    "offer_id": str(offer.id),
+                    "product_name": order.product_name,
+                    "reason": "matched_with_another_traveler"
+                }
+            )
+            for offer in offers
+        ]
+    
+    def create_review_received_notification(
+        self,
+        review: Review,
+        order: Order
+    ) -> OutboxEvent:
+        """Queue notification when someone reviews the user"""
+        title = "New Review"
+        message = f"You received a {review.rating}-star review for {order.product_name}"
+        
+        data = {
+            "order_id": str(order.id),
+            "review_id": str(review.id),
+            "rating": review.rating,
+            "reviewer_role": review.reviewer_role
+        }
+        
+        return self.queue_notification(
+            user_id=review.reviewed_id,
+            notification_type=NotificationType.REVIEW_RECEIVED,
+            title=title,
+            message=message,
+            data=data
+        )
+    
     def get_user_notifications(
         self,
         user_id: UUID,
@@ -128,26 +352,61 @@ class NotificationService:
                    .limit(limit)\
                    .all()
     
-    def get_unread_count(self, user_id: UUID) -> int:
-        """Get count of unread notifications for a user"""
+    def get_notification(self, notification_id: UUID, user_id: UUID) -> Optional[Notification]:
+        """Get a single notification owned by the user"""
+        return self.db.query(Notification).filter(
+            *notification_id_filter(notification_id),
+            Notification.user_id == user_id
+        ).first()
+    
+    def get_notifications_after(
+        self,
+        user_id: UUID,
+        last_notification_id: UUID,
+        limit: int = 100
+    ) -> List[Notification]:
+        """Notifications created after ``last_notification_id``, oldest first,
+        for resuming a stream. Empty if the id is unknown."""
+        last = self.db.query(Notification.created_at, Notification.id).filter(
+            *notification_id_filter(last_notification_id),
+            Notification.user_id == user_id
+        ).first()
+        if last is None:
+            return []
+        
+        # The plain created_at bound lets the planner skip older partitions
         return self.db.query(Notification).filter(
             Notification.user_id == user_id,
-            Notification.is_read == False
-        ).count()
+            Notification.created_at >= last.created_at,
+            tuple_(Notification.created_at, Notification.id) > tuple_(last.created_at, last.id)
+        ).order_by(Notification.created_at, Notification.id)\
+         .limit(limit)\
+         .all()
+    
+    def get_unread_count(self, user_id: UUID) -> int:
+        """Get count of unread notifications for a user from the counter table"""
+        count = self.db.execute(
+            select(NotificationCounter.unread_count).where(NotificationCounter.user_id == user_id)
+        ).scalar()
+        return count or 0
     
     def mark_as_read(self, notification_id: UUID, user_id: UUID) -> Optional[Notification]:
         """Mark a notification as read"""
-        notification = self.db.query(Notification).filter(
-            Notification.id == notification_id,
-            Notification.user_id == user_id
-        ).first()
+        # Conditional update so concurrent calls decrement the counter once
+        updated = self.db.query(Notification).filter(
+            *notification_id_filter(notification_id),
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        ).update({
+            "is_read": True,
+            "read_at": datetime.utcnow()
+        }, synchronize_session=False)
         
-        if notification:
-            notification.mark_as_read()
+        if updated:
+            self._adjust_unread_count(user_id, -1)
             self.db.commit()
-            self.db.refresh(notification)
         
-        return notification
+        return self.get_notification(notification_id, user_id)
     
     def mark_all_as_read(self, user_id: UUID) -> int:
         """Mark all notifications as read for a user"""
@@ -157,29 +416,203 @@ class NotificationService:
         ).update({
             "is_read": True,
             "read_at": datetime.utcnow()
-        })
+        }, synchronize_session=False)
+        self._adjust_unread_count(user_id, -count)
         self.db.commit()
         return count
     
     def delete_notification(self, notification_id: UUID, user_id: UUID) -> bool:
         """Delete a notification"""
-        notification = self.db.query(Notification).filter(
-            Notification.id == notification_id,
-            Notification.user_id == user_id
+        deleted = self.db.execute(
+            delete(Notification)
+            .where(*notification_id_filter(notification_id), Notification.user_id == user_id)
+            .returning(Notification.is_read)
         ).first()
         
-        if notification:
-            self.db.delete(notification)
-            self.db.commit()
-            return True
+        if deleted is None:
+            return False
         
-        return False
+        if not deleted.is_read:
+            self._adjust_unread_count(user_id, -1)
+        self.db.commit()
+        return True
     
-    def delete_old_notifications(self, days: int = 30) -> int:
-        """Delete notifications older than specified days"""
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        count = self.db.query(Notification).filter(
-            Notification.created_at < cutoff_date
-        ).delete()
+    def ensure_partitions(self, months_ahead: int = 3) -> List[str]:
+        """Create monthly partitions from this month through ``months_ahead``"""
+        created = create_monthly_partitions(
+            self.db, Notification.__tablename__, month_floor(datetime.utcnow().date()), months_ahead + 1
+        )
+        self.db.commit()
+        return created
+    
+    def drop_expired_partitions(self, retention_days: int) -> List[str]:
+        """Retention by dropping whole monthly partitions older than
+        ``retention_days``, instead of deleting rows. Rows are kept until the
+        entire month they fall in has expired.
+        
+        Each partition is detached, its unread notifications are subtracted
+        from the users' counters, and it is dropped, all in one transaction.
+        Expired rows in the default partition are deleted the same way.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        dropped = []
+        for name in expired_partitions(self.db, Notification.__tablename__, cutoff):
+            self.db.execute(text(f'ALTER TABLE notifications DETACH PARTITION "{name}"'))
+            self.db.execute(text(f"""
+                UPDATE notification_counters AS c
+                SET unread_count = GREATEST(c.unread_count - d.unread, 0), updated_at = now()
+                FROM (
+                    SELECT user_id, count(*) AS unread FROM "{name}" WHERE is_read = false GROUP BY user_id
+                ) AS d
+                WHERE c.user_id = d.user_id
+            """))
+            self.db.execute(text(f'DROP TABLE "{name}"'))
+            self.db.commit()
+            logger.info("Dropped expired notification partition %s", name)
+            dropped.append(name)
+
+        default = default_partition_name(Notification.__tablename__)
+        deleted = self.db.execute(text(f"""
+            WITH deleted AS (
+                DELETE FROM "{default}" WHERE created_at < :before RETURNING user_id, is_read
+            ), adjusted AS (
+                UPDATE notification_counters AS c
+                SET unread_count = GREATEST(c.unread_count - d.unread, 0), updated_at = now()
+                FROM (
+                    SELECT user_id, count(*) AS unread FROM deleted WHERE is_read = false GROUP BY user_id
+                ) AS d
+                WHERE c.user_id = d.user_id
+            )
+            SELECT count(*) FROM deleted
+        """), {"before": f"{retention_start(cutoff).isoformat()} 00:00:00+00"}).scalar()
         self.db.commit()
-        return count
\ No newline at end of file
+        if deleted:
+            logger.info("Deleted %d expired notifications from %s", deleted, default)
+        return dropped
+    
+    def reconcile_unread_counts(self, batch_size: int = 1000) -> int:
+        """Correct counters that drifted from the notifications table.
+        
+        Works through users in batches; each batch locks its counter rows
+        before counting so concurrent increments either land before the count
+        (and are included) or wait for the batch to commit. Returns the
+        number of counters that were corrected.
+        """
+        corrected = 0
+        last_user_id = None
+        
+        while True:
+            query = select(User.id).order_by(User.id).limit(batch_size)
+            if last_user_id is not None:
+                query = query.where(User.id > last_user_id)
+            user_ids = self.db.execute(query).scalars().all()
+            if not user_ids:
+                break
+            
+            stored = dict(self.db.execute(
+                select(NotificationCounter.user_id, NotificationCounter.unread_count)
+                .where(NotificationCounter.user_id.in_(user_ids))
+                .with_for_update()
+            ).all())
+            actual = dict(self.db.execute(
+                select(Notification.user_id, func.count())
+                .where(Notification.user_id.in_(user_ids), Notification.is_read == False)
+                .group_by(Notification.user_id)
+            ).all())
+            
+            drifted = [
+                {"user_id": user_id, "unread_count": actual.get(user_id, 0), "updated_at": datetime.utcnow()}
+                for user_id in user_ids
+                if stored.get(user_id, 0) != actual.get(user_id, 0)
+            ]
+            if drifted:
+                stmt = insert(NotificationCounter).values(drifted)
+                self.db.execute(stmt.on_conflict_do_update(
+                    index_elements=[NotificationCounter.user_id],
+                    set_={
+                        "unread_count": stmt.excluded.unread_count,
+                        "updated_at": stmt.excluded.updated_at
+                    }
+                ))
+                corrected += len(drifted)
+            
+            self.db.commit()
+            last_user_id = user_ids[-1]
+        
+        return corrected
+
+def deliver_notification_events(db: Session, events: List[OutboxEvent]) -> Callable[[], None]:
+    """Outbox handler: bulk insert queued notifications and bump counters.
+    Notification ids come from the event, so redelivery is a no-op."""
+    rows = []
+    for event in events:
+        payload = event.payload
+        created_at = datetime.fromisoformat(payload["created_at"])
+        rows.append({
+            "id": UUID(payload["id"]),
+            "user_id": UUID(payload["user_id"]),
+            "type": NotificationType(payload["type"]),
+            "title": payload["title"],
+            "message": payload["message"],
+            "data": payload.get("data") or {},
+            "is_read": False,
+            "created_at": created_at,
+            "updated_at": created_at
+        })
+    
+    inserted = db.execute(
+        insert(Notification)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[Notification.id, Notification.created_at])
+        .returning(*Notification.__table__.c)
+    ).all()
+    
+    notification_service = NotificationService(db)
+    notification_service._increment_unread_counts(Counter(row.user_id for row in inserted))
+    
+    return lambda: notification_service.publish_notifications(inserted)
+
+
+register_handler(NOTIFICATION_CREATED, deliver_notification_events)
+
+
+def maintain_notification_partitions() -> None:
+    """Scheduled job: pre-create upcoming partitions and drop expired ones"""
+    from app.core.database import SessionLocal, get_engine
+
+    # The advisory lock belongs to a connection, and a session hands its
+    # connection back to the pool on every commit, so pin one for the job
+    with get_engine().connect() as conn:
+        db = SessionLocal(bind=conn)
+        try:
+            # Every worker schedules this job; only one needs to run it
+            if not db.execute(text("SELECT pg_try_advisory_lock(hashtext('maintain_notification_partitions'))")).scalar():
+                return
+            try:
+                notification_service = NotificationService(db)
+                created = notification_service.ensure_partitions(settings.NOTIFICATION_PARTITIONS_AHEAD)
+                if created:
+                    logger.info("Created notification partitions: %s", ", ".join(created))
+                notification_service.drop_expired_partitions(settings.NOTIFICATION_RETENTION_DAYS)
+            finally:
+                # A failed step leaves the transaction aborted, which would
+                # fail the unlock and leave the lock held
+                db.rollback()
+                db.execute(text("SELECT pg_advisory_unlock(hashtext('maintain_notification_partitions'))"))
+                db.commit()
+        finally:
+            db.close()
+
+
+def reconcile_notification_counters() -> int:
+    """Scheduled job: reconcile every user's unread counter"""
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        corrected = NotificationService(db).reconcile_unread_counts()
+        if corrected:
+            logger.warning("Corrected %d drifted unread notification counters", corrected)
+        return corrected
+    finally:
+        db.close()
@@ -1,6 +1,7 @@
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.offer import Offer, OfferStatus
@@ -43,14 +44,22 @@ class OfferService:
         
         expires_at = datetime.utcnow() + timedelta(hours=expires_in_hours)
         
-        offer = self.offer_repo.create(
+        offer = Offer(
             order_id=order_id,
             traveler_id=traveler_id,
             expires_at=expires_at,
             **offer_data.model_dump()
         )
-        
-        # Send notification to the order owner
+        self.db.add(offer)
+        try:
+            self.db.flush()
+        except IntegrityError:
+            # unique_offer_per_traveler: a concurrent duplicate, or an
+            # earlier (withdrawn or deleted) offer on the same order
+            self.db.rollback()
+            raise ValueError("You already have an offer for this order")
+        
+        # Notify the order owner in the same transaction (via the outbox)
         traveler = self.db.query(User).filter(User.id == traveler_id).first()
         if traveler:
             self.notification_service.create_offer_received_notification(
@@ -59,6 +68,8 @@ class OfferService:
                 traveler=traveler
             )
         
+        self.db.commit()
+        self.db.refresh(offer)
         return offer
     
     def get_offer(self, offer_id: UUID, user_id: Optional[UUID] = None) -> Optional[Offer]:
@@ -87,7 +98,7 @@ class OfferService:
             raise ValueError("Offer cannot be updated")
         
         update_data = offer_data.model_dump(exclude_unset=True)
-        return self.offer_repo.update(offer_id, **update_data)
+        return self.offer_repo.update_returning(offer_id, **update_data)
     
     def withdraw_offer(self, offer_id: UUID, traveler_id: UUID) -> bool:
         offer = self.offer_repo.get(offer_id)
@@ -116,15 +127,13 @@ class OfferService:
         if offer.status != OfferStatus.ACTIVE:
             raise ValueError("Only active offers can be rejected")
         
-        # Reject the offer (sets status to REJECTED)
+        # Reject the offer (sets status to REJECTED) and notify the traveler
         offer.reject()
-        self.db.commit()
-        
-        # Send notification to traveler
         self.notification_service.create_offer_declined_notification(
             offer=offer,
             order=offer.order
         )
+        self.db.commit()
         
         return True
     
@@ -140,14 +149,21 @@ class OfferService:
         if not offer.can_be_accepted:
             raise ValueError("Offer cannot be accepted")
         
-        offer.accept()
-        self.db.commit()
+        competing_offers = [
+            other for other in offer.order.offers
+            if other.id != offer.id and other.status == OfferStatus.ACTIVE
+        ]
         
-        # Send notification to the traveler
+        offer.accept()
         self.notification_service.create_offer_accepted_notification(
             offer=offer,
             order=offer.order
         )
+        self.notification_service.create_offers_withdrawn_notifications(
+            offers=competing_offers,
+            order=offer.order
+        )
+        self.db.commit()
         
         return offer
     
@@ -1,11 +1,12 @@
-from typing import Optional, List
+from typing import Optional, List, Sequence
 from uuid import UUID
 from datetime import date
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_, desc, asc, func
 
 from app.models.order import Order, OrderStatus
+from app.repositories.base import CountMode, TotalCount
 from app.repositories.order_repository import OrderRepository
 from app.schemas.order import OrderCreate, OrderUpdate, OrderFilter
 
@@ -61,7 +62,7 @@ class OrderService:
             update_data['platform_fee'] = platform_fee
             update_data['total_cost'] = update_data['reward_amount'] + platform_fee
         
-        return self.order_repo.update(order_id, **update_data)
+        return self.order_repo.update_returning(order_id, **update_data)
     
     def delete_order(self, order_id: UUID, user_id: UUID) -> bool:
         order = self.order_repo.get(order_id)
@@ -80,23 +81,52 @@ class OrderService:
         as_shopper: bool = True,
         status: Optional[OrderStatus] = None,
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        columns: Optional[Sequence[str]] = None
     ) -> List[Order]:
-        if status:
-            orders = self.order_repo.get_orders_by_status(status, skip, limit)
-            if as_shopper:
-                return [o for o in orders if o.shopper_id == user_id]
-            else:
-                return [o for o in orders if o.matched_traveler_id == user_id]
-        
-        return self.order_repo.get_user_orders(user_id, as_shopper, skip, limit)
+        return self.order_repo.get_user_orders(user_id, as_shopper, skip, limit, status, columns)
     
-    def search_orders(self, filters: OrderFilter, exclude_user_id: Optional[UUID] = None) -> List[Order]:
-        from sqlalchemy.orm import joinedload
-        query = self.db.query(Order).options(
-            joinedload(Order.destination_city),
-            joinedload(Order.shopper)
-        ).filter(Order.deleted_at.is_(None))
+    def count_user_orders(
+        self,
+        user_id: UUID,
+        as_shopper: bool = True,
+        status: Optional[OrderStatus] = None,
+        mode: CountMode = CountMode.CAPPED
+    ) -> TotalCount:
+        return self.order_repo.count_user_orders(user_id, as_shopper, status, mode)
+    
+    def search_orders(
+        self,
+        filters: OrderFilter,
+        exclude_user_id: Optional[UUID] = None,
+        columns: Optional[Sequence[str]] = None
+    ) -> List[Order]:
+        """Orders matching ``filters``, newest first. With ``columns``, rows
+        of just those columns and no city or shopper."""
+        query = self._search_query(filters, exclude_user_id)
+        if columns:
+            query = self.order_repo.project(query, columns)
+        else:
+            query = query.options(
+                joinedload(Order.destination_city),
+                joinedload(Order.shopper)
+            )
+        
+        query = query.order_by(desc(Order.created_at))
+        
+        return query.offset(filters.skip).limit(filters.limit).all()
+    
+    def count_search_orders(
+        self,
+        filters: OrderFilter,
+        exclude_user_id: Optional[UUID] = None,
+        mode: CountMode = CountMode.CAPPED
+    ) -> TotalCount:
+        """Total for search_orders, ignoring skip and limit"""
+        return self.order_repo.count_query(self._search_query(filters, exclude_user_id), mode)
+    
+    def _search_query(self, filters: OrderFilter, exclude_user_id: Optional[UUID] = None):
+        query = self.db.query(Order).filter(Order.deleted_at.is_(None))
         
         # Exclude orders from the specified user (typically the current user)
         if exclude_user_id:
@@ -147,9 +177,7 @@ class OrderService:
                 )
             )
         
-        query = query.order_by(desc(Order.created_at))
-        
-        return query.offset(filters.skip).limit(filters.limit).all()
+        return query
     
     def get_active_orders(
         self,
@@ -195,7 +223,10 @@ class OrderService:
         limit: int = 20,
         exclude_user_id: Optional[UUID] = None
     ) -> List[Order]:
-        query = self.db.query(Order).filter(
+        query = self.db.query(Order).options(
+            joinedload(Order.destination_city),
+            joinedload(Order.shopper)
+        ).filter(
             and_(
                 Order.deleted_at.is_(None),
                 Order.status == OrderStatus.ACTIVE,
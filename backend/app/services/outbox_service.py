@@ -0,0 +1,202 @@
+"""Transactional outbox.
+
+Services call ``OutboxService.enqueue`` inside the transaction that makes the
+business change, so the side effect is committed (or rolled back) with it.
+``OutboxDispatcher`` drains pending events in batches with
+``FOR UPDATE SKIP LOCKED``, so every worker can run it concurrently. A batch
+is handed to the handler registered for its topic and deleted in the same
+transaction; anything the handler does outside the database (push, email)
+runs after commit and is therefore at least once.
+"""
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.metrics import registry
+from app.models.outbox import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+# Handler(db, events) applies the events inside the dispatcher transaction and
+# may return a callable to run after that transaction commits.
+Handler = Callable[[Session, List[OutboxEvent]], Optional[Callable[[], None]]]
+
+_handlers: Dict[str, Handler] = {}
+
+dispatched_total = registry.counter(
+    "outbox_events_dispatched_total",
+    "Outbox events delivered by topic",
+    ("topic",)
+)
+failed_total = registry.counter(
+    "outbox_events_failed_total",
+    "Outbox event delivery failures by topic",
+    ("topic",)
+)
+dispatch_lag_seconds = registry.histogram(
+    "outbox_dispatch_lag_seconds",
+    "Seconds between an outbox event being committed and delivered",
+    ("topic",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+)
+pending_events = registry.gauge(
+    "outbox_pending_events",
+    "Outbox events waiting for delivery, as of the last dispatcher run",
+)
+oldest_pending_seconds = registry.gauge(
+    "outbox_oldest_pending_seconds",
+    "Age of the oldest undelivered outbox event, as of the last dispatcher run",
+)
+
+
+def register_handler(topic: str, handler: Handler) -> None:
+    _handlers[topic] = handler
+
+
+class OutboxService:
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, topic: str, payload: Dict[str, Any]) -> OutboxEvent:
+        """Add an event to the current transaction; the caller commits"""
+        event = OutboxEvent(topic=topic, payload=payload)
+        self.db.add(event)
+        return event
+
+
+class OutboxDispatcher:
+
+    def __init__(self, session_factory: Callable[[], Session], batch_size: int = 500, max_attempts: int = 10):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+
+    def _pending_query(self, db: Session):
+        return db.query(OutboxEvent).filter(
+            OutboxEvent.attempts < self.max_attempts,
+            OutboxEvent.available_at <= func.now()
+        )
+
+    def _deliver(self, db: Session, events: List[OutboxEvent]) -> List[Callable[[], None]]:
+        by_topic: Dict[str, List[OutboxEvent]] = {}
+        for event in events:
+            by_topic.setdefault(event.topic, []).append(event)
+
+        after_commit = []
+        for topic, topic_events in by_topic.items():
+            handler = _handlers.get(topic)
+            if handler is None:
+                raise LookupError(f"No outbox handler registered for topic {topic!r}")
+            callback = handler(db, topic_events)
+            if callback is not None:
+                after_commit.append(callback)
+
+        db.query(OutboxEvent).filter(
+            OutboxEvent.id.in_([event.id for event in events])
+        ).delete(synchronize_session=False)
+        return after_commit
+
+    def _finish(self, delivered: List[Tuple[str, datetime]], after_commit: List[Callable[[], None]]) -> None:
+        now = datetime.now(timezone.utc)
+        for topic, created_at in delivered:
+            dispatched_total.inc(topic)
+            dispatch_lag_seconds.observe((now - created_at).total_seconds(), topic)
+        for callback in after_commit:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Outbox after-commit callback failed")
+
+    def _retry_individually(self, event_ids: List[int]) -> None:
+        """After a failed batch, deliver events one by one so a single bad
+        event is retried with backoff without holding up the rest."""
+        for event_id in event_ids:
+            db = self.session_factory()
+            try:
+                event = self._pending_query(db).filter(
+                    OutboxEvent.id == event_id
+                ).with_for_update(skip_locked=True).first()
+                if event is None:
+                    continue
+                topic, attempts = event.topic, event.attempts + 1
+                delivered = [(topic, event.created_at)]
+                try:
+                    # A savepoint, so a failure doesn't end the transaction
+                    # and release the row lock before it has been recorded
+                    with db.begin_nested():
+                        after_commit = self._deliver(db, [event])
+                except Exception as e:
+                    failed_total.inc(topic)
+                    db.query(OutboxEvent).filter(OutboxEvent.id == event_id).update({
+                        "attempts": attempts,
+                        "last_error": f"{type(e).__name__}: {e}"[:2000],
+                        "available_at": func.now() + timedelta(seconds=min(2 ** attempts, 3600))
+                    }, synchronize_session=False)
+                    db.commit()
+                    log = logger.error if attempts >= self.max_attempts else logger.warning
+                    log("Outbox event %s (%s) failed, attempt %d: %s", event_id, topic, attempts, e)
+                else:
+                    db.commit()
+                    self._finish(delivered, after_commit)
+            finally:
+                db.close()
+
+    def dispatch_batch(self) -> int:
+        """Deliver up to batch_size events; returns how many were taken"""
+        db = self.session_factory()
+        try:
+            events = self._pending_query(db)\
+                .order_by(OutboxEvent.id)\
+                .limit(self.batch_size)\
+                .with_for_update(skip_locked=True)\
+                .all()
+            if not events:
+                return 0
+
+            event_ids = [event.id for event in events]
+            # Captured before commit expires the (deleted) instances
+            delivered = [(event.topic, event.created_at) for event in events]
+            try:
+                after_commit = self._deliver(db, events)
+                db.commit()
+            except Exception:
+                db.rollback()
+                logger.warning("Outbox batch of %d failed, retrying individually", len(event_ids), exc_info=True)
+                db.close()
+                self._retry_individually(event_ids)
+                return len(event_ids)
+
+            self._finish(delivered, after_commit)
+            return len(events)
+        finally:
+            db.close()
+
+    def update_lag_metrics(self) -> None:
+        db = self.session_factory()
+        try:
+            count, oldest = db.query(func.count(OutboxEvent.id), func.min(OutboxEvent.created_at)).filter(
+                OutboxEvent.attempts < self.max_attempts
+            ).one()
+        finally:
+            db.close()
+        pending_events.set(count)
+        oldest_pending_seconds.set(
+            (datetime.now(timezone.utc) - oldest).total_seconds() if oldest else 0
+        )
+
+    def run(self, max_seconds: float = 10.0) -> int:
+        """Drain the outbox; scheduled job entry point"""
+        deadline = time.monotonic() + max_seconds
+        total = 0
+        while time.monotonic() < deadline:
+            taken = self.dispatch_batch()
+            total += taken
+            if taken < self.batch_size:
+                break
+        self.update_lag_metrics()
+        return total
@@ -0,0 +1,162 @@
+import logging
+from typing import Optional, List, Tuple
+from uuid import UUID
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.order import OrderStatus
+from app.models.review import Review
+from app.models.user import User
+from app.repositories.order_repository import OrderRepository
+from app.repositories.review_repository import ReviewRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.review import ReviewCreate
+from app.services.notification_service import NotificationService
+
+logger = logging.getLogger(__name__)
+
+REVIEWABLE_STATUSES = (OrderStatus.DELIVERED, OrderStatus.COMPLETED)
+
+
+class ReviewService:
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.review_repo = ReviewRepository(db)
+        self.order_repo = OrderRepository(db)
+        self.user_repo = UserRepository(db)
+        self.notification_service = NotificationService(db)
+    
+    def create_review(self, order_id: UUID, reviewer_id: UUID, review_data: ReviewCreate) -> Review:
+        """Review the other side of a delivered order. The reviewed user's
+        rating aggregate is adjusted in the same transaction."""
+        order = self.order_repo.get(order_id)
+        
+        if not order:
+            raise ValueError("Order not found")
+        
+        if reviewer_id == order.shopper_id:
+            reviewer_role, reviewed_id = "shopper", order.matched_traveler_id
+        elif reviewer_id == order.matched_traveler_id:
+            reviewer_role, reviewed_id = "traveler", order.shopper_id
+        else:
+            raise ValueError("Only the shopper and the matched traveler can review an order")
+        
+        if order.status not in REVIEWABLE_STATUSES:
+            raise ValueError("Orders can only be reviewed once delivered")
+        
+        if self.review_repo.get_by_order_and_reviewer(order_id, reviewer_id):
+            raise ValueError("You have already reviewed this order")
+        
+        review = Review(
+            order_id=order.id,
+            reviewer_id=reviewer_id,
+            reviewed_id=reviewed_id,
+            reviewer_role=reviewer_role,
+            **review_data.model_dump()
+        )
+        self.db.add(review)
+        try:
+            self.db.flush()
+        except IntegrityError:
+            # A concurrent request from the same reviewer won the race
+            self.db.rollback()
+            raise ValueError("You have already reviewed this order")
+        
+        if review.is_public:
+            self._adjust_rating(review, 1)
+        self.notification_service.create_review_received_notification(review, order)
+        
+        self.db.commit()
+        self.db.refresh(review)
+        return review
+    
+    def delete_review(self, review_id: UUID, reviewer_id: UUID) -> bool:
+        """Withdraw the reviewer's own review and its rating"""
+        deleted = self.review_repo.soft_delete_by_reviewer(review_id, reviewer_id)
+        
+        if not deleted:
+            return False
+        
+        if deleted.is_public:
+            self._adjust_rating(deleted, -1)
+        
+        self.db.commit()
+        return True
+    
+    def _adjust_rating(self, review, sign: int) -> None:
+        # A shopper's review rates the traveler, and the other way round
+        self.user_repo.adjust_rating(
+            review.reviewed_id,
+            as_shopper=review.reviewer_role == "traveler",
+            rating_delta=sign * review.rating,
+            count_delta=sign
+        )
+    
+    def reply_to_review(self, review_id: UUID, user_id: UUID, response: str) -> Optional[Review]:
+        review = self.review_repo.get(review_id)
+        
+        if not review or review.reviewed_id != user_id:
+            return None
+        
+        if review.has_response:
+            raise ValueError("This review already has a response")
+        
+        review.add_response(response)
+        self.db.commit()
+        self.db.refresh(review)
+        return review
+    
+    def get_user_reviews(
+        self,
+        user_id: UUID,
+        reviewer_role: Optional[str] = None,
+        before: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20
+    ) -> Tuple[List[Review], bool]:
+        """A newest-first page of public reviews about the user and whether
+        older ones exist"""
+        reviews = self.review_repo.get_public_page(user_id, reviewer_role, before, limit)
+        return reviews[:limit], len(reviews) > limit
+    
+    def recompute_ratings(self, batch_size: int = 1000) -> int:
+        """Rebuild every user's rating aggregates from the reviews table, for
+        backfills and to correct drift.
+        
+        Works through users in batches, locking each batch's rows before
+        aggregating so a concurrent review's adjust_rating either commits
+        first (and is counted) or waits for the batch. Returns the number of
+        users that were corrected.
+        """
+        corrected = 0
+        last_user_id = None
+        
+        while True:
+            query = select(User.id).order_by(User.id).limit(batch_size).with_for_update()
+            if last_user_id is not None:
+                query = query.where(User.id > last_user_id)
+            user_ids = self.db.execute(query).scalars().all()
+            if not user_ids:
+                break
+            
+            corrected += self.user_repo.recompute_ratings(user_ids)
+            self.db.commit()
+            last_user_id = user_ids[-1]
+        
+        return corrected
+
+
+def recompute_user_ratings() -> int:
+    """Scheduled job: rebuild rating aggregates from reviews"""
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        corrected = ReviewService(db).recompute_ratings()
+        if corrected:
+            logger.warning("Corrected %d drifted user rating aggregates", corrected)
+        return corrected
+    finally:
+        db.close()
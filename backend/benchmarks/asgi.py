@@ -0,0 +1,102 @@
+import asyncio
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# The app modules read their configuration at import time; benchmarks that
+# only exercise in-process code paths don't need a reachable database.
+BENCH_ENV = {
+    "DATABASE_HOST": "localhost",
+    "DATABASE_USER": "bench",
+    "DATABASE_PASSWORD": "bench",
+    "DATABASE_NAME": "bench",
+    "SECRET_KEY": "bench-secret",
+    "JWT_SECRET_KEY": "bench-jwt-secret",
+}
+
+
+def configure_bench_env(**overrides: str) -> None:
+    for key, value in {**BENCH_ENV, **overrides}.items():
+        os.environ.setdefault(key, value)
+
+
+async def call_app(
+    app,
+    path: str,
+    method: str = "GET",
+    query_string: bytes = b"",
+    headers: Iterable[Tuple[bytes, bytes]] = (),
+    body: bytes = b""
+) -> Tuple[int, Dict[bytes, bytes], bytes]:
+    """Drive an ASGI app in-process with a single HTTP request"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [(b"host", b"bench")] + list(headers),
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    body_sent = False
+    response_complete = asyncio.Event()
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            await response_complete.wait()
+            return {"type": "http.disconnect"}
+        body_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    status = 0
+    response_headers: Dict[bytes, bytes] = {}
+    chunks: List[bytes] = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(chunks)
+
+
+async def _measure(app, path: str, requests: int, warmup: int, **kwargs) -> float:
+    for _ in range(warmup):
+        await call_app(app, path, **kwargs)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call_app(app, path, **kwargs)
+    return requests / (time.perf_counter() - start)
+
+
+def requests_per_second(
+    app,
+    path: str,
+    requests: int = 2000,
+    warmup: int = 200,
+    **kwargs
+) -> float:
+    return asyncio.run(_measure(app, path, requests, warmup, **kwargs))
+
+
+def report(title: str, rows: List[Tuple[str, float]], unit: str = "req/s", baseline: Optional[float] = None) -> None:
+    print(title)
+    print("-" * len(title))
+    baseline = baseline if baseline is not None else (rows[0][1] if rows else None)
+    for name, value in rows:
+        delta = f"  ({value / baseline:.2f}x)" if baseline else ""
+        print(f"{name:<40} {value:>12,.1f} {unit}{delta}")
+    print()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""BaseRepository bulk primitives vs the per-row ORM path.
+
+Writes ``order_status_history`` rows (nothing references that table, so the
+cleanup is cheap) against seeded orders; needs a migrated and seeded
+database. Every row written here is deleted at the end.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_bulk_repository [--rows 5000] [--legacy-rows 1000]
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import delete
+
+from app.core.database import SessionLocal
+from app.models.notification import Notification  # noqa: F401 (mapper User relates to)
+from app.models.order import Order, OrderStatus, OrderStatusHistory
+from app.repositories.base import BaseRepository
+from benchmarks.asgi import report
+
+NOTE_PREFIX = "bulk-bench"
+
+
+def history_rows(order_ids: List[Any], variant: str) -> List[Dict[str, Any]]:
+    return [
+        {
+            "order_id": order_id,
+            "old_status": OrderStatus.DRAFT,
+            "new_status": OrderStatus.ACTIVE,
+            "notes": f"{NOTE_PREFIX} {variant}",
+        }
+        for order_id in order_ids
+    ]
+
+
+def timed(func: Callable[[BaseRepository], Any], rows: int) -> float:
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        func(BaseRepository(OrderStatusHistory, db))
+        return rows / (time.perf_counter() - started)
+    finally:
+        db.close()
+
+
+def legacy_create(repo: BaseRepository, objects: List[Dict[str, Any]]) -> None:
+    """BaseRepository.bulk_create before the bulk rewrite"""
+    db_objs = [repo.model(**obj) for obj in objects]
+    repo.db.add_all(db_objs)
+    repo.db.commit()
+
+
+def legacy_update(repo: BaseRepository, updates: List[Dict[str, Any]]) -> None:
+    """BaseRepository.bulk_update before the bulk rewrite"""
+    for update in updates:
+        update = dict(update)
+        repo.update(update.pop("id"), **update)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--legacy-rows", type=int, default=1000, help="rows for the per-row update path")
+    args = parser.parse_args()
+    rows, legacy_rows = args.rows, min(args.legacy_rows, args.rows)
+
+    db = SessionLocal()
+    try:
+        order_ids = [order_id for (order_id,) in db.query(Order.id).limit(rows)]
+        if len(order_ids) < rows:
+            parser.error(f"only {len(order_ids)} orders; seed more or lower --rows")
+
+        inserts = [
+            ("add_all + commit (legacy)",
+             timed(lambda repo: legacy_create(repo, history_rows(order_ids, "legacy")), rows)),
+            ("bulk_create (RETURNING *)",
+             timed(lambda repo: repo.bulk_create(history_rows(order_ids, "create")), rows)),
+            ("bulk_insert (RETURNING id)",
+             timed(lambda repo: repo.bulk_insert(history_rows(order_ids, "insert"), returning=("id",)), rows)),
+            ("copy_insert",
+             timed(lambda repo: repo.copy_insert(history_rows(order_ids, "copy")), rows)),
+        ]
+
+        ids = [
+            history_id for (history_id,) in db.query(OrderStatusHistory.id)
+            .filter(OrderStatusHistory.notes == f"{NOTE_PREFIX} copy")
+        ]
+        updates = [
+            {"id": history_id, "new_status": OrderStatus.MATCHED, "notes": f"{NOTE_PREFIX} updated {i}"}
+            for i, history_id in enumerate(ids)
+        ]
+        updated = [
+            ("update() per row (legacy)",
+             timed(lambda repo: legacy_update(repo, updates[:legacy_rows]), legacy_rows)),
+            ("bulk_update (UPDATE ... FROM VALUES)",
+             timed(lambda repo: repo.bulk_update(updates), rows)),
+        ]
+    finally:
+        db.rollback()
+        db.execute(delete(OrderStatusHistory).where(OrderStatusHistory.notes.like(f"{NOTE_PREFIX}%")))
+        db.commit()
+        db.close()
+
+    report(f"Bulk insert, {rows} rows", inserts, unit="rows/s")
+    report(f"Bulk update, {rows} rows ({legacy_rows} through update())", updated, unit="rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Response compression: CPU time against bytes saved, per endpoint payload.
+
+Builds representative JSON bodies for the main list endpoints (rendered with
+``ORJSONResponse``'s encoder) and compresses each with every available codec
+at the middleware's per-request level and at the level used for cached
+reference data. Also drives ``CompressionMiddleware`` in-process to show its
+per-request overhead. No database.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_compression [--iterations 300]
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.asgi import configure_bench_env, report, requests_per_second
+
+configure_bench_env()
+
+from starlette.responses import Response  # noqa: E402
+
+from app.api.responses import dumps  # noqa: E402
+from app.core.compression import Codec, CompressionMiddleware, available_codecs  # noqa: E402
+from benchmarks.bench_serialization import order_page  # noqa: E402
+
+NOW = datetime(2026, 10, 1, 12, 30, tzinfo=timezone.utc)
+
+
+def notifications(count: int) -> List[Dict]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "notification_type": "new_offer",
+            "title": "New offer on your order",
+            "message": f"A traveler offered to bring Wireless headphones, model {i} for 25.00 USD.",
+            "data": {"order_id": str(uuid.uuid4()), "offer_id": str(uuid.uuid4())},
+            "is_read": i % 3 == 0,
+            "priority": "normal",
+            "created_at": NOW - timedelta(minutes=7 * i),
+        }
+        for i in range(count)
+    ]
+
+
+def users(count: int) -> List[Dict]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "display_name": f"User {i}.",
+            "first_name": "Sara",
+            "last_name": f"Karimi{i}",
+            "avatar_url": f"https://cdn.example.com/avatars/{i}.jpg" if i % 2 else None,
+            "bio": "Frequent flyer between Dubai and Tehran." if i % 4 == 0 else None,
+            "identity_verified": i % 5 == 0,
+            "shopper_rating": 4.5,
+            "shopper_review_count": i % 17,
+            "traveler_rating": 4.8,
+            "traveler_review_count": i % 23,
+            "created_at": NOW - timedelta(days=i),
+        }
+        for i in range(count)
+    ]
+
+
+def countries(count: int) -> List[Dict]:
+    return [
+        {
+            "code": f"{chr(65 + i // 26 % 26)}{chr(65 + i % 26)}",
+            "name": f"Country {i}",
+            "currency_code": "USD",
+            "is_active": True,
+        }
+        for i in range(count)
+    ]
+
+
+PAYLOADS: List[Tuple[str, Callable[[], List[Dict]]]] = [
+    ("orders.list, 20 items", lambda: order_page(20)),
+    ("orders.list, 100 items", lambda: order_page(100)),
+    ("notifications.list, 50 items", lambda: notifications(50)),
+    ("users.list, 100 items", lambda: users(100)),
+    ("locations.countries, 250 items", lambda: countries(250)),
+]
+
+
+def measure(codec: Codec, body: bytes, cached: bool, iterations: int) -> Tuple[float, int]:
+    """Microseconds per compression and the compressed size"""
+    compressed = codec.compress(body, cached)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        codec.compress(body, cached)
+    return (time.perf_counter() - started) / iterations * 1e6, len(compressed)
+
+
+def middleware_overhead(requests: int) -> None:
+    small = dumps(order_page(1))
+    large = dumps(order_page(20))
+
+    def endpoint(body: bytes):
+        async def app(scope, receive, send):
+            await Response(body, media_type="application/json")(scope, receive, send)
+        return app
+
+    headers = [(b"accept-encoding", b"gzip, deflate, br, zstd")]
+    for name, body in (("1 order, below the threshold", small), ("20 orders", large)):
+        report(f"Middleware, {name} ({len(body):,} bytes)", [
+            ("no middleware", requests_per_second(endpoint(body), "/", requests)),
+            ("CompressionMiddleware", requests_per_second(
+                CompressionMiddleware(endpoint(body)), "/", requests, headers=headers
+            )),
+        ])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    print("codecs:", ", ".join(codec.name for codec in codecs), "\n")
+
+    header = f"{'payload':<32} {'codec':<12} {'bytes':>9} {'ratio':>6} {'us':>8} {'us/KB saved':>12}"
+    print(header)
+    print("-" * len(header))
+    for name, build in PAYLOADS:
+        body = dumps(build())
+        for codec in codecs:
+            for cached in (False, True):
+                level = codec.cached_level if cached else codec.level
+                # Cached levels run once per distinct body and are slow; fewer rounds
+                iterations = max(args.iterations // 30, 3) if cached else args.iterations
+                micros, size = measure(codec, body, cached, iterations)
+                saved_kb = (len(body) - size) / 1024
+                print(f"{name:<32} {codec.name + ' ' + str(level):<12} {size:>9,} "
+                      f"{len(body) / size:>5.1f}x {micros:>8,.0f} {micros / saved_kb:>12,.1f}")
+        print(f"{name:<32} {'identity':<12} {len(body):>9,}")
+        print()
+
+    middleware_overhead(args.requests)
+
+
+if __name__ == "__main__":
+    main()
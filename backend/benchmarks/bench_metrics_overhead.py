@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Per-request cost of MetricsMiddleware on a trivial route.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_metrics_overhead [--requests 20000]
+"""
+import argparse
+
+from benchmarks.asgi import configure_bench_env, report, requests_per_second
+
+configure_bench_env()
+
+from fastapi import FastAPI  # noqa: E402
+
+from app.core.metrics import MetricsMiddleware  # noqa: E402
+
+
+def build_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    path = "/api/v1/items/42"
+    baseline = requests_per_second(build_app(False), path, args.requests)
+    instrumented = requests_per_second(build_app(True), path, args.requests)
+
+    report(
+        f"GET {path}, {args.requests} sequential requests",
+        [("no middleware", baseline), ("MetricsMiddleware", instrumented)]
+    )
+    overhead_us = (1 / instrumented - 1 / baseline) * 1_000_000
+    print(f"overhead per request: {overhead_us:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Notification fan-out: per-row create_notification vs create_notifications_bulk.
+
+Needs a migrated and seeded database (see ``benchmarks.seed``). Every
+notification written here is deleted again and the affected unread counters
+are reconciled afterwards.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_notification_fanout [--users 2000] [--per-row-users 500]
+"""
+import argparse
+import time
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import delete
+
+from app.core.database import SessionLocal
+from app.models.notification import Notification, NotificationType
+from app.repositories.user_repository import UserRepository
+from app.services.notification_service import NotificationService
+from benchmarks.asgi import report
+
+TITLE = "Benchmark fan-out"
+
+
+def per_row(user_ids: List[UUID]) -> float:
+    db = SessionLocal()
+    try:
+        service = NotificationService(db)
+        started = time.perf_counter()
+        for user_id in user_ids:
+            service.create_notification(user_id, NotificationType.SYSTEM, TITLE, "per-row")
+        return len(user_ids) / (time.perf_counter() - started)
+    finally:
+        db.close()
+
+
+def bulk(user_ids: List[UUID]) -> float:
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        NotificationService(db).broadcast(user_ids, NotificationType.SYSTEM, TITLE, "bulk")
+        return len(user_ids) / (time.perf_counter() - started)
+    finally:
+        db.close()
+
+
+def cleanup() -> None:
+    db = SessionLocal()
+    try:
+        db.execute(delete(Notification).where(Notification.title == TITLE))
+        db.commit()
+        NotificationService(db).reconcile_unread_counts()
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=2000, help="recipients for the bulk path")
+    parser.add_argument("--per-row-users", type=int, default=500, help="recipients for the per-row path")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user_ids = UserRepository(db).get_active_user_ids()
+    finally:
+        db.close()
+    if len(user_ids) < args.users:
+        parser.error(f"only {len(user_ids)} active users; seed more or lower --users")
+
+    try:
+        baseline = per_row(user_ids[:args.per_row_users])
+        batched = bulk(user_ids[:args.users])
+    finally:
+        cleanup()
+
+    report(
+        f"SYSTEM notification fan-out ({args.per_row_users} per-row, {args.users} bulk)",
+        [("create_notification per row", baseline), ("create_notifications_bulk", batched)],
+        unit="rows/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Requests/sec of an order-listing style route with the legacy per-row
+logging and start/complete access log versus the sampled single-line
+access log.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_request_logging [--requests 2000] [--rows 20]
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+from benchmarks.asgi import configure_bench_env, report, requests_per_second
+
+configure_bench_env()
+
+from fastapi import FastAPI, Request  # noqa: E402
+
+from app.core.logging import JSONFormatter  # noqa: E402
+from app.core import request_logging  # noqa: E402
+
+
+def configure_handlers(log_dir: Path) -> None:
+    """Mirror the handler layout of setup_logging without touching logs/"""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.setLevel(logging.INFO)
+
+    console = logging.StreamHandler(open(os.devnull, "w"))
+    console.setFormatter(JSONFormatter())
+    root.addHandler(console)
+
+    app_file = logging.FileHandler(log_dir / "app.log")
+    app_file.setFormatter(JSONFormatter())
+    root.addHandler(app_file)
+
+    error_file = logging.FileHandler(log_dir / "errors.log")
+    error_file.setLevel(logging.ERROR)
+    error_file.setFormatter(JSONFormatter())
+    root.addHandler(error_file)
+
+
+def make_rows(count: int) -> list:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "product_name": f"Product number {i} with a reasonably long title",
+            "product_price": Decimal("19.99"),
+            "destination_country": "CA",
+            "destination_city": {"name": "Toronto"} if i % 2 else None,
+            "deadline_date": date(2030, 1, 1),
+            "reward_amount": Decimal("15.00"),
+            "created_at": datetime(2026, 1, 1),
+        }
+        for i in range(count)
+    ]
+
+
+async def legacy_log_requests(request: Request, call_next):
+    request_id = str(uuid.uuid4())
+    start_time = time.time()
+    logger = logging.getLogger("app.requests")
+    logger.info(
+        "Request started",
+        extra={
+            "extra_fields": {
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.url.path,
+                "query_params": str(request.query_params),
+                "client_host": request.client.host if request.client else None,
+            }
+        }
+    )
+    response = await call_next(request)
+    duration = time.time() - start_time
+    logger.info(
+        "Request completed",
+        extra={
+            "extra_fields": {
+                "request_id": request_id,
+                "status_code": response.status_code,
+                "duration_seconds": round(duration, 3),
+            }
+        }
+    )
+    response.headers["X-Request-ID"] = request_id
+    return response
+
+
+def build_legacy_app(rows: list) -> FastAPI:
+    app = FastAPI()
+    app.middleware("http")(legacy_log_requests)
+    logger = logging.getLogger("app.api.v1.endpoints.orders")
+
+    @app.get("/api/v1/orders/")
+    def list_orders(skip: int = 0, limit: int = 20):
+        logger.info("=== ORDER SEARCH REQUEST ===")
+        for name in ("destination_country", "destination_city_id", "status_filter",
+                     "min_reward", "max_reward", "deadline_before", "deadline_after",
+                     "search_query"):
+            logger.info(f"{name}: {None}")
+        logger.info(f"skip: {skip}, limit: {limit}")
+        logger.info(f"Found {len(rows)} orders from database")
+        summaries = []
+        for row in rows:
+            summaries.append(row)
+            logger.info(f"Order {row['id']}: {row['product_name'][:30]}... -> "
+                        f"{row['destination_city']['name'] if row['destination_city'] else 'No city'}")
+        logger.info(f"Returning {len(summaries)} order summaries")
+        logger.info("=== END ORDER SEARCH ===")
+        return summaries
+
+    return app
+
+
+def build_current_app(rows: list, sample_rate: float) -> FastAPI:
+    app = FastAPI()
+    app.middleware("http")(request_logging.log_requests)
+    request_logging.sampler.default_rate = sample_rate
+
+    @app.get("/api/v1/orders/")
+    def list_orders(skip: int = 0, limit: int = 20):
+        return list(rows)
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    path = "/api/v1/orders/"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        configure_handlers(Path(tmp))
+        results = [
+            ("legacy (per-row + start/complete)", requests_per_second(build_legacy_app(rows), path, args.requests)),
+            ("single line, sample rate 1.0", requests_per_second(build_current_app(rows, 1.0), path, args.requests)),
+            ("single line, sample rate 0.1", requests_per_second(build_current_app(rows, 0.1), path, args.requests)),
+        ]
+        logging.getLogger().setLevel(logging.WARNING)
+        results.append(
+            ("single line, INFO disabled", requests_per_second(build_current_app(rows, 1.0), path, args.requests))
+        )
+
+    report(f"GET {path} with {args.rows} rows, {args.requests} sequential requests", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Response serialization for a 100-item order page, single core, no database.
+
+Compares FastAPI's ``response_model`` path (validate the returned dicts,
+serialize them back to JSON-compatible data, ``json.dumps``) with rendering
+pre-validated ``OrderSummary`` models through ``ORJSONResponse``, and checks
+that both produce the same JSON.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_serialization [--items 100] [--iterations 2000]
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from benchmarks.asgi import configure_bench_env, report
+
+configure_bench_env()
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from app.api.responses import ORJSONResponse, dumps  # noqa: E402
+from app.models.order import OrderStatus  # noqa: E402
+from app.schemas.order import OrderSummary  # noqa: E402
+
+
+def order_page(items: int) -> List[Dict[str, Any]]:
+    """What list_orders used to hand FastAPI: one dict per order"""
+    now = datetime(2026, 10, 1, 12, 30, tzinfo=timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "product_name": f"Wireless headphones, model {i}",
+            "product_image_url": f"https://images.example.com/products/{i}.jpg",
+            "product_price": Decimal("129.99") + i,
+            "destination_country": "AE",
+            "destination_city_id": uuid.uuid4(),
+            "destination_city": {"id": str(uuid.uuid4()), "name": "Dubai", "country_code": "AE"},
+            "deadline_date": date(2026, 12, 1) + timedelta(days=i),
+            "preferred_delivery_date": None,
+            "reward_amount": Decimal("25.00"),
+            "reward_currency": "USD",
+            "special_instructions": "Please keep the original packaging.",
+            "status": OrderStatus.ACTIVE,
+            "created_at": now - timedelta(minutes=i),
+            "updated_at": now,
+            "shopper_id": uuid.uuid4(),
+            "shopper": {
+                "id": str(uuid.uuid4()),
+                "first_name": "Sara",
+                "last_name": "Karimi",
+                "display_name": "Sara K.",
+                "avatar_url": None,
+                "rating": 4.5,
+                "review_count": 12,
+                "verified": True,
+            },
+        }
+        for i in range(items)
+    ]
+
+
+def fastapi_path(rows: List[Dict[str, Any]]) -> Callable[[], bytes]:
+    field = create_response_field(name="Response_list_orders", type_=List[OrderSummary])
+    loop = asyncio.new_event_loop()
+
+    def render() -> bytes:
+        # is_coroutine=False: list_orders is a sync endpoint, so validation
+        # runs in the threadpool
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=rows, is_coroutine=False)
+        )
+        return JSONResponse(content).body
+
+    return render
+
+
+def throughput(render: Callable[[], bytes], iterations: int) -> float:
+    for _ in range(min(iterations // 10, 100)):
+        render()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = order_page(args.items)
+    models = [OrderSummary(**row) for row in rows]
+
+    variants = [
+        ("response_model + json.dumps", fastapi_path(rows)),
+        ("validate once + ORJSONResponse", lambda: ORJSONResponse([OrderSummary(**row) for row in rows]).body),
+        ("pre-validated + ORJSONResponse", lambda: ORJSONResponse(models).body),
+        ("pre-validated + model_dump + json", lambda: json.dumps(
+            [model.model_dump(mode="json") for model in models], separators=(",", ":")
+        ).encode()),
+    ]
+
+    expected = json.loads(variants[0][1]())
+    for name, render in variants[1:]:
+        assert json.loads(render()) == expected, f"{name} renders different JSON"
+    print(f"{args.items} orders, {len(dumps(models)):,} bytes of JSON\n")
+
+    rows_out = [(name, throughput(render, args.iterations)) for name, render in variants]
+    report(f"Order page serialization, {args.items} items", rows_out, unit="pages/s")
+
+
+if __name__ == "__main__":
+    main()
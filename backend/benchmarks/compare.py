@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Diff two load_test baselines and fail on latency regressions.
+
+    python -m benchmarks.compare baseline.json current.json [--threshold 10] [--metric p95_ms]
+
+Exits 1 when any scenario present in both files regressed on the chosen
+metric by more than --threshold percent.
+"""
+import argparse
+import json
+import sys
+from typing import Dict
+
+
+def load(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def change(before: float, after: float) -> float:
+    if not before:
+        return 0.0
+    return (after - before) / before * 100
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--metric", default="p95_ms", choices=["p50_ms", "p95_ms", "p99_ms", "mean_ms"])
+    parser.add_argument("--threshold", type=float, default=10.0, help="allowed regression in percent")
+    args = parser.parse_args()
+
+    baseline, current = load(args.baseline), load(args.current)
+    print(f"baseline {(baseline['git'].get('commit') or '?')[:10]}  current {(current['git'].get('commit') or '?')[:10]}")
+    print(f"{'scenario':<28} {'rps':>18} {args.metric:>24} {'errors':>10}")
+
+    regressions = []
+    for name, after in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"{name:<28} (new)")
+            continue
+        latency_change = change(before[args.metric], after[args.metric])
+        rps_change = change(before["throughput_rps"], after["throughput_rps"])
+        print(
+            f"{name:<28} {after['throughput_rps']:>9.1f} ({rps_change:+6.1f}%) "
+            f"{after[args.metric]:>13.2f}ms ({latency_change:+6.1f}%) {after['errors']:>10}"
+        )
+        if latency_change > args.threshold:
+            regressions.append((name, latency_change))
+
+    if regressions:
+        for name, latency_change in regressions:
+            print(f"REGRESSION {name}: {args.metric} {latency_change:+.1f}% (threshold {args.threshold:.0f}%)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
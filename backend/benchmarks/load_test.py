@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Drive the key v1 endpoints of a running server at fixed concurrency and
+write p50/p95/p99 latency and throughput per scenario as JSON.
+
+Seed the database first (``python -m benchmarks.seed --reset``), start the
+server without reload and with INFO logging sampled down, then run from the
+backend directory:
+
+    uvicorn app.main:app --workers 1 --log-level warning &
+    python -m benchmarks.load_test --concurrency 16 --duration 20 --output baseline.json
+    python -m benchmarks.compare baseline.json current.json
+
+Login runs at its own, lower concurrency and request cap because bcrypt
+dominates it by design.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from benchmarks.seed import BENCH_EMAIL_DOMAIN, BENCH_PASSWORD
+
+API_PREFIX = "/api/v1"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: Dict[str, int], elapsed: float) -> Dict:
+    values = sorted(latencies)
+    error_count = sum(errors.values())
+    return {
+        "requests": len(values) + error_count,
+        "errors": error_count,
+        "error_statuses": errors,
+        "throughput_rps": round(len(values) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(sum(values) / len(values) * 1000, 2) if values else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+    }
+
+
+class Scenario:
+
+    def __init__(self, name: str, method: str, path: Callable[[random.Random], str], body: Optional[Callable] = None,
+                 authenticated: bool = True):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.body = body
+        self.authenticated = authenticated
+
+
+def run_scenario(base_url: str, scenario: Scenario, tokens: List[str], concurrency: int,
+                 duration: float, max_requests: Optional[int], seed: int) -> Dict:
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    issued = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(worker_id: int) -> None:
+        nonlocal issued
+        rng = random.Random(seed + worker_id)
+        session = requests.Session()
+        local: List[float] = []
+        local_errors: Dict[str, int] = {}
+        while time.perf_counter() < deadline:
+            if max_requests is not None:
+                with lock:
+                    if issued >= max_requests:
+                        break
+                    issued += 1
+            headers = {}
+            if scenario.authenticated:
+                headers["Authorization"] = f"Bearer {rng.choice(tokens)}"
+            body = scenario.body(rng) if scenario.body else None
+            start = time.perf_counter()
+            try:
+                response = session.request(scenario.method, base_url + scenario.path(rng), json=body,
+                                           headers=headers, timeout=30)
+                outcome = None if response.status_code < 400 else str(response.status_code)
+            except requests.RequestException as e:
+                outcome = type(e).__name__
+            if outcome is None:
+                local.append(time.perf_counter() - start)
+            else:
+                local_errors[outcome] = local_errors.get(outcome, 0) + 1
+        with lock:
+            latencies.extend(local)
+            for outcome, count in local_errors.items():
+                errors[outcome] = errors.get(outcome, 0) + count
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+def login(base_url: str, email: str) -> str:
+    response = requests.post(f"{base_url}{API_PREFIX}/auth/login",
+                             json={"email": email, "password": BENCH_PASSWORD}, timeout=30)
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+def fetch_order_ids(base_url: str, token: str, count: int) -> List[str]:
+    response = requests.get(f"{base_url}{API_PREFIX}/orders/", params={"limit": count},
+                            headers={"Authorization": f"Bearer {token}"}, timeout=30)
+    response.raise_for_status()
+    return [order["id"] for order in response.json()]
+
+
+def git_metadata() -> Dict[str, Optional[str]]:
+    def git(*args: str) -> Optional[str]:
+        try:
+            return subprocess.check_output(["git", *args], stderr=subprocess.DEVNULL, text=True).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "branch": git("rev-parse", "--abbrev-ref", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+def build_scenarios(order_ids: List[str], user_count: int) -> List[Scenario]:
+    countries = ["US", "CA", "GB", "DE", "FR"]
+    return [
+        Scenario("orders.list", "GET",
+                 lambda rng: f"{API_PREFIX}/orders/?limit=20&skip={rng.randrange(0, 200, 20)}"),
+        Scenario("orders.list_by_country", "GET",
+                 lambda rng: f"{API_PREFIX}/orders/?limit=20&destination_country={rng.choice(countries)}"),
+        Scenario("orders.detail", "GET", lambda rng: f"{API_PREFIX}/orders/{rng.choice(order_ids)}"),
+        Scenario("offers.stats", "GET", lambda rng: f"{API_PREFIX}/offers/stats"),
+        Scenario("notifications.unread_count", "GET", lambda rng: f"{API_PREFIX}/notifications/unread-count"),
+        Scenario("auth.login", "POST", lambda rng: f"{API_PREFIX}/auth/login",
+                 body=lambda rng: {"email": f"user{rng.randrange(user_count)}@{BENCH_EMAIL_DOMAIN}",
+                                   "password": BENCH_PASSWORD},
+                 authenticated=False),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds per scenario")
+    parser.add_argument("--login-requests", type=int, default=200, help="request cap for auth.login")
+    parser.add_argument("--login-concurrency", type=int, default=4, help="concurrency for auth.login")
+    parser.add_argument("--users", type=int, default=50, help="seeded users to log in as")
+    parser.add_argument("--scenario", action="append", help="only run these scenarios (repeatable)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON baseline here instead of stdout")
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    tokens = [login(base_url, f"user{i}@{BENCH_EMAIL_DOMAIN}") for i in range(args.users)]
+    order_ids = fetch_order_ids(base_url, tokens[0], 100)
+    if not order_ids:
+        sys.exit("No orders returned; run python -m benchmarks.seed first")
+
+    results = {}
+    for scenario in build_scenarios(order_ids, args.users):
+        if args.scenario and scenario.name not in args.scenario:
+            continue
+        if scenario.name == "auth.login":
+            concurrency, max_requests = args.login_concurrency, args.login_requests
+        else:
+            concurrency, max_requests = args.concurrency, None
+        result = run_scenario(base_url, scenario, tokens, concurrency, args.duration, max_requests, args.seed)
+        results[scenario.name] = result
+        print(
+            f"{scenario.name:<28} {result['throughput_rps']:>8.1f} req/s  p50 {result['p50_ms']:>7.2f}ms  "
+            f"p95 {result['p95_ms']:>7.2f}ms  p99 {result['p99_ms']:>7.2f}ms  errors {result['errors']}",
+            file=sys.stderr
+        )
+
+    baseline = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git": git_metadata(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "base_url": base_url,
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "login_requests": args.login_requests,
+            "login_concurrency": args.login_concurrency,
+            "users": args.users,
+        },
+        "scenarios": results,
+    }
+    payload = json.dumps(baseline, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
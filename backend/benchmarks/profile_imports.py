@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Worker boot time: importing ``app.main`` and building the app with ``create_app()``.
+
+Every run is a fresh interpreter, the way a new worker or an autoscaled pod
+starts. Reports the median import and ``create_app()`` times, the whole
+process (interpreter start-up through exit) and, from ``python -X importtime``,
+the packages that account for most of the import. Exits non-zero when the
+median boot (import plus ``create_app()``) is over ``--target-ms``, so it can
+gate CI. No database: the engine is created on first use, not at boot.
+
+Run from the backend directory:
+
+    python -m benchmarks.profile_imports [--runs 7] [--top 15] [--target-ms 2400]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from benchmarks.asgi import configure_bench_env
+
+configure_bench_env(DEBUG="false", SCHEDULER_ENABLED="false")
+
+# Modules that create_app() must not pull in; they load on first use
+LAZY_MODULES = ("passlib", "requests", "bs4", "lxml", "psycopg2")
+
+BOOT = """
+import sys, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+app.main.create_app()
+built = time.perf_counter()
+loaded = [name for name in {lazy!r} if name in sys.modules]
+print(imported - started, built - imported, ",".join(loaded))
+"""
+
+
+def boot_once() -> Tuple[float, float, float, List[str]]:
+    """Import and create_app() seconds, process wall seconds, eagerly loaded lazy modules"""
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", BOOT.format(lazy=LAZY_MODULES)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    wall = time.perf_counter() - started
+    import_s, build_s, loaded = output.split("\n")[-2].split(" ")
+    return float(import_s), float(build_s), wall, [name for name in loaded.split(",") if name]
+
+
+def import_profile() -> Dict[str, int]:
+    """Self import time in microseconds per top-level package"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main; app.main.create_app()"],
+        check=True, capture_output=True, text=True
+    ).stderr
+    totals: Dict[str, int] = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        totals[name.strip().split(".")[0]] += int(self_us)
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--target-ms", type=float, default=2400)
+    args = parser.parse_args()
+
+    boot_once()  # warm the filesystem cache and bytecode
+    runs = [boot_once() for _ in range(args.runs)]
+    import_ms = statistics.median(run[0] for run in runs) * 1000
+    build_ms = statistics.median(run[1] for run in runs) * 1000
+    boot_ms = statistics.median(run[0] + run[1] for run in runs) * 1000
+    wall_ms = statistics.median(run[2] for run in runs) * 1000
+
+    totals = import_profile()
+    total_us = sum(totals.values())
+    print(f"Slowest packages to import (self time, {total_us / 1000:,.0f} ms in all)")
+    for name, micros in sorted(totals.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {name:<24} {micros / 1000:>8,.1f} ms {micros / total_us:>6.1%}")
+    print()
+
+    print(f"Boot, median of {args.runs} fresh interpreters")
+    print(f"  {'import app.main':<24} {import_ms:>8,.0f} ms")
+    print(f"  {'create_app()':<24} {build_ms:>8,.0f} ms")
+    print(f"  {'boot':<24} {boot_ms:>8,.0f} ms  (target {args.target_ms:,.0f} ms)")
+    print(f"  {'whole process':<24} {wall_ms:>8,.0f} ms")
+
+    failed = False
+    loaded = sorted({name for run in runs for name in run[3]})
+    if loaded:
+        print(f"\nLoaded at boot but meant to be lazy: {', '.join(loaded)}")
+        failed = True
+    if boot_ms > args.target_ms:
+        print(f"\nBoot is over the {args.target_ms:,.0f} ms target")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
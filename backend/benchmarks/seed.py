@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Seed a local Postgres with realistic benchmark volumes.
+
+Rows are generated deterministically from --seed and streamed with COPY,
+so a full default seed (5k users, 50k orders, 100k offers, 200k
+notifications) takes seconds. The schema must already be migrated
+(``alembic upgrade head``).
+
+Run from the backend directory against the database in your settings:
+
+    python -m benchmarks.seed --reset
+    python -m benchmarks.seed --users 20000 --orders 200000 --reset
+
+Every seeded user can log in with BENCH_PASSWORD.
+"""
+import argparse
+import csv
+import io
+import json
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Iterable, List, Sequence
+
+import psycopg2
+
+BENCH_PASSWORD = "benchmark-password"
+BENCH_EMAIL_DOMAIN = "bench.example.com"
+
+COUNTRIES = [
+    ("US", "United States", "USD"), ("CA", "Canada", "CAD"), ("GB", "United Kingdom", "GBP"),
+    ("DE", "Germany", "EUR"), ("FR", "France", "EUR"), ("IT", "Italy", "EUR"),
+    ("ES", "Spain", "EUR"), ("NL", "Netherlands", "EUR"), ("TR", "Turkey", "TRY"),
+    ("AE", "United Arab Emirates", "AED"), ("IR", "Iran", "IRR"), ("IN", "India", "INR"),
+    ("JP", "Japan", "JPY"), ("KR", "South Korea", "KRW"), ("AU", "Australia", "AUD"),
+    ("BR", "Brazil", "BRL"), ("MX", "Mexico", "MXN"), ("SE", "Sweden", "SEK"),
+    ("CH", "Switzerland", "CHF"), ("SG", "Singapore", "SGD"),
+]
+# Skewed so a handful of destinations hold most orders, like production
+COUNTRY_WEIGHTS = [30, 12, 10, 8, 6, 4, 4, 3, 3, 3, 3, 3, 2, 2, 2, 1, 1, 1, 1, 1]
+CITIES_PER_COUNTRY = 25
+
+FIRST_NAMES = ["Sara", "Ali", "Maryam", "John", "Emma", "Reza", "Olivia", "Noah", "Leila", "Omid",
+               "Ava", "Liam", "Nika", "Arman", "Mia", "Kian", "Zoe", "Darius", "Elena", "Sam"]
+LAST_NAMES = ["Ahmadi", "Smith", "Karimi", "Johnson", "Rezaei", "Brown", "Hosseini", "Garcia",
+              "Moradi", "Miller", "Jafari", "Davis", "Rahimi", "Wilson", "Sadeghi", "Moore"]
+PRODUCTS = ["AirPods Pro", "Apple Watch Series 9", "PlayStation 5 Slim", "MacBook Air 13",
+            "Stanley Quencher Tumbler", "Puma Softride Running Shoes", "Jack Link's Beef Jerky",
+            "Multivitamin Gummies", "Renpho Massage Gun", "Kindle Paperwhite", "Nintendo Switch OLED",
+            "Dyson Airwrap", "Bose QuietComfort Headphones", "iPad Air", "GoPro HERO12"]
+
+ORDER_STATUSES = ["active", "matched", "purchased", "in_transit", "delivered", "completed", "cancelled"]
+ORDER_STATUS_WEIGHTS = [70, 8, 5, 5, 4, 6, 2]
+OFFER_STATUSES = ["active", "withdrawn", "accepted", "rejected", "expired"]
+OFFER_STATUS_WEIGHTS = [60, 10, 8, 12, 10]
+NOTIFICATION_TYPES = ["offer_received", "offer_accepted", "offer_declined", "order_matched", "system"]
+
+NOTIFICATION_MAX_AGE_DAYS = 120
+
+TRUNCATE_TABLES = ["notification_counters", "notifications", "offers", "order_status_history", "orders", "users", "cities", "countries"]
+
+
+def make_uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def copy_rows(cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence], chunk_size: int = 50000) -> int:
+    """Stream rows into ``table`` with COPY ... FORMAT csv in chunks"""
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    total = 0
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    pending = 0
+
+    def flush():
+        buffer.seek(0)
+        cursor.copy_expert(sql, buffer)
+        buffer.seek(0)
+        buffer.truncate()
+
+    for row in rows:
+        writer.writerow(["\\N" if value is None else value for value in row])
+        pending += 1
+        if pending >= chunk_size:
+            flush()
+            total += pending
+            pending = 0
+    if pending:
+        flush()
+        total += pending
+    return total
+
+
+def password_hash() -> str:
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto").hash(BENCH_PASSWORD)
+
+
+def seed(conn, args) -> None:
+    rng = random.Random(args.seed)
+    now = datetime.now(timezone.utc)
+    today = date.today()
+    cursor = conn.cursor()
+
+    def timed(label: str, fn: Callable[[], int]) -> None:
+        start = time.perf_counter()
+        count = fn()
+        print(f"{label:<16} {count:>9,} rows  {time.perf_counter() - start:6.2f}s")
+
+    if args.reset:
+        cursor.execute(f"TRUNCATE {', '.join(TRUNCATE_TABLES)} CASCADE")
+
+    timed("countries", lambda: copy_rows(
+        cursor, "countries", ["code", "name", "currency", "enabled"],
+        ((code, name, currency, True) for code, name, currency in COUNTRIES)
+    ))
+
+    cities = {code: [make_uuid(rng) for _ in range(CITIES_PER_COUNTRY)] for code, _, _ in COUNTRIES}
+    timed("cities", lambda: copy_rows(
+        cursor, "cities", ["id", "name", "country_code", "enabled"],
+        ((city_id, f"{code} City {i}", code, True)
+         for code, ids in cities.items() for i, city_id in enumerate(ids))
+    ))
+
+    user_ids = [make_uuid(rng) for _ in range(args.users)]
+    hashed = password_hash()
+
+    def user_rows():
+        for i, user_id in enumerate(user_ids):
+            created = now - timedelta(days=rng.randint(1, 720))
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            yield (
+                user_id, f"user{i}@{BENCH_EMAIL_DOMAIN}", hashed, "both", "active",
+                first, last, f"{first} {last[0]}.", rng.choice(COUNTRIES)[0],
+                True, rng.random() < 0.4, rng.random() < 0.6, rng.random() < 0.5,
+                "en", "USD", round(rng.uniform(3, 5), 2), rng.randint(0, 40),
+                round(rng.uniform(3, 5), 2), rng.randint(0, 40), 0, 0, created, created
+            )
+
+    timed("users", lambda: copy_rows(
+        cursor, "users",
+        ["id", "email", "password_hash", "role", "status", "first_name", "last_name", "display_name",
+         "primary_country", "email_verified", "phone_verified", "identity_verified", "payment_verified",
+         "preferred_language", "preferred_currency", "shopper_rating", "shopper_review_count",
+         "traveler_rating", "traveler_review_count", "total_orders_as_shopper",
+         "total_orders_as_traveler", "created_at", "updated_at"],
+        user_rows()
+    ))
+
+    country_codes = [code for code, _, _ in COUNTRIES]
+    orders: List[tuple] = []
+
+    def order_rows():
+        for _ in range(args.orders):
+            order_id = make_uuid(rng)
+            shopper_id = rng.choice(user_ids)
+            country = rng.choices(country_codes, COUNTRY_WEIGHTS)[0]
+            status = rng.choices(ORDER_STATUSES, ORDER_STATUS_WEIGHTS)[0]
+            traveler_id = rng.choice(user_ids) if status not in ("active", "cancelled") else None
+            if traveler_id == shopper_id:
+                traveler_id = None
+                status = "active"
+            created = now - timedelta(minutes=rng.randint(1, 180 * 24 * 60))
+            reward = round(rng.uniform(5, 120), 2)
+            fee = round(min(max(reward * 0.05, 0.5), 10), 2)
+            product = rng.choice(PRODUCTS)
+            orders.append((order_id, shopper_id, status))
+            yield (
+                order_id, shopper_id, product, f"https://www.amazon.com/dp/B0{rng.randint(10**7, 10**8 - 1)}",
+                f"{product} - benchmark listing", None, round(rng.uniform(10, 1500), 2), "USD", 1,
+                country, rng.choice(cities[country]), today + timedelta(days=rng.randint(7, 120)),
+                reward, "USD", fee, round(reward + fee, 2), status,
+                "Please keep the original box" if rng.random() < 0.3 else None,
+                traveler_id, created, created
+            )
+
+    timed("orders", lambda: copy_rows(
+        cursor, "orders",
+        ["id", "shopper_id", "product_name", "product_url", "product_description", "product_image_url",
+         "product_price", "product_currency", "quantity", "destination_country", "destination_city_id",
+         "deadline_date", "reward_amount", "reward_currency", "platform_fee", "total_cost", "status",
+         "special_instructions", "matched_traveler_id", "created_at", "updated_at"],
+        order_rows()
+    ))
+
+    def offer_rows():
+        seen = set()
+        attempts = 0
+        produced = 0
+        while produced < args.offers and attempts < args.offers * 3:
+            attempts += 1
+            order_id, shopper_id, _ = rng.choice(orders)
+            traveler_id = rng.choice(user_ids)
+            if traveler_id == shopper_id or (order_id, traveler_id) in seen:
+                continue
+            seen.add((order_id, traveler_id))
+            produced += 1
+            created = now - timedelta(minutes=rng.randint(1, 90 * 24 * 60))
+            yield (
+                make_uuid(rng), order_id, traveler_id, "I can bring this on my next trip",
+                today + timedelta(days=rng.randint(5, 60)), round(rng.uniform(5, 120), 2),
+                rng.choices(OFFER_STATUSES, OFFER_STATUS_WEIGHTS)[0],
+                created + timedelta(hours=48), created, created
+            )
+
+    timed("offers", lambda: copy_rows(
+        cursor, "offers",
+        ["id", "order_id", "traveler_id", "message", "proposed_delivery_date", "proposed_reward_amount",
+         "status", "expires_at", "created_at", "updated_at"],
+        offer_rows()
+    ))
+
+    # Notifications are partitioned by month; make sure the seeded range has
+    # partitions instead of landing in the default one
+    from app.core.partitioning import add_months, month_floor, partition_name
+
+    month = month_floor((now - timedelta(days=NOTIFICATION_MAX_AGE_DAYS)).date())
+    while month <= month_floor(today):
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {partition_name('notifications', month)} PARTITION OF notifications "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+        )
+        month = add_months(month, 1)
+
+    def notification_rows():
+        for _ in range(args.notifications):
+            order_id = rng.choice(orders)[0]
+            created = now - timedelta(minutes=rng.randint(1, NOTIFICATION_MAX_AGE_DAYS * 24 * 60))
+            is_read = rng.random() < 0.7
+            yield (
+                make_uuid(rng), rng.choice(user_ids), rng.choice(NOTIFICATION_TYPES),
+                "New Offer Received!", "Someone has made an offer on your order",
+                json.dumps({"order_id": order_id}), is_read,
+                created + timedelta(hours=1) if is_read else None, created, created
+            )
+
+    timed("notifications", lambda: copy_rows(
+        cursor, "notifications",
+        ["id", "user_id", "type", "title", "message", "data", "is_read", "read_at", "created_at", "updated_at"],
+        notification_rows()
+    ))
+
+    start = time.perf_counter()
+    cursor.execute("""
+        INSERT INTO notification_counters (user_id, unread_count, updated_at)
+        SELECT user_id, count(*), now() FROM notifications WHERE is_read = false GROUP BY user_id
+        ON CONFLICT (user_id) DO UPDATE SET unread_count = EXCLUDED.unread_count, updated_at = now()
+    """)
+    print(f"{'counters':<16} {cursor.rowcount:>9,} rows  {time.perf_counter() - start:6.2f}s")
+
+    conn.commit()
+
+    start = time.perf_counter()
+    conn.autocommit = True
+    cursor.execute("ANALYZE")
+    print(f"{'analyze':<16} {'':>14}  {time.perf_counter() - start:6.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="defaults to settings.DATABASE_URL")
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--orders", type=int, default=50000)
+    parser.add_argument("--offers", type=int, default=100000)
+    parser.add_argument("--notifications", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="truncate seeded tables first")
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not database_url:
+        from app.core.config import settings
+
+        database_url = settings.DATABASE_URL
+
+    conn = psycopg2.connect(database_url)
+    try:
+        seed(conn, args)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
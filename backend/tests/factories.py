@@ -0,0 +1,77 @@
+"""Rows for tests, committed so the app's own sessions see them"""
+import itertools
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict
+
+from sqlalchemy.orm import Session
+
+from app.models.location import Country
+from app.models.offer import Offer, OfferStatus
+from app.models.order import Order, OrderStatus
+from app.models.user import User, UserStatus
+from app.services.auth_service import AuthService
+
+_sequence = itertools.count(1)
+
+
+def auth_headers(user: User) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {AuthService.create_access_token({'sub': str(user.id)})}"}
+
+
+def make_country(db: Session, code: str = "US") -> Country:
+    country = db.get(Country, code)
+    if country is None:
+        country = Country(code=code, name=f"Country {code}", currency="USD", enabled=True)
+        db.add(country)
+        db.commit()
+    return country
+
+
+def make_user(db: Session, **overrides) -> User:
+    n = next(_sequence)
+    user = User(**{
+        "email": f"user{n}@test.example.com",
+        # Hashing is slow and no test logs in with a password
+        "password_hash": "not-a-bcrypt-hash",
+        "first_name": "Test",
+        "last_name": f"User{n}",
+        "status": UserStatus.ACTIVE,
+        **overrides
+    })
+    db.add(user)
+    db.commit()
+    return user
+
+
+def make_order(db: Session, shopper: User, **overrides) -> Order:
+    make_country(db, overrides.get("destination_country", "US"))
+    n = next(_sequence)
+    order = Order(**{
+        "shopper_id": shopper.id,
+        "product_name": f"Product {n}",
+        "product_url": f"https://www.amazon.com/dp/B0{n:08d}",
+        "product_price": Decimal("100.00"),
+        "destination_country": "US",
+        "deadline_date": date.today() + timedelta(days=30),
+        "reward_amount": Decimal("20.00"),
+        "total_cost": Decimal("120.00"),
+        "status": OrderStatus.ACTIVE,
+        **overrides
+    })
+    db.add(order)
+    db.commit()
+    return order
+
+
+def make_offer(db: Session, order: Order, traveler: User, **overrides) -> Offer:
+    offer = Offer(**{
+        "order_id": order.id,
+        "traveler_id": traveler.id,
+        "message": "I'm flying next week",
+        "status": OfferStatus.ACTIVE,
+        **overrides
+    })
+    db.add(offer)
+    db.commit()
+    return offer
@@ -0,0 +1,20 @@
+import string
+
+from app.core.metrics import cache_requests_total
+from tests.factories import make_country
+
+
+def test_cached_path_records_compression_cache_hits_and_misses(client, db):
+    # Enough countries to clear COMPRESSION_MINIMUM_SIZE
+    for first in "XY":
+        for letter in string.ascii_uppercase:
+            make_country(db, f"{first}{letter}")
+    hits, misses = cache_requests_total.value("compression", "hit"), cache_requests_total.value("compression", "miss")
+
+    for _ in range(2):
+        response = client.get("/api/v1/locations/countries", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+
+    assert cache_requests_total.value("compression", "miss") == misses + 1
+    assert cache_requests_total.value("compression", "hit") == hits + 1
@@ -0,0 +1,30 @@
+import pytest
+
+from app.services.content_filter import ContentFilter, DEFAULT_PATTERNS, DEFAULT_PHRASES, REDACTION
+
+content_filter = ContentFilter(DEFAULT_PATTERNS, DEFAULT_PHRASES)
+
+
+@pytest.mark.parametrize("text", [
+    "call me on 555-123-4567",
+    "(555) 123 4567",
+    "+44 7700 900123",
+    "+447700900123",
+    "my number is +971 (55) 123-4567, text anytime",
+    "five five five one two three four five six seven",
+])
+def test_phone_numbers_are_redacted(text):
+    result = content_filter.scan(text)
+    assert [violation.rule for violation in result.violations] == ["phone"]
+    assert REDACTION in result.text
+
+
+@pytest.mark.parametrize("text", [
+    "order #123456789 arrived",
+    "order 123456789 arrived",
+    "order #123 456 789 arrived",
+    "tracking 1Z999AA10123456784",
+    "landing on the 14th around 6pm, the price is 120 USD",
+])
+def test_other_numbers_are_kept(text):
+    assert content_filter.scan(text).clean
@@ -0,0 +1,114 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.database import SessionLocal
+from app.models.conversation import Conversation, Message
+from app.models.order import OrderStatus
+from app.models.payment import PaymentStatus, Transaction, TransactionType
+from app.repositories.conversation_repository import ConversationRepository
+from app.schemas.conversation import MessageCreate
+from app.services.message_service import MessageService
+from tests.factories import auth_headers, make_order, make_user
+
+
+def _matched_order(db):
+    shopper, traveler = make_user(db), make_user(db)
+    order = make_order(db, shopper, matched_traveler_id=traveler.id, status=OrderStatus.MATCHED)
+    return order, shopper, traveler
+
+
+def _capture_payment(db, order):
+    db.add(Transaction(
+        order_id=order.id,
+        user_id=order.shopper_id,
+        transaction_type=TransactionType.ORDER_PAYMENT,
+        amount=order.total_cost,
+        provider="local",
+        status=PaymentStatus.CAPTURED
+    ))
+    db.commit()
+
+
+def test_conversation_stays_locked_until_the_order_is_paid(client, db):
+    order, shopper, traveler = _matched_order(db)
+    open_url = f"/api/v1/conversations/orders/{order.id}"
+
+    response = client.post(open_url, headers=auth_headers(traveler))
+    assert response.status_code == 200
+    assert response.json()["is_unlocked"] is False
+    send_url = f"/api/v1/conversations/{response.json()['id']}/messages"
+
+    response = client.post(send_url, json={"content": "Hi"}, headers=auth_headers(traveler))
+    assert response.status_code == 400
+
+    _capture_payment(db, order)
+
+    response = client.post(send_url, json={"content": "Hi"}, headers=auth_headers(traveler))
+    assert response.status_code == 201
+    response = client.post(open_url, headers=auth_headers(shopper))
+    assert response.json()["is_unlocked"] is True
+
+
+def test_conversation_opened_after_payment_is_unlocked(client, db):
+    order, shopper, _ = _matched_order(db)
+    _capture_payment(db, order)
+
+    response = client.post(f"/api/v1/conversations/orders/{order.id}", headers=auth_headers(shopper))
+
+    assert response.status_code == 200
+    assert response.json()["is_unlocked"] is True
+
+
+def test_deleted_conversation_is_not_reopened(client, db):
+    order, shopper, traveler = _matched_order(db)
+    db.add(Conversation(
+        order_id=order.id,
+        shopper_id=shopper.id,
+        traveler_id=traveler.id,
+        deleted_at=order.created_at
+    ))
+    db.commit()
+
+    response = client.post(f"/api/v1/conversations/orders/{order.id}", headers=auth_headers(shopper))
+
+    assert response.status_code == 400
+
+
+def _mark_read(conversation_id, user_id):
+    db = SessionLocal()
+    try:
+        return MessageService(db).mark_read(conversation_id, user_id)
+    finally:
+        db.close()
+
+
+def test_read_receipt_never_skips_a_message_being_sent(db):
+    order, shopper, traveler = _matched_order(db)
+    conversation = Conversation(
+        order_id=order.id, shopper_id=shopper.id, traveler_id=traveler.id, is_unlocked=True
+    )
+    db.add(conversation)
+    db.commit()
+    first = MessageService(db).send_message(conversation.id, traveler.id, MessageCreate(content="Landed"))
+    assert first.created_at.tzinfo is not None
+
+    # A send stamped but not yet committed
+    sender = SessionLocal()
+    try:
+        sent_at = ConversationRepository(sender).touch_last_message(conversation.id)
+        sender.add(Message(
+            conversation_id=conversation.id, sender_id=traveler.id, content="On my way", created_at=sent_at
+        ))
+        sender.flush()
+
+        with ThreadPoolExecutor(1) as pool:
+            receipt = pool.submit(_mark_read, conversation.id, shopper.id)
+            time.sleep(0.5)
+            assert not receipt.done()
+            sender.commit()
+            receipt = receipt.result(timeout=10)
+    finally:
+        sender.close()
+
+    assert receipt.marked == 2
+    assert receipt.read_up_to == sent_at
@@ -0,0 +1,104 @@
+import logging
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.api.deps import get_stream_user_id
+from app.core.config import settings
+from app.core.logging import RedactAccessLogFilter
+from app.core.query_stats import assert_max_queries
+from app.models.notification import NotificationType
+from app.services.auth_service import AuthService
+from app.services.notification_service import NotificationService, maintain_notification_partitions
+from tests.factories import auth_headers, make_user
+
+
+def _budget(method: str, route: str) -> int:
+    return settings.DB_QUERY_BUDGETS[f"{method} /api/v1/notifications{route}"]
+
+
+@pytest.fixture
+def notification(db):
+    user = make_user(db)
+    return NotificationService(db).create_notification(
+        user.id, NotificationType.SYSTEM, "Welcome", "Hello"
+    )
+
+
+def test_get_notification_within_budget(client, notification):
+    url, headers = f"/api/v1/notifications/{notification.id}", auth_headers(notification.user)
+
+    with assert_max_queries(_budget("GET", "/{notification_id}")):
+        response = client.get(url, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["id"] == str(notification.id)
+
+
+def test_mark_notification_read_within_budget(client, db, notification):
+    user_id = notification.user_id
+    url, headers = f"/api/v1/notifications/{notification.id}/read", auth_headers(notification.user)
+
+    with assert_max_queries(_budget("PUT", "/{notification_id}/read")):
+        response = client.put(url, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["is_read"] is True
+    assert NotificationService(db).get_unread_count(user_id) == 0
+
+
+def test_delete_notification_within_budget(client, db, notification):
+    notification_id, user_id = notification.id, notification.user_id
+    url, headers = f"/api/v1/notifications/{notification_id}", auth_headers(notification.user)
+
+    with assert_max_queries(_budget("DELETE", "/{notification_id}")):
+        response = client.delete(url, headers=headers)
+
+    assert response.status_code == 204
+    assert NotificationService(db).get_notification(notification_id, user_id) is None
+
+
+def test_stream_ticket_opens_the_stream_only(client, db):
+    user = make_user(db)
+    response = client.post("/api/v1/notifications/stream-ticket", headers=auth_headers(user))
+    assert response.status_code == 200
+    ticket = response.json()["ticket"]
+
+    assert get_stream_user_id(ticket=ticket, credentials=None) == user.id
+    # Not an access token
+    response = client.get("/api/v1/notifications/", headers={"Authorization": f"Bearer {ticket}"})
+    assert response.status_code == 401
+
+
+def test_stream_rejects_access_token_in_url():
+    token = AuthService.create_access_token({"sub": "00000000-0000-0000-0000-000000000001"})
+    with pytest.raises(HTTPException) as exc_info:
+        get_stream_user_id(ticket=token, credentials=None)
+    assert exc_info.value.status_code == 401
+
+
+def test_access_log_redacts_ticket():
+    record = logging.LogRecord(
+        "uvicorn.access", logging.INFO, __file__, 0, '%s - "%s %s HTTP/%s" %d',
+        ("127.0.0.1:5000", "GET", "/api/v1/notifications/stream?ticket=secret", "1.1", 200), None
+    )
+    RedactAccessLogFilter().filter(record)
+    assert "secret" not in record.getMessage()
+    assert "ticket=REDACTED" in record.getMessage()
+
+
+def test_partition_maintenance_releases_its_lock_after_a_failure(db, monkeypatch):
+    def fail(self, retention_days):
+        self.db.execute(text("SELECT 1 / 0"))
+
+    monkeypatch.setattr(NotificationService, "drop_expired_partitions", fail)
+    with pytest.raises(DBAPIError):
+        maintain_notification_partitions()
+
+    held = db.execute(text(
+        "SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' AND objid = "
+        "hashtext('maintain_notification_partitions')::oid"
+    )).scalar()
+    assert held == 0
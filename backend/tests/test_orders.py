@@ -0,0 +1,21 @@
+from app.core.query_stats import assert_max_queries
+from tests.factories import make_order, make_user
+
+
+def test_order_feed_returns_only_the_requested_fields(client, db):
+    for _ in range(3):
+        make_order(db, make_user(db))
+
+    with assert_max_queries(1):
+        response = client.get("/api/v1/orders/?fields=product_name,reward_amount")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert all(set(order) == {"id", "product_name", "reward_amount"} for order in response.json())
+
+
+def test_order_feed_rejects_fields_that_are_not_columns(client, db):
+    response = client.get("/api/v1/orders/?fields=id,shopper")
+
+    assert response.status_code == 400
+    assert "shopper" in response.json()["detail"]
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import func, text
+
+from app.core.database import SessionLocal
+from app.models.outbox import OutboxEvent
+from app.services import outbox_service
+from app.services.outbox_service import OutboxDispatcher, OutboxService
+
+TOPIC = "test.event"
+
+
+@pytest.fixture
+def handled():
+    """Registers a handler for TOPIC that fails with a database error on
+    payloads marked bad; returns the good payloads it applied"""
+    applied = []
+
+    def handler(db, events):
+        for event in events:
+            if event.payload.get("bad"):
+                db.execute(text("SELECT 1 / 0"))
+        applied.extend(event.payload["n"] for event in events)
+
+    outbox_service.register_handler(TOPIC, handler)
+    yield applied
+    outbox_service._handlers.pop(TOPIC, None)
+
+
+def test_failed_batch_is_retried_event_by_event(db, handled):
+    outbox = OutboxService(db)
+    for n in range(3):
+        outbox.enqueue(TOPIC, {"n": n, "bad": n == 1})
+    db.commit()
+
+    assert OutboxDispatcher(SessionLocal).dispatch_batch() == 3
+
+    assert handled == [0, 2]
+    failed = db.query(OutboxEvent).one()
+    assert failed.payload["n"] == 1
+    assert failed.attempts == 1
+    assert "DivisionByZero" in failed.last_error
+    assert failed.available_at > db.query(func.now()).scalar()
+
+
+def test_events_are_stamped_by_the_database(db):
+    event = OutboxService(db).enqueue(TOPIC, {})
+    db.commit()
+
+    assert event.created_at.tzinfo is not None
+    assert event.created_at == event.available_at
@@ -0,0 +1,142 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.payments import LocalPaymentProvider
+from app.models.order import OrderStatus
+from app.models.payment import EscrowHolding, PaymentStatus, Transaction, TransactionType
+from app.models.user import UserRole
+from app.services.ledger_service import LedgerService
+from tests.factories import auth_headers, make_order, make_user
+
+
+@pytest.fixture
+def allow_local_payouts(monkeypatch):
+    monkeypatch.setattr(settings, "PAYOUT_ALLOW_LOCAL_PROVIDER", True)
+
+
+def _holding(db, traveler, payout="20.00"):
+    """Escrow for a delivered order, releasable to ``traveler``"""
+    shopper = make_user(db)
+    order = make_order(db, shopper, matched_traveler_id=traveler.id, status=OrderStatus.DELIVERED)
+    payment = Transaction(
+        order_id=order.id,
+        user_id=shopper.id,
+        transaction_type=TransactionType.ORDER_PAYMENT,
+        amount=order.total_cost,
+        provider="local",
+        status=PaymentStatus.CAPTURED
+    )
+    db.add(payment)
+    db.flush()
+    holding = EscrowHolding(
+        order_id=order.id,
+        transaction_id=payment.id,
+        total_amount=order.total_cost,
+        platform_fee=Decimal("0.00"),
+        traveler_payout=Decimal(payout)
+    )
+    db.add(holding)
+    db.commit()
+    return holding
+
+
+def _payout_transactions(db):
+    db.expire_all()
+    return db.query(Transaction).filter(Transaction.transaction_type == TransactionType.TRAVELER_PAYOUT).all()
+
+
+def test_dry_run_reports_without_paying(client, db):
+    traveler = make_user(db)
+    _holding(db, traveler, "20.00")
+    _holding(db, traveler, "5.50")
+    headers = auth_headers(make_user(db, role=UserRole.ADMIN))
+
+    response = client.post("/api/v1/payouts/run", headers=headers)
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["dry_run"] is True
+    assert [(p["traveler_id"], p["holdings"]) for p in report["payouts"]] == [(str(traveler.id), 2)]
+    assert Decimal(report["totals"]["USD"]) == Decimal("25.50")
+    assert report["paid"] == {}
+    assert _payout_transactions(db) == []
+    assert db.query(EscrowHolding).filter(EscrowHolding.is_released.is_(True)).count() == 0
+
+
+def test_real_run_is_refused_with_the_local_provider(client, db):
+    _holding(db, make_user(db))
+    headers = auth_headers(make_user(db, role=UserRole.ADMIN))
+
+    response = client.post("/api/v1/payouts/run?dry_run=false", headers=headers)
+
+    assert response.status_code == 400
+    assert _payout_transactions(db) == []
+
+
+def test_declined_payout_puts_holdings_back_and_retry_reuses_the_key(db, allow_local_payouts):
+    traveler = make_user(db)
+    holding = _holding(db, traveler)
+    provider = LocalPaymentProvider(failing_user_ids=[traveler.id])
+
+    declined, = LedgerService(db, provider).run_payouts().payouts
+
+    assert declined.status == PaymentStatus.FAILED
+    db.refresh(holding)
+    assert not holding.is_released and holding.release_transaction_id is None
+    failed, = _payout_transactions(db)
+    assert failed.status == PaymentStatus.FAILED
+
+    provider.failing_user_ids.clear()
+    paid, = LedgerService(db, provider).run_payouts().payouts
+
+    assert paid.status == PaymentStatus.CAPTURED
+    assert paid.idempotency_key == declined.idempotency_key
+    assert paid.transaction_id == declined.transaction_id
+    captured, = _payout_transactions(db)
+    assert captured.status == PaymentStatus.CAPTURED
+    db.refresh(holding)
+    assert holding.is_released and holding.release_transaction_id == captured.id
+
+
+def test_pending_payout_of_a_crashed_run_is_settled_once(db, allow_local_payouts):
+    traveler = make_user(db)
+    _holding(db, traveler)
+    provider = LocalPaymentProvider()
+    ledger_service = LedgerService(db, provider)
+
+    # Crash after the provider paid but before the outcome was stored
+    pending, = ledger_service._release([traveler.id])
+    first = provider.payout(traveler.id, pending.amount, pending.currency, pending.idempotency_key)
+    db.execute(
+        text("UPDATE transactions SET updated_at = now() - interval '1 hour' WHERE id = :id"),
+        {"id": pending.transaction_id}
+    )
+    db.commit()
+
+    report = LedgerService(db, provider).run_payouts()
+
+    assert report.payouts == []
+    retried, = report.retried
+    assert retried.status == PaymentStatus.CAPTURED
+    assert retried.idempotency_key == pending.idempotency_key
+    assert len(provider.payouts) == 1
+    transaction, = _payout_transactions(db)
+    assert transaction.status == PaymentStatus.CAPTURED
+    assert transaction.provider_transaction_id == first.provider_transaction_id
+
+
+def test_second_run_pays_nothing(db, allow_local_payouts):
+    traveler = make_user(db)
+    _holding(db, traveler)
+    provider = LocalPaymentProvider()
+
+    first = LedgerService(db, provider).run_payouts()
+    second = LedgerService(db, provider).run_payouts()
+
+    assert [payout.status for payout in first.payouts] == [PaymentStatus.CAPTURED]
+    assert second.payouts == [] and second.retried == []
+    assert len(provider.payouts) == 1
+    assert len(_payout_transactions(db)) == 1
@@ -0,0 +1,59 @@
+"""Query budgets for the endpoints that used to issue a query per row.
+
+Each case runs the request under ``assert_max_queries``: a fixed number of
+statements however many rows are involved, and no statement repeated per
+row. The counts include the auth lookup; anything the test itself needs
+(ids, auth headers) is read before the block.
+"""
+from app.core.query_stats import assert_max_queries, track_queries
+from app.models.offer import OfferStatus
+from tests.factories import auth_headers, make_offer, make_order, make_user
+
+ROWS = 8
+
+
+def test_list_orders_does_not_query_per_order(client, db):
+    headers = auth_headers(make_user(db))
+    for _ in range(ROWS):
+        make_order(db, make_user(db))
+
+    with assert_max_queries(3, n_plus_one_threshold=3):
+        response = client.get("/api/v1/orders/", headers=headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == ROWS
+    assert all(order["shopper"] for order in response.json())
+
+
+def test_get_order_offers_does_not_query_per_offer(client, db):
+    shopper = make_user(db)
+    order = make_order(db, shopper)
+    for _ in range(ROWS):
+        make_offer(db, order, make_user(db))
+    url, headers = f"/api/v1/offers/{order.id}/offers", auth_headers(shopper)
+
+    with assert_max_queries(3, n_plus_one_threshold=3):
+        response = client.get(url, headers=headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == ROWS
+
+
+def test_accept_offer_cost_does_not_grow_with_competing_offers(client, db):
+    counts = []
+    for competing in (1, ROWS):
+        shopper = make_user(db)
+        order = make_order(db, shopper)
+        accepted = make_offer(db, order, make_user(db))
+        for _ in range(competing):
+            make_offer(db, order, make_user(db))
+        url, headers = f"/api/v1/offers/{accepted.id}/accept", auth_headers(shopper)
+
+        with track_queries() as stats:
+            response = client.post(url, headers=headers)
+
+        assert response.status_code == 200, response.text
+        assert response.json()["status"] == OfferStatus.ACCEPTED.value
+        counts.append(stats.count)
+
+    assert counts[0] == counts[1], f"{counts[0]} queries with 1 competing offer, {counts[1]} with {ROWS}"
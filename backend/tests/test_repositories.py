@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from app.repositories.user_repository import UserRepository
+from tests.factories import auth_headers, make_user
+
+
+def test_update_returning_reads_updated_at_back_from_the_database(client, db):
+    user = make_user(db)
+    before = user.updated_at
+
+    response = client.patch("/api/v1/users/me", json={"first_name": "Renamed"}, headers=auth_headers(user))
+
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "Renamed"
+    updated_at = datetime.fromisoformat(response.json()["updated_at"])
+    assert updated_at.tzinfo is not None
+    assert updated_at > before
+
+
+def test_update_returning_refreshes_an_instance_already_in_the_session(db):
+    user = make_user(db)
+    user_repo = UserRepository(db)
+
+    updated = user_repo.update_returning(user.id, first_name="Renamed")
+
+    assert updated is user
+    assert user.first_name == "Renamed"
+    assert user.updated_at.tzinfo is not None
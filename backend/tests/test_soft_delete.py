@@ -0,0 +1,100 @@
+"""Soft delete: the partial indexes on live rows, and batched soft deletes.
+
+The plan tests capture the statement a repository method actually runs and
+EXPLAIN it with sequential and bitmap scans disabled, so a test fails when
+the query no longer matches its index: a column order that doesn't fit, or
+a filter that doesn't imply ``deleted_at IS NULL``.
+"""
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+from sqlalchemy import event, text
+
+from app.models.order import Order
+from app.repositories.offer_repository import OfferRepository
+from app.repositories.order_repository import OrderRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.order import OrderFilter
+from app.services.order_service import OrderService
+from tests.factories import make_order, make_user
+
+INDEX_SCANS = ("Index Scan", "Index Only Scan")
+
+
+@contextmanager
+def _captured_selects(db) -> Iterator[List[Tuple[str, Any]]]:
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+
+def _plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _index_scans(db, call) -> Dict[str, str]:
+    """Index name -> scan type for the last SELECT ``call`` runs"""
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    db.execute(text("SET LOCAL enable_bitmapscan = off"))
+    with _captured_selects(db) as statements:
+        call()
+    statement, parameters = statements[-1]
+    plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+    return {
+        node["Index Name"]: node["Node Type"]
+        for node in _plan_nodes(plan[0]["Plan"])
+        if node["Node Type"] in INDEX_SCANS
+    }
+
+
+@pytest.mark.parametrize("filters, index", [
+    (OrderFilter(), "ix_orders_status_created_at"),
+    (OrderFilter(destination_country="US"), "ix_orders_destination_country_status_created_at"),
+])
+def test_order_search_uses_live_index(db, filters, index):
+    user = make_user(db)
+    scans = _index_scans(db, lambda: OrderService(db).search_orders(filters, exclude_user_id=user.id))
+    assert index in scans
+
+
+def test_user_orders_use_live_index(db):
+    user = make_user(db)
+    scans = _index_scans(db, lambda: OrderRepository(db).get_user_orders(user.id))
+    assert "ix_orders_shopper_id_created_at" in scans
+
+
+def test_traveler_offers_use_live_index(db):
+    user = make_user(db)
+    scans = _index_scans(db, lambda: OfferRepository(db).get_traveler_offers(user.id))
+    assert "ix_offers_traveler_id_status" in scans
+
+
+def test_phone_lookup_uses_live_index(db):
+    scans = _index_scans(db, lambda: UserRepository(db).get_by_phone("+15550100"))
+    assert "ix_users_phone" in scans
+
+
+def test_soft_delete_many_returns_only_the_rows_it_deleted(db):
+    shopper = make_user(db)
+    orders = [make_order(db, shopper) for _ in range(5)]
+    ids = [order.id for order in orders]
+    order_repo = OrderRepository(db)
+    assert order_repo.soft_delete(ids[0])
+
+    deleted = order_repo.soft_delete_many(ids, chunk_size=2)
+
+    assert sorted(deleted) == sorted(ids[1:])
+    assert order_repo.soft_delete_many(ids) == []
+    assert db.query(Order).filter(Order.id.in_(ids), Order.deleted_at.is_(None)).count() == 0
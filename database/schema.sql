@@ -57,8 +57,10 @@ CREATE TABLE users (
     
     -- Ratings and stats
     shopper_rating DECIMAL(3,2) DEFAULT 0.00,
+    shopper_rating_sum INTEGER NOT NULL DEFAULT 0,
     shopper_review_count INTEGER DEFAULT 0,
     traveler_rating DECIMAL(3,2) DEFAULT 0.00,
+    traveler_rating_sum INTEGER NOT NULL DEFAULT 0,
     traveler_review_count INTEGER DEFAULT 0,
     total_orders_as_shopper INTEGER DEFAULT 0,
     total_orders_as_traveler INTEGER DEFAULT 0,
@@ -667,47 +669,10 @@ CREATE TRIGGER audit_users AFTER INSERT OR UPDATE OR DELETE ON users FOR EACH RO
 CREATE TRIGGER audit_orders AFTER INSERT OR UPDATE OR DELETE ON orders FOR EACH ROW EXECUTE FUNCTION create_audit_log();
 CREATE TRIGGER audit_transactions AFTER INSERT OR UPDATE OR DELETE ON transactions FOR EACH ROW EXECUTE FUNCTION create_audit_log();
 
--- Function to update user ratings when reviews are added/updated
-CREATE OR REPLACE FUNCTION update_user_ratings()
-RETURNS TRIGGER AS $$
-DECLARE
-    avg_rating DECIMAL(3,2);
-    review_count INTEGER;
-BEGIN
-    -- Calculate new rating for the reviewee
-    SELECT 
-        ROUND(AVG(rating), 2),
-        COUNT(*)
-    INTO avg_rating, review_count
-    FROM reviews 
-    WHERE reviewee_id = NEW.reviewee_id 
-    AND deleted_at IS NULL 
-    AND is_public = TRUE;
-    
-    -- Update user ratings based on their role in the review
-    IF NEW.reviewer_role = 'shopper' THEN
-        -- Shopper reviewing traveler
-        UPDATE users 
-        SET 
-            traveler_rating = COALESCE(avg_rating, 0),
-            traveler_review_count = review_count,
-            updated_at = CURRENT_TIMESTAMP
-        WHERE id = NEW.reviewee_id;
-    ELSE
-        -- Traveler reviewing shopper
-        UPDATE users 
-        SET 
-            shopper_rating = COALESCE(avg_rating, 0),
-            shopper_review_count = review_count,
-            updated_at = CURRENT_TIMESTAMP
-        WHERE id = NEW.reviewee_id;
-    END IF;
-    
-    RETURN NEW;
-END;
-$$ language 'plpgsql';
-
-CREATE TRIGGER update_ratings_on_review AFTER INSERT OR UPDATE ON reviews FOR EACH ROW EXECUTE FUNCTION update_user_ratings();
+-- User rating aggregates (*_rating_sum, *_review_count, *_rating) are kept
+-- by the application with a single atomic UPDATE per review, and rebuilt
+-- from this table by the recompute_user_ratings job. A trigger recounting
+-- the reviews here would double-apply every change.
 
 -- =============================================================================
 -- INITIAL DATA